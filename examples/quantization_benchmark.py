@@ -0,0 +1,62 @@
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from neuredge_sdk.vector import LocalIndex, QuantizedEngine
+
+def make_corpus(n, dimension, clusters=256, seed=0):
+    """Clustered unit vectors, closer to real embeddings than pure noise"""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dimension)).astype(np.float32)
+    vectors = centers[rng.integers(clusters, size=n)]
+    vectors += 0.35 * rng.standard_normal((n, dimension)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    queries = vectors[rng.choice(n, 200, replace=False)]
+    queries = queries + 0.1 * rng.standard_normal(queries.shape).astype(np.float32)
+    return vectors, queries
+
+def build(name, vectors, engine=None, storage_path=None):
+    index = LocalIndex(name, vectors.shape[1], 'cosine', engine, storage_path=storage_path)
+    ids = [str(i) for i in range(len(vectors))]
+    for start in range(0, len(vectors), 10000):
+        index.add(ids[start:start + 10000], vectors[start:start + 10000])
+    return index
+
+def recall_at_k(truth, found, k=10):
+    return np.mean([len(set(t[:k]) & set(f[:k])) / k for t, f in zip(truth, found)])
+
+def timed_search(index, queries, k=10):
+    index.search(queries[:1], k)  # Train lazily before timing
+    start = time.perf_counter()
+    _, ids = index.search(queries, k)
+    return ids, (time.perf_counter() - start) * 1000 / len(queries)
+
+def main(n=100000, dimension=256):
+    vectors, queries = make_corpus(n, dimension)
+    exact = build('exact', vectors)
+    truth, exact_ms = timed_search(exact, queries)
+
+    print(f"{n} vectors, {dimension} dimensions, float32 size {vectors.nbytes / 1e6:.1f} MB")
+    print(f"{'engine':<28}{'recall@10':>10}{'ms/query':>10}{'hot MB':>10}")
+    print(f"{'brute force':<28}{1.0:>10.3f}{exact_ms:>10.2f}{vectors.nbytes / 1e6:>10.1f}")
+
+    setups = [
+        ('int8, no rerank', dict(quantizer='int8', rerank=0)),
+        ('int8, rerank 4x', dict(quantizer='int8', rerank=4)),
+        ('pq 32, no rerank', dict(quantizer='pq', n_subvectors=32, rerank=0)),
+        ('pq 32, rerank 10x', dict(quantizer='pq', n_subvectors=32, rerank=10)),
+        ('pq 64, rerank 10x', dict(quantizer='pq', n_subvectors=64, rerank=10)),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, options in setups:
+            engine = QuantizedEngine(**options)
+            # Full-precision vectors live on disk; only the codes stay in memory
+            index = build(label, vectors, engine, os.path.join(tmp, f"{len(os.listdir(tmp))}.f32"))
+            found, ms = timed_search(index, queries)
+            print(f"{label:<28}{recall_at_k(truth, found):>10.3f}{ms:>10.2f}{engine.memory_bytes() / 1e6:>10.1f}")
+            del index
+
+if __name__ == '__main__':
+    main()
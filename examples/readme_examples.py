@@ -84,12 +84,9 @@ def test_vector_store(client):
             "name": index_name,
             "dimension": dimension,
             "metric": "cosine"
-        })
+        }, wait=True)
         print("Index created")
 
-        # Wait for index to be ready
-        time.sleep(2)
-
         # Verify index exists
         index = client.vector.get_index(index_name)
         if not index:
@@ -1,6 +1,10 @@
 from typing import Optional
 from .client import NeuredgeClient
+from .async_client import AsyncNeuredgeClient
 from .types import NeuredgeError
+from .retry import RetryPolicy
+from .ratelimit import RateLimiter
+from .cache import CacheBackend, MemoryCache, SQLiteCache, EmbeddingCache
 
 class Neuredge:
     """
@@ -31,13 +35,35 @@ class Neuredge:
         api_key: str,
         base_url: str = "https://api.neuredge.dev",
         max_retries: int = 3,
-        retry_delay: float = 1.0
+        retry_delay: float = 1.0,
+        retry_policy: Optional[RetryPolicy] = None,
+        max_connections: int = 100,
+        max_connections_per_host: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        connect_timeout: Optional[float] = 10.0,
+        read_timeout: Optional[float] = 60.0,
+        timeout: Optional[float] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[CacheBackend] = None,
+        embedding_cache: Optional[EmbeddingCache] = None
     ):
         self._client = NeuredgeClient(
             api_key=api_key,
             base_url=base_url,
             max_retries=max_retries,
-            retry_delay=retry_delay
+            retry_delay=retry_delay,
+            retry_policy=retry_policy,
+            max_connections=max_connections,
+            max_connections_per_host=max_connections_per_host,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            timeout=timeout,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            embedding_cache=embedding_cache
         )
         
         # Core capabilities
@@ -48,6 +74,10 @@ class Neuredge:
         # OpenAI-compatible endpoints
         self.openai = self._client.openai
 
+    def pool_stats(self):
+        """Get connection pool usage counters"""
+        return self._client.pool_stats()
+
     def close(self):
         """Close the client and cleanup resources"""
         self._client.close()
@@ -60,4 +90,89 @@ class Neuredge:
         """Context manager exit"""
         self.close()
 
-__all__ = ["Neuredge", "NeuredgeError"]
+class AsyncNeuredge:
+    """
+    Asyncio variant of Neuredge sharing one pooled aiohttp session
+    
+    Example:
+        ```python
+        from neuredge_sdk import AsyncNeuredge
+        
+        async with AsyncNeuredge(api_key="your-api-key") as client:
+            summary = await client.text.summarize("...")
+            completion = await client.openai.chat.create(
+                messages=[{"role": "user", "content": "Hello!"}]
+            )
+        ```
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.neuredge.dev",
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        retry_policy: Optional[RetryPolicy] = None,
+        max_connections: int = 100,
+        max_connections_per_host: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        connect_timeout: Optional[float] = 10.0,
+        read_timeout: Optional[float] = 60.0,
+        timeout: Optional[float] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[CacheBackend] = None,
+        embedding_cache: Optional[EmbeddingCache] = None
+    ):
+        self._client = AsyncNeuredgeClient(
+            api_key=api_key,
+            base_url=base_url,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            retry_policy=retry_policy,
+            max_connections=max_connections,
+            max_connections_per_host=max_connections_per_host,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            timeout=timeout,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            embedding_cache=embedding_cache
+        )
+
+        # Core capabilities
+        self.text = self._client.text
+        self.image = self._client.image
+        self.vector = self._client.vector
+
+        # OpenAI-compatible endpoints
+        self.openai = self._client.openai
+
+    def pool_stats(self):
+        """Get connection pool usage counters"""
+        return self._client.pool_stats()
+
+    async def close(self):
+        """Close the client and cleanup resources"""
+        await self._client.close()
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.close()
+
+__all__ = [
+    "Neuredge",
+    "AsyncNeuredge",
+    "NeuredgeError",
+    "RetryPolicy",
+    "RateLimiter",
+    "MemoryCache",
+    "SQLiteCache",
+    "EmbeddingCache",
+]
@@ -0,0 +1,118 @@
+from typing import Any, List, Sequence, Union
+from array import array
+import base64
+import sys
+
+from .types import NeuredgeError
+
+def require_numpy() -> Any:
+    """
+    Import numpy, which is only needed for array-returning features
+
+    Returns:
+        The numpy module
+
+    Raises:
+        NeuredgeError: If numpy is not installed
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise NeuredgeError(
+            'numpy is required for array results; install neuredge-sdk[numpy]',
+            'INVALID_REQUEST',
+            400
+        )
+    return numpy
+
+def is_array(value: Any) -> bool:
+    """Whether a value is a numpy array, without importing numpy"""
+    return type(value).__module__ == 'numpy' and hasattr(value, 'dtype')
+
+def pack_float32(vector: Any) -> bytes:
+    """
+    Pack a vector as little-endian float32
+
+    Args:
+        vector: Float sequence, numpy array or raw float32 buffer
+
+    Returns:
+        The packed bytes
+    """
+    if isinstance(vector, (bytes, bytearray, memoryview)):
+        return bytes(vector)
+    if is_array(vector):
+        return vector.astype('<f4', copy=False).tobytes()
+    packed = array('f', vector)
+    if sys.byteorder != 'little':
+        packed.byteswap()
+    return packed.tobytes()
+
+def unpack_float32(blob: Union[bytes, bytearray, memoryview]) -> List[float]:
+    """
+    Unpack little-endian float32 bytes into Python floats
+
+    Args:
+        blob: Packed vector
+
+    Returns:
+        The vector as a list
+    """
+    unpacked = array('f')
+    unpacked.frombytes(blob)
+    if sys.byteorder != 'little':
+        unpacked.byteswap()
+    return unpacked.tolist()
+
+def encode_float32(vector: Any) -> str:
+    """
+    Encode a vector as base64 little-endian float32
+
+    Args:
+        vector: Float sequence, numpy array or raw float32 buffer
+
+    Returns:
+        The base64 string
+    """
+    return base64.b64encode(pack_float32(vector)).decode('ascii')
+
+def decode_float32(value: Union[str, bytes, Sequence[float]]) -> Any:
+    """
+    View a vector as a float32 array
+
+    Args:
+        value: Base64 string or raw bytes of little-endian float32s, or a
+            sequence of floats
+
+    Returns:
+        A 1-d float32 array; for bytes input this is a view, not a copy
+    """
+    np = require_numpy()
+    if isinstance(value, str):
+        value = base64.b64decode(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return np.frombuffer(value, dtype='<f4')
+    return np.asarray(value, dtype=np.float32)
+
+def stack_float32(vectors: List[Union[str, bytes, Sequence[float]]]) -> Any:
+    """
+    Decode vectors into one contiguous (n, dim) float32 array
+
+    Each vector is decoded straight into its row of a preallocated buffer,
+    so no per-element Python floats are created for encoded input.
+
+    Args:
+        vectors: Vectors in any form accepted by decode_float32
+
+    Returns:
+        A C-contiguous float32 array with one row per vector
+    """
+    np = require_numpy()
+    if not vectors:
+        return np.empty((0, 0), dtype=np.float32)
+    first = decode_float32(vectors[0])
+    out = np.empty((len(vectors), first.shape[0]), dtype=np.float32)
+    out[0] = first
+    for row, vector in enumerate(vectors[1:], start=1):
+        out[row] = decode_float32(vector)
+    return out
@@ -0,0 +1,344 @@
+from typing import Optional, Dict, Any, Callable, AsyncIterator, Awaitable
+import asyncio
+import json
+import time
+
+import aiohttp
+
+from .client import (
+    _error_from_response,
+    _is_binary,
+    BINARY_ACCEPT,
+    STREAM_CHUNK_SIZE,
+    _PoolMonitor,
+    _deadline_from_timeout,
+    _remaining_budget
+)
+from .types import NeuredgeError, PoolStats
+from .retry import RetryPolicy
+from .ratelimit import RateLimiter
+from .cache import CacheBackend, EmbeddingCache, make_cache_key, _off_loop
+
+class AsyncNeuredgeClient:
+    """Asyncio client for the Neuredge API backed by a pooled aiohttp session"""
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.neuredge.dev",
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        retry_policy: Optional[RetryPolicy] = None,
+        max_connections: int = 100,
+        max_connections_per_host: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        connect_timeout: Optional[float] = 10.0,
+        read_timeout: Optional[float] = 60.0,
+        timeout: Optional[float] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[CacheBackend] = None,
+        embedding_cache: Optional[EmbeddingCache] = None
+    ):
+        self._api_key = api_key
+        self._base_url = base_url.rstrip('/')
+        self._retry_policy = retry_policy or RetryPolicy(
+            max_retries=max_retries,
+            initial_delay=retry_delay
+        )
+        self._max_connections = max_connections
+        self._max_connections_per_host = max_connections_per_host
+        # pool_block is accepted for parity with NeuredgeClient; aiohttp always
+        # waits for a free connection once the connector limits are reached
+        self._keep_alive = keep_alive
+        self._connect_timeout = connect_timeout
+        self._read_timeout = read_timeout
+        self._timeout = timeout
+        self._rate_limiter = rate_limiter
+        self._cache = cache
+        self._embedding_cache = embedding_cache
+        self._pool_monitor = _PoolMonitor(max_connections, max_connections_per_host)
+        # Created lazily so the session binds to the running event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Initialize capabilities
+        from .capabilities.text import AsyncTextCapabilities
+        from .capabilities.image import AsyncImageCapabilities
+        from .capabilities.vector import AsyncVectorStoreCapabilities
+        from .openai.index import AsyncOpenAINamespace
+
+        self.text = AsyncTextCapabilities(self)
+        self.image = AsyncImageCapabilities(self)
+        self.vector = AsyncVectorStoreCapabilities(self)
+        self.openai = AsyncOpenAINamespace(self)
+
+    def get_api_key(self) -> str:
+        """Get the API key used by this client"""
+        return self._api_key
+
+    def get_base_url(self) -> str:
+        """Get the base URL used by this client"""
+        return self._base_url
+
+    def get_embedding_cache(self) -> Optional[EmbeddingCache]:
+        """Get the embedding cache used by this client, if any"""
+        return self._embedding_cache
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._max_connections,
+                    limit_per_host=self._max_connections_per_host,
+                    force_close=not self._keep_alive
+                ),
+                headers={
+                    "Authorization": f"Bearer {self._api_key}",
+                    "Content-Type": "application/json",
+                }
+            )
+        return self._session
+
+    def pool_stats(self) -> PoolStats:
+        """
+        Get connection pool usage counters
+
+        Returns:
+            Pool limits plus in-flight, peak and saturation counters
+        """
+        return self._pool_monitor.stats()
+
+    async def _handle_response(self, response: aiohttp.ClientResponse, binary_response: bool = False) -> Any:
+        """Handle API response and errors"""
+        content = await response.read()
+        if binary_response and response.ok and _is_binary(response.headers.get('Content-Type')):
+            return content
+        try:
+            json_response = json.loads(content)
+        except ValueError:
+            if response.status >= 400:
+                raise _error_from_response(response.status, None, response.headers)
+            return content
+
+        if not response.ok:
+            raise _error_from_response(response.status, json_response, response.headers)
+
+        return json_response
+
+    async def _retry_request(
+        self,
+        method: str,
+        url: str,
+        timeout: Optional[float] = None,
+        idempotent: bool = True,
+        binary_response: bool = False,
+        consume: Optional[Callable[[Optional[str], AsyncIterator[bytes]], Awaitable[Any]]] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Make a request with retries
+
+        The retry policy decides which failures are retried and for how
+        long to back off. The timeout is an overall budget: every attempt
+        and backoff sleep draws from it, and retries stop once it is spent.
+
+        With `consume`, a successful response body is streamed to it as
+        `await consume(content_type, chunks)` inside the attempt, so a
+        connection dropped mid-body is retried like any other network error.
+        """
+        policy = self._retry_policy
+        deadline = _deadline_from_timeout(timeout if timeout is not None else self._timeout)
+        last_error = None
+        limiter = self._rate_limiter
+        for attempt in range(policy.max_retries):
+            if limiter:
+                await limiter.acquire_async()
+            try:
+                # Time spent waiting on the rate limiter counts against the deadline
+                remaining = _remaining_budget(deadline)
+            except NeuredgeError:
+                if limiter:
+                    limiter.release_async()
+                raise
+            kwargs['timeout'] = aiohttp.ClientTimeout(
+                total=remaining,
+                sock_connect=self._connect_timeout,
+                sock_read=self._read_timeout
+            )
+            self._pool_monitor.acquire()
+            try:
+                session = self._get_session()
+                async with session.request(method.upper(), url, **kwargs) as response:
+                    if consume is not None and response.ok:
+                        result = await consume(
+                            response.headers.get('Content-Type'),
+                            response.content.iter_chunked(STREAM_CHUNK_SIZE)
+                        )
+                    else:
+                        result = await self._handle_response(response, binary_response)
+                    if limiter:
+                        limiter.observe(response.headers, result)
+                    return result
+            except asyncio.TimeoutError:
+                last_error = NeuredgeError(
+                    'Request timed out',
+                    'TIMEOUT',
+                    408
+                )
+            except aiohttp.ClientError as e:
+                last_error = NeuredgeError(
+                    f"Network error: {str(e)}",
+                    'NETWORK_ERROR'
+                )
+            except NeuredgeError as e:
+                if limiter:
+                    limiter.on_error(e)
+                last_error = e
+            finally:
+                self._pool_monitor.release()
+                if limiter:
+                    limiter.release_async()
+
+            if not policy.should_retry(last_error, idempotent):
+                raise last_error
+
+            # Wait before retrying, unless the backoff would outlive the deadline
+            if attempt < policy.max_retries - 1:
+                delay = policy.get_delay(attempt, last_error)
+                if deadline is not None and time.monotonic() + delay >= deadline:
+                    break
+                await asyncio.sleep(delay)
+
+        raise last_error
+
+    async def post(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        binary_response: bool = False,
+        timeout: Optional[float] = None,
+        idempotent: bool = True,
+        cacheable: bool = False
+    ) -> Any:
+        """
+        Make a POST request to the API
+
+        Args:
+            endpoint: API endpoint path
+            data: Request body data
+            binary_response: Whether to accept a raw binary body, such as
+                image bytes, in place of JSON
+            timeout: Overall time budget in seconds across all retries
+                (defaults to the client timeout)
+            idempotent: Whether the request can safely be repeated after a
+                network error or server failure; pass False for
+                requests with side effects that must not run twice
+            cacheable: Whether the response is deterministic and may be
+                served from the client's response cache
+
+        Returns:
+            Parsed response data, or bytes for a binary response
+        """
+        url = f"{self._base_url}{endpoint}"
+        cache = self._cache if cacheable else None
+        if cache is not None:
+            key = make_cache_key(url, data)
+            # Backends may do disk I/O, which must not block the event loop
+            cached = await _off_loop(cache.get, key)
+            if cached is not None:
+                return cached
+
+        response = await self._retry_request(
+            'post', url, json=data, timeout=timeout, idempotent=idempotent,
+            binary_response=binary_response,
+            headers={'Accept': BINARY_ACCEPT} if binary_response else None
+        )
+        if cache is not None and isinstance(response, dict):
+            await _off_loop(cache.set, key, response)
+        return response
+
+    async def post_stream(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        consume: Callable[[Optional[str], AsyncIterator[bytes]], Awaitable[Any]],
+        timeout: Optional[float] = None,
+        idempotent: bool = True
+    ) -> Any:
+        """
+        Make a POST request and stream the response body instead of buffering it
+
+        Args:
+            endpoint: API endpoint path
+            data: Request body data
+            consume: Coroutine function called as `consume(content_type,
+                chunks)` with the successful response's Content-Type and an
+                async iterator of body chunks; it runs once per attempt, so
+                it must start over cleanly if the request is retried
+            timeout: Overall time budget in seconds across all retries
+                (defaults to the client timeout)
+            idempotent: Whether the request can safely be repeated after a
+                network error or server failure; pass False for
+                requests with side effects that must not run twice
+
+        Returns:
+            Whatever `consume` returns
+        """
+        url = f"{self._base_url}{endpoint}"
+        return await self._retry_request(
+            'post', url, json=data, timeout=timeout, idempotent=idempotent,
+            headers={'Accept': BINARY_ACCEPT}, consume=consume
+        )
+
+    async def get(self, endpoint: str, timeout: Optional[float] = None) -> Any:
+        """
+        Make a GET request to the API
+
+        Args:
+            endpoint: API endpoint path
+            timeout: Overall time budget in seconds across all retries
+                (defaults to the client timeout)
+
+        Returns:
+            Parsed response data
+        """
+        url = f"{self._base_url}{endpoint}"
+        return await self._retry_request('get', url, timeout=timeout)
+
+    async def delete(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
+    ) -> Any:
+        """
+        Make a DELETE request to the API
+
+        Args:
+            endpoint: API endpoint path
+            data: Optional request body data
+            timeout: Overall time budget in seconds across all retries
+                (defaults to the client timeout)
+
+        Returns:
+            Parsed response data
+        """
+        url = f"{self._base_url}{endpoint}"
+        return await self._retry_request(
+            'delete', url, json=data if data else None, timeout=timeout
+        )
+
+    async def close(self):
+        """Close the aiohttp session"""
+        if self._session:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.close()
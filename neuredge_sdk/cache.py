@@ -0,0 +1,468 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Dict, Any, List, Callable, TypeVar
+from collections import OrderedDict
+import asyncio
+import functools
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+from .arrays import pack_float32, unpack_float32
+from .types import NeuredgeError
+
+EMBEDDING_CACHE_MODES = (None, 'int8')
+
+T = TypeVar('T')
+
+def _numpy() -> Any:
+    """The numpy module if it is installed, else None"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+def quantize_int8(vector: Any) -> bytes:
+    """
+    Compress a vector to one byte per dimension
+
+    The blob is a float32 minimum and step followed by one unsigned level
+    per dimension, a quarter of the float32 size for typical embeddings.
+    Uses numpy when it is installed; the result is the same either way.
+
+    Args:
+        vector: Float sequence, numpy array or raw float32 buffer
+
+    Returns:
+        The quantized blob
+    """
+    packed = pack_float32(vector)
+    np = _numpy()
+    if np is not None:
+        values = np.frombuffer(packed, dtype='<f4').astype(np.float64)
+        low = float(values.min()) if values.size else 0.0
+        step = ((float(values.max()) - low) / 255 if values.size else 0.0) or 1.0
+        levels = np.clip(np.rint((values - low) / step), 0, 255).astype(np.uint8)
+        return pack_float32([low, step]) + levels.tobytes()
+    values = unpack_float32(packed)
+    low = min(values, default=0.0)
+    step = (max(values, default=0.0) - low) / 255 or 1.0
+    levels = bytes(min(255, max(0, round((value - low) / step))) for value in values)
+    return pack_float32([low, step]) + levels
+
+def dequantize_int8(blob: bytes) -> bytes:
+    """
+    Expand an int8 blob back into packed little-endian float32
+
+    Args:
+        blob: Output of quantize_int8
+
+    Returns:
+        The approximate vector as float32 bytes
+    """
+    low, step = unpack_float32(blob[:8])
+    np = _numpy()
+    if np is not None:
+        levels = np.frombuffer(blob, dtype=np.uint8, offset=8)
+        return (low + levels * step).astype('<f4').tobytes()
+    return pack_float32([low + level * step for level in blob[8:]])
+
+async def _off_loop(func: Callable[..., T], *args: Any) -> T:
+    """
+    Run a blocking cache call on the default executor
+
+    Cache backends may hit disk (SQLite), so async callers use this to keep
+    the event loop free; every backend is safe to call from other threads.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args))
+
+def make_cache_key(url: str, payload: Any) -> str:
+    """
+    Build a cache key from a request URL and its canonicalized payload
+
+    Args:
+        url: Full request URL
+        payload: JSON request body
+
+    Returns:
+        Hex digest identifying the request
+    """
+    canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(f"{url}\n{canonical}".encode('utf-8')).hexdigest()
+
+class CacheBackend(ABC):
+    """
+    Base class for response caches
+
+    Values are stored as serialized bytes, so callers always get a fresh
+    copy and sizes can be accounted exactly.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @abstractmethod
+    def _load(self, key: str) -> Optional[bytes]:
+        """Read a live entry, or None if absent or expired"""
+        pass
+
+    @abstractmethod
+    def _store(self, key: str, value: bytes):
+        """Write an entry, evicting others as needed"""
+        pass
+
+    @abstractmethod
+    def clear(self):
+        """Remove all entries"""
+        pass
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached response
+
+        Args:
+            key: Cache key from make_cache_key
+
+        Returns:
+            The cached response, or None on a miss
+        """
+        value = self._load(key)
+        with self._lock:
+            if value is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        return json.loads(value)
+
+    def set(self, key: str, value: Any):
+        """
+        Cache a response
+
+        Args:
+            key: Cache key from make_cache_key
+            value: JSON-serializable response
+        """
+        self._store(key, json.dumps(value, separators=(',', ':')).encode('utf-8'))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Hit/miss counters for this cache
+
+        Returns:
+            Counts of hits, misses and evictions plus the hit rate
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+            }
+
+class MemoryCache(CacheBackend):
+    """In-memory LRU cache bounded by entry count and total bytes, with optional TTL"""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = 64 * 1024 * 1024,
+        ttl: Optional[float] = None
+    ):
+        """
+        Args:
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of cached responses, or None for no limit
+            ttl: Seconds an entry stays valid, or None to keep until evicted
+        """
+        super().__init__()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._bytes = 0
+
+    def _load(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _store(self, key: str, value: bytes):
+        if self._max_bytes is not None and len(value) > self._max_bytes:
+            return
+        expires_at = time.monotonic() + self._ttl if self._ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (expires_at, value)
+            self._bytes += len(value)
+            while len(self._entries) > self._max_entries or (
+                self._max_bytes is not None and self._bytes > self._max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def _remove(self, key: str):
+        """Drop an entry; caller holds the lock"""
+        _, value = self._entries.pop(key)
+        self._bytes -= len(value)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        with self._lock:
+            stats.update(entries=len(self._entries), bytes=self._bytes)
+        return stats
+
+class SQLiteCache(CacheBackend):
+    """On-disk cache in a SQLite database, shareable across processes and restarts"""
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: Optional[int] = None,
+        ttl: Optional[float] = None
+    ):
+        """
+        Args:
+            path: Database file path
+            max_entries: Maximum number of cached responses, or None for no limit
+            ttl: Seconds an entry stays valid, or None to keep until evicted
+        """
+        super().__init__()
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'key TEXT PRIMARY KEY, value BLOB NOT NULL, '
+                'expires_at REAL, accessed_at REAL NOT NULL)'
+            )
+            self._db.execute(
+                'CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)'
+            )
+
+    def _load(self, key: str) -> Optional[bytes]:
+        # Wall-clock time, since entries outlive the process
+        now = time.time()
+        with self._lock, self._db:
+            row = self._db.execute(
+                'SELECT value, expires_at FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+                return None
+            self._db.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (now, key))
+            return value
+
+    def _store(self, key: str, value: bytes):
+        now = time.time()
+        expires_at = now + self._ttl if self._ttl is not None else None
+        with self._lock, self._db:
+            self._db.execute(
+                'INSERT OR REPLACE INTO responses (key, value, expires_at, accessed_at) '
+                'VALUES (?, ?, ?, ?)',
+                (key, value, expires_at, now)
+            )
+            if self._max_entries is not None:
+                evicted = self._db.execute(
+                    'DELETE FROM responses WHERE key IN ('
+                    'SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+                    (self._max_entries,)
+                ).rowcount
+                self._evictions += max(0, evicted)
+
+    def clear(self):
+        with self._lock, self._db:
+            self._db.execute('DELETE FROM responses')
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        with self._lock:
+            stats['entries'] = self._db.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+        return stats
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._db.close()
+
+class EmbeddingCache:
+    """
+    Persistent embedding store keyed by model and content hash
+
+    Vectors are stored as packed float32 blobs in SQLite, so re-embedding a
+    mostly unchanged corpus only pays for the texts that changed.
+
+    Example:
+        ```python
+        from neuredge_sdk import Neuredge, EmbeddingCache
+
+        client = Neuredge(
+            api_key="your-api-key",
+            embedding_cache=EmbeddingCache("embeddings.db")
+        )
+        ```
+    """
+
+    # Stay below SQLite's default bound-parameter limit
+    _QUERY_BATCH = 500
+
+    def __init__(self, path: str = ':memory:', max_entries: Optional[int] = None, quantize: Optional[str] = None):
+        """
+        Args:
+            path: Database file path; the default keeps the cache in memory
+            max_entries: Maximum number of cached vectors, or None for no limit
+            quantize: 'int8' to store vectors with one byte per dimension,
+                about 4x smaller at a small loss of precision
+        """
+        if quantize not in EMBEDDING_CACHE_MODES:
+            raise NeuredgeError(f"quantize must be None or 'int8', got {quantize!r}", 'INVALID_REQUEST', 400)
+        self._max_entries = max_entries
+        self._quantize = quantize
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS embeddings ('
+                'key TEXT PRIMARY KEY, value BLOB NOT NULL, accessed_at REAL NOT NULL)'
+            )
+            self._db.execute(
+                'CREATE INDEX IF NOT EXISTS embeddings_accessed ON embeddings (accessed_at)'
+            )
+
+    def _key(self, namespace: str, text: str) -> str:
+        # Quantized entries never share keys with full-precision ones
+        if self._quantize:
+            namespace = f"{namespace}\0{self._quantize}"
+        return hashlib.sha256(f"{namespace}\0{text}".encode('utf-8')).hexdigest()
+
+    def get_blobs(self, namespace: str, texts: List[str]) -> List[Optional[bytes]]:
+        """
+        Look up packed float32 vectors
+
+        Args:
+            namespace: Model name plus any parameters that change the output
+            texts: Texts to look up
+
+        Returns:
+            One little-endian float32 blob per text, or None on a miss
+        """
+        keys = [self._key(namespace, text) for text in texts]
+        found = {}
+        now = time.time()
+        with self._lock, self._db:
+            for start in range(0, len(keys), self._QUERY_BATCH):
+                batch = keys[start:start + self._QUERY_BATCH]
+                placeholders = ','.join('?' * len(batch))
+                found.update(self._db.execute(
+                    f'SELECT key, value FROM embeddings WHERE key IN ({placeholders})',
+                    batch
+                ).fetchall())
+                self._db.execute(
+                    f'UPDATE embeddings SET accessed_at = ? WHERE key IN ({placeholders})',
+                    [now, *batch]
+                )
+            hits = sum(1 for key in keys if key in found)
+            self._hits += hits
+            self._misses += len(keys) - hits
+        if self._quantize:
+            return [dequantize_int8(found[key]) if key in found else None for key in keys]
+        return [found.get(key) for key in keys]
+
+    def get_many(self, namespace: str, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Look up vectors
+
+        Args:
+            namespace: Model name plus any parameters that change the output
+            texts: Texts to look up
+
+        Returns:
+            One vector per text, or None on a miss
+        """
+        return [
+            unpack_float32(blob) if blob is not None else None
+            for blob in self.get_blobs(namespace, texts)
+        ]
+
+    def set_many(self, namespace: str, texts: List[str], vectors: List[Any]):
+        """
+        Store vectors
+
+        Args:
+            namespace: Model name plus any parameters that change the output
+            texts: Texts that were embedded
+            vectors: Their embeddings, as float sequences or float32 arrays
+        """
+        now = time.time()
+        pack = quantize_int8 if self._quantize else pack_float32
+        rows = [
+            (self._key(namespace, text), pack(vector), now)
+            for text, vector in zip(texts, vectors)
+        ]
+        with self._lock, self._db:
+            self._db.executemany(
+                'INSERT OR REPLACE INTO embeddings (key, value, accessed_at) VALUES (?, ?, ?)',
+                rows
+            )
+            if self._max_entries is not None:
+                self._db.execute(
+                    'DELETE FROM embeddings WHERE key IN ('
+                    'SELECT key FROM embeddings ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+                    (self._max_entries,)
+                )
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Hit/miss counters for this cache
+
+        Returns:
+            Counts of hits and misses, the hit rate, the number of entries and
+            the bytes used by stored vectors
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            entries, stored_bytes = self._db.execute(
+                'SELECT COUNT(*), COALESCE(SUM(LENGTH(value)), 0) FROM embeddings'
+            ).fetchone()
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+                'entries': entries,
+                'stored_bytes': stored_bytes,
+            }
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock, self._db:
+            self._db.execute('DELETE FROM embeddings')
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._db.close()
@@ -1,9 +1,24 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic
-from ..types import ApiResponse, NeuredgeError
+from typing import (
+    TypeVar, Generic, Callable, Iterable, Iterator, List, Awaitable, Any,
+    AsyncIterable, AsyncIterator, Union, Tuple
+)
+from concurrent.futures import ThreadPoolExecutor, wait, as_completed, FIRST_COMPLETED
+from collections import deque
+import asyncio
+from ..types import ApiResponse, NeuredgeError, BatchItemResult
 
 T = TypeVar('T')
 
+def _check_concurrency(concurrency: int):
+    """Reject a concurrency limit that would start no workers"""
+    if concurrency < 1:
+        raise NeuredgeError(
+            f"concurrency must be at least 1, got {concurrency}",
+            'INVALID_REQUEST',
+            400
+        )
+
 class BaseCapability(ABC, Generic[T]):
     """Base class for all capabilities"""
     def __init__(self, client):
@@ -32,3 +47,177 @@ class BaseCapability(ABC, Generic[T]):
         if isinstance(error, NeuredgeError):
             return error
         return NeuredgeError(str(error))
+
+    def _map_concurrent(
+        self,
+        func: Callable[[Any], T],
+        items: Iterable[Any],
+        concurrency: int,
+        ordered: bool = True
+    ) -> Iterator[BatchItemResult[T]]:
+        """
+        Apply a blocking call to each item on a thread pool
+        
+        At most `concurrency` calls run at once and the input is consumed
+        lazily, so memory stays bounded by the window rather than the input.
+        Failures are captured per item instead of aborting the batch.
+        
+        Args:
+            func: Call to make for each item
+            items: Inputs, consumed lazily
+            concurrency: Maximum number of calls in flight
+            ordered: Yield in input order; otherwise yield as calls complete
+            
+        Returns:
+            Iterator of per-item results; an invalid `concurrency` raises
+            here rather than on the first `next()`
+        """
+        _check_concurrency(concurrency)
+        return self._iter_concurrent(func, items, concurrency, ordered)
+
+    def _iter_concurrent(
+        self,
+        func: Callable[[Any], T],
+        items: Iterable[Any],
+        concurrency: int,
+        ordered: bool
+    ) -> Iterator[BatchItemResult[T]]:
+        """Generator behind _map_concurrent"""
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            if ordered:
+                window = deque()
+                for index, item in enumerate(items):
+                    window.append((index, executor.submit(func, item)))
+                    if len(window) >= concurrency:
+                        yield self._collect(*window.popleft())
+                while window:
+                    yield self._collect(*window.popleft())
+                return
+
+            pending = {}
+            for index, item in enumerate(items):
+                pending[executor.submit(func, item)] = index
+                if len(pending) >= concurrency:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield self._collect(pending.pop(future), future)
+            for future in as_completed(list(pending)):
+                yield self._collect(pending.pop(future), future)
+
+    def _collect(self, index: int, future) -> BatchItemResult:
+        """Turn a finished future into a per-item result"""
+        try:
+            return {'index': index, 'result': future.result(), 'error': None}
+        except Exception as e:
+            return {'index': index, 'result': None, 'error': self._handle_error(e)}
+
+    async def _amap_concurrent(
+        self,
+        func: Callable[[Any], Awaitable[T]],
+        items: Iterable[Any],
+        concurrency: int
+    ) -> List[BatchItemResult[T]]:
+        """
+        Await a call for each item with at most `concurrency` in flight
+        
+        Args:
+            func: Coroutine function to call for each item
+            items: Inputs, consumed lazily by the workers
+            concurrency: Maximum number of calls in flight
+            
+        Returns:
+            Per-item results in input order
+        """
+        _check_concurrency(concurrency)
+        results = {}
+        inputs = enumerate(items)
+
+        async def worker():
+            for index, item in inputs:
+                try:
+                    results[index] = {'index': index, 'result': await func(item), 'error': None}
+                except Exception as e:
+                    results[index] = {'index': index, 'result': None, 'error': self._handle_error(e)}
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return [results[index] for index in range(len(results))]
+
+    def _astream_concurrent(
+        self,
+        func: Callable[[Any], Awaitable[T]],
+        items: Union[Iterable[Any], AsyncIterable[Any]],
+        concurrency: int,
+        ordered: bool = True
+    ) -> AsyncIterator[BatchItemResult[T]]:
+        """
+        Await a call for each item, yielding results with a bounded window
+        
+        Args:
+            func: Coroutine function to call for each item
+            items: Inputs (sync or async iterable), consumed lazily
+            concurrency: Maximum number of calls in flight
+            ordered: Yield in input order; otherwise yield as calls complete
+            
+        Returns:
+            Async iterator of per-item results; an invalid `concurrency`
+            raises here rather than on the first iteration
+        """
+        _check_concurrency(concurrency)
+        return self._aiter_concurrent(func, items, concurrency, ordered)
+
+    async def _aiter_concurrent(
+        self,
+        func: Callable[[Any], Awaitable[T]],
+        items: Union[Iterable[Any], AsyncIterable[Any]],
+        concurrency: int,
+        ordered: bool
+    ) -> AsyncIterator[BatchItemResult[T]]:
+        """Async generator behind _astream_concurrent"""
+        async def run(index: int, item: Any) -> BatchItemResult[T]:
+            try:
+                return {'index': index, 'result': await func(item), 'error': None}
+            except Exception as e:
+                return {'index': index, 'result': None, 'error': self._handle_error(e)}
+
+        window = deque()
+        pending = set()
+        try:
+            index = 0
+            async for item in _aiterate(items):
+                task = asyncio.ensure_future(run(index, item))
+                index += 1
+                if ordered:
+                    window.append(task)
+                    if len(window) >= concurrency:
+                        yield await window.popleft()
+                else:
+                    pending.add(task)
+                    if len(pending) >= concurrency:
+                        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        for finished in done:
+                            yield finished.result()
+            while window:
+                yield await window.popleft()
+            for finished in asyncio.as_completed(pending):
+                yield await finished
+            pending = set()
+        finally:
+            # Don't leave requests running if the consumer stops early
+            for task in list(window) + list(pending):
+                task.cancel()
+
+async def _aiterate(items: Union[Iterable[Any], AsyncIterable[Any]]) -> AsyncIterator[Any]:
+    """Iterate a sync or async iterable asynchronously"""
+    if hasattr(items, '__aiter__'):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+async def _anumbered(items: Union[Iterable[Any], AsyncIterable[Any]]) -> AsyncIterator[Tuple[int, Any]]:
+    """Async counterpart of enumerate, for sync or async iterables"""
+    number = 0
+    async for item in _aiterate(items):
+        yield number, item
+        number += 1
@@ -1,7 +1,196 @@
-from typing import Optional, Dict, Any, List, Union
-from ..types import ImageGenerationOptions
-from .base import BaseCapability
+from typing import (
+    Optional, Dict, Any, List, Union, BinaryIO, Callable, Iterable, Iterator,
+    AsyncIterable, AsyncIterator, Tuple
+)
+from ..types import ImageGenerationOptions, NeuredgeError, BatchItemResult
+from ..client import _is_binary
+from ..cache import _off_loop
+from .base import BaseCapability, _anumbered, _check_concurrency
 import base64
+import binascii
+import os
+
+# Where generate_to writes: a file path, or a binary file object
+Destination = Union[str, os.PathLike, BinaryIO]
+
+# File name pattern for generate_many outputs, formatted with the prompt's index
+DEFAULT_FILENAME = '{index}.png'
+
+# Marks the image list in a JSON generation response
+_IMAGES_KEY = b'"images"'
+
+# JSON escapes that may appear inside a base64 string
+_JSON_ESCAPES = ((b'\\/', b'/'), (b'\\n', b''), (b'\\r', b''))
+
+class _ImageStreamDecoder:
+    """
+    Pulls the first image out of a generation response as it streams in
+
+    A JSON body is scanned for the first string in its "images" list, any
+    data URL prefix is skipped, and the base64 text is decoded in whole
+    4-character groups, so no more than a chunk of it is held at a time.
+    A raw image body is passed through as is.
+    """
+
+    def __init__(self, write: Callable[[bytes], Any], raw: bool = False):
+        """
+        Args:
+            write: Receives the decoded image bytes
+            raw: Whether the body is the image itself rather than JSON
+        """
+        self._write = write
+        self._state = 'raw' if raw else 'key'
+        self._buffer = b''
+        self._pending = b''
+        self._written = 0
+
+    @property
+    def complete(self) -> bool:
+        """Whether a whole image has been decoded"""
+        return self._state == 'done' or (self._state == 'raw' and self._written > 0)
+
+    def _emit(self, data: bytes):
+        if data:
+            self._write(data)
+            self._written += len(data)
+
+    def feed(self, chunk: bytes):
+        """Process the next chunk of the response body"""
+        if self._state == 'raw':
+            self._emit(chunk)
+            return
+        if self._state == 'done':
+            return
+        data = self._buffer + chunk
+        self._buffer = b''
+
+        if self._state == 'key':
+            start = data.find(_IMAGES_KEY)
+            if start < 0:
+                # Keep enough of the tail to match a key split across chunks
+                self._buffer = data[-(len(_IMAGES_KEY) - 1):]
+                return
+            data = data[start + len(_IMAGES_KEY):]
+            self._state = 'value'
+
+        if self._state == 'value':
+            start = data.find(b'"')
+            if data[:start if start >= 0 else len(data)].strip(b' \t\r\n:['):
+                # Not followed by a list of strings: "images" was some other
+                # string, or the list is empty, so keep looking
+                self._state = 'key'
+                self.feed(data)
+                return
+            if start < 0:
+                return
+            data = data[start + 1:]
+            self._state = 'prefix'
+
+        if self._state == 'prefix':
+            if len(data) < 5 and b'data:'.startswith(data):
+                self._buffer = data
+                return
+            if data.startswith(b'data:'):
+                # A data URL; the base64 text starts after its first comma
+                comma = data.find(b',')
+                if comma < 0:
+                    self._buffer = data
+                    return
+                data = data[comma + 1:]
+            self._state = 'data'
+
+        end = data.find(b'"')
+        if end >= 0:
+            data = data[:end]
+            self._state = 'done'
+        elif data.endswith(b'\\'):
+            # An escape split across chunks
+            self._buffer = data[-1:]
+            data = data[:-1]
+        for escape, replacement in _JSON_ESCAPES:
+            data = data.replace(escape, replacement)
+
+        text = self._pending + data
+        if self._state == 'done':
+            text += b'=' * (-len(text) % 4)
+            usable = len(text)
+        else:
+            usable = len(text) - len(text) % 4
+        self._pending = text[usable:]
+        try:
+            self._emit(base64.b64decode(text[:usable], validate=True))
+        except binascii.Error:
+            raise NeuredgeError('Image data is not valid base64', 'INVALID_RESPONSE', 500)
+
+class _StreamDestination:
+    """
+    Receives a streamed image for generate_to
+
+    A path is written through a temporary file that replaces it only once
+    the image is complete. A file object is written in place; if it is
+    seekable, a retried request rewinds it to where it started.
+    """
+
+    def __init__(self, target: Destination):
+        if isinstance(target, (str, os.PathLike)):
+            self._path = os.fspath(target)
+            self._file = open(self._path + '.part', 'wb')
+            self._start = 0
+        else:
+            self._path = None
+            self._file = target
+            self._start = _tell(target)
+        self.written = 0
+
+    def write(self, data: bytes):
+        self._file.write(data)
+        self.written += len(data)
+
+    def restart(self):
+        """Discard what an earlier attempt wrote"""
+        if not self.written:
+            return
+        if self._start is None:
+            raise NeuredgeError(
+                'Image stream was interrupted after writing to a destination that cannot be rewound',
+                'INVALID_REQUEST',
+                400
+            )
+        self._file.seek(self._start)
+        self._file.truncate()
+        self.written = 0
+
+    def commit(self) -> int:
+        """Finish the image and return its size in bytes"""
+        if self._path is not None:
+            self._file.close()
+            os.replace(self._path + '.part', self._path)
+        elif hasattr(self._file, 'flush'):
+            self._file.flush()
+        return self.written
+
+    def abort(self):
+        """Give up, leaving a path destination untouched"""
+        if self._path is not None:
+            self._file.close()
+            os.remove(self._path + '.part')
+
+def _tell(fileobj: Any) -> Optional[int]:
+    """Current position of a seekable file object, or None"""
+    try:
+        if fileobj.seekable():
+            return fileobj.tell()
+    except (AttributeError, OSError):
+        pass
+    return None
+
+def _start_stream(destination: _StreamDestination, content_type: Optional[str]) -> _ImageStreamDecoder:
+    """Prepare a destination for a (possibly retried) response body"""
+    destination.restart()
+    return _ImageStreamDecoder(destination.write, raw=_is_binary(content_type))
+
+def _no_image() -> NeuredgeError:
+    return NeuredgeError('Image generation response held no image', 'INVALID_RESPONSE', 500)
 
 class ImageCapabilities(BaseCapability):
     """Image generation capabilities"""
@@ -39,10 +228,101 @@ class ImageCapabilities(BaseCapability):
                 "prompt": prompt,
                 **(options or {})
             },
-            binary_response=True  # Add flag for binary response
+            binary_response=True,  # Accept raw image bytes as well as JSON
+            idempotent=True
         )
         return self._convert_to_bytes(response)
 
+    def generate_to(self, prompt: str, destination: Destination, options: Optional[Dict] = None) -> int:
+        """
+        Generate an image and stream it straight into a file
+
+        The response is decoded as it arrives, so the image is never held
+        in memory, whole or base64-encoded.
+
+        Args:
+            prompt: Text prompt
+            destination: File path, or a binary file object open for writing
+            options: Generation options, as for generate
+
+        Returns:
+            Number of image bytes written
+
+        Raises:
+            NeuredgeError: If generation fails or the response holds no
+                image; a path destination is then left untouched
+        """
+        sink = _StreamDestination(destination)
+
+        def consume(content_type: Optional[str], chunks: Iterable[bytes]) -> bool:
+            decoder = _start_stream(sink, content_type)
+            for chunk in chunks:
+                decoder.feed(chunk)
+            return decoder.complete
+
+        try:
+            complete = self._client.post_stream(
+                f"{self.base_path}/generate",
+                {
+                    "prompt": prompt,
+                    **(options or {})
+                },
+                consume,
+                idempotent=True
+            )
+            if not complete:
+                raise _no_image()
+        except BaseException:
+            sink.abort()
+            raise
+        return sink.commit()
+
+    def generate_many(
+        self,
+        prompts: Iterable[str],
+        options: Optional[Dict] = None,
+        concurrency: int = 4,
+        output_dir: Optional[str] = None,
+        filename: str = DEFAULT_FILENAME,
+        ordered: bool = False
+    ) -> Iterator[BatchItemResult[Union[bytes, str]]]:
+        """
+        Generate images for many prompts in parallel
+
+        Prompts are pulled lazily as request slots free up, and requests go
+        through the client's rate limiter and retry policy like any other.
+        With `output_dir`, each image is streamed to its own file as it
+        arrives, so memory stays flat however many prompts there are.
+
+        Args:
+            prompts: Text prompts, consumed lazily
+            options: Generation options shared by all prompts
+            concurrency: Maximum number of requests in flight
+            output_dir: Directory to write images to, created if missing;
+                without it, results carry the image bytes
+            filename: File name pattern, formatted with the prompt's `index`
+            ordered: Yield results in input order; by default they are
+                yielded as they complete, matched to inputs by `index`
+
+        Yields:
+            One result per prompt, holding the image bytes or the path
+            written; failed prompts carry an error instead
+        """
+        _check_concurrency(concurrency)
+        if output_dir is None:
+            return self._map_concurrent(
+                lambda prompt: self.generate(prompt, options), prompts, concurrency, ordered
+            )
+        os.makedirs(output_dir, exist_ok=True)
+
+        def run(item: Tuple[int, str]) -> str:
+            index, prompt = item
+            path = os.path.join(output_dir, filename.format(index=index))
+            self.generate_to(prompt, path, options)
+            return path
+
+        return self._map_concurrent(run, enumerate(prompts), concurrency, ordered)
+
     def generate_fast(self, prompt: str, options: Optional[Dict] = None) -> bytes:
         """Quick generation, returns bytes"""
         return self.generate(prompt, {
@@ -56,3 +336,117 @@ class ImageCapabilities(BaseCapability):
             **(options or {}),
             "mode": "standard"
         })
+
+class AsyncImageCapabilities(ImageCapabilities):
+    """Async variant of ImageCapabilities"""
+
+    async def generate(self, prompt: str, options: Optional[Dict] = None) -> bytes:
+        """Generate image and return as bytes (like JS Blob)"""
+        response = await self._client.post(
+            f"{self.base_path}/generate",
+            {
+                "prompt": prompt,
+                **(options or {})
+            },
+            binary_response=True,
+            idempotent=True
+        )
+        return self._convert_to_bytes(response)
+
+    async def generate_to(self, prompt: str, destination: Destination, options: Optional[Dict] = None) -> int:
+        """
+        Generate an image and stream it straight into a file
+
+        Args:
+            prompt: Text prompt
+            destination: File path, or a binary file object open for writing
+            options: Generation options, as for generate
+
+        Returns:
+            Number of image bytes written
+        """
+        # File I/O runs on the default executor; each chunk is decoded on the
+        # loop and its image bytes are written in one call off it
+        sink = await _off_loop(_StreamDestination, destination)
+
+        async def consume(content_type: Optional[str], chunks: Any) -> bool:
+            await _off_loop(sink.restart)
+            decoded: List[bytes] = []
+            decoder = _ImageStreamDecoder(decoded.append, raw=_is_binary(content_type))
+            async for chunk in chunks:
+                decoder.feed(chunk)
+                if decoded:
+                    data = b''.join(decoded)
+                    decoded.clear()
+                    await _off_loop(sink.write, data)
+            return decoder.complete
+
+        try:
+            complete = await self._client.post_stream(
+                f"{self.base_path}/generate",
+                {
+                    "prompt": prompt,
+                    **(options or {})
+                },
+                consume,
+                idempotent=True
+            )
+            if not complete:
+                raise _no_image()
+        except BaseException:
+            await _off_loop(sink.abort)
+            raise
+        return await _off_loop(sink.commit)
+
+    def generate_many(
+        self,
+        prompts: Union[Iterable[str], AsyncIterable[str]],
+        options: Optional[Dict] = None,
+        concurrency: int = 4,
+        output_dir: Optional[str] = None,
+        filename: str = DEFAULT_FILENAME,
+        ordered: bool = False
+    ) -> AsyncIterator[BatchItemResult[Union[bytes, str]]]:
+        """
+        Generate images for many prompts in parallel
+
+        Args:
+            prompts: Text prompts, as a sync or async iterable
+            options: Generation options shared by all prompts
+            concurrency: Maximum number of requests in flight
+            output_dir: Directory to stream images to; without it, results
+                carry the image bytes
+            filename: File name pattern, formatted with the prompt's `index`
+            ordered: Yield results in input order instead of as they complete
+
+        Returns:
+            Async iterator of one result per prompt
+        """
+        _check_concurrency(concurrency)
+        if output_dir is None:
+            return self._astream_concurrent(
+                lambda prompt: self.generate(prompt, options), prompts, concurrency, ordered
+            )
+        os.makedirs(output_dir, exist_ok=True)
+
+        async def run(item: Tuple[int, str]) -> str:
+            index, prompt = item
+            path = os.path.join(output_dir, filename.format(index=index))
+            await self.generate_to(prompt, path, options)
+            return path
+
+        return self._astream_concurrent(run, _anumbered(prompts), concurrency, ordered)
+
+    async def generate_fast(self, prompt: str, options: Optional[Dict] = None) -> bytes:
+        """Quick generation, returns bytes"""
+        return await self.generate(prompt, {
+            **(options or {}),
+            "mode": "fast"
+        })
+
+    async def generate_standard(self, prompt: str, options: Optional[Dict] = None) -> bytes:
+        """Standard generation, returns bytes"""
+        return await self.generate(prompt, {
+            **(options or {}),
+            "mode": "standard"
+        })
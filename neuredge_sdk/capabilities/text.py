@@ -1,13 +1,115 @@
-from typing import Optional
+from typing import Optional, Iterable, Iterator, List, AsyncIterable, AsyncIterator, Union
+import logging
+import re
 from ..types import (
     LanguageCode,
     SentimentResult,
     ApiResponse,
     SummaryResult,
-    TranslationResult
+    TranslationResult,
+    BatchItemResult,
+    LongSummaryResult,
+    SummaryLevel
 )
 from .base import BaseCapability
 
+logger = logging.getLogger(__name__)
+
+_PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
+def _split_text(text: str, chunk_size: int) -> List[str]:
+    """
+    Split text into chunks of at most chunk_size characters
+    
+    Paragraph boundaries are preferred, then sentence boundaries; only a
+    single sentence longer than chunk_size is cut at whitespace.
+    """
+    pieces = []
+    for paragraph in _PARAGRAPH_BREAK.split(text.strip()):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if len(paragraph) <= chunk_size:
+            pieces.append(paragraph)
+            continue
+        for sentence in _SENTENCE_END.split(paragraph):
+            while len(sentence) > chunk_size:
+                cut = sentence.rfind(' ', 0, chunk_size)
+                cut = cut if cut > 0 else chunk_size
+                pieces.append(sentence[:cut])
+                sentence = sentence[cut:].lstrip()
+            if sentence:
+                pieces.append(sentence)
+
+    # Greedily pack the pieces back together up to the chunk size
+    chunks = []
+    for piece in pieces:
+        if chunks and len(chunks[-1]) + 2 + len(piece) <= chunk_size:
+            chunks[-1] = f"{chunks[-1]}\n\n{piece}"
+        else:
+            chunks.append(piece)
+    return chunks
+
+def _summary_level(level: int, results: List[SummaryResult]) -> SummaryLevel:
+    """Aggregate the API metadata of one reduction level"""
+    original_length = sum(r['metadata']['original_length'] for r in results)
+    summary_length = sum(r['metadata']['summary_length'] for r in results)
+    # Weight each chunk's reported ratio by its share of the input
+    compression_ratio = sum(
+        r['metadata']['compression_ratio'] * r['metadata']['original_length']
+        for r in results
+    ) / max(1, original_length)
+    return {
+        'level': level,
+        'chunks': len(results),
+        'original_length': original_length,
+        'summary_length': summary_length,
+        'compression_ratio': compression_ratio,
+    }
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to at most limit characters, preferring a word boundary"""
+    if len(text) <= limit:
+        return text
+    cut = text.rfind(' ', 0, limit)
+    return text[:cut if cut > 0 else limit]
+
+def _reduce_inputs(summaries: List[str], chunk_size: int) -> List[str]:
+    """
+    Group partial summaries into the inputs of the next level
+
+    Summaries are packed into chunks of at most chunk_size characters. If
+    that does not reduce their number, each summary is instead cut to
+    (chunk_size - 2) // 2 characters at a word boundary and paired with its
+    neighbour, which is lossy; a warning is logged with the characters dropped.
+    """
+    chunks = _split_text('\n\n'.join(summaries), chunk_size)
+    if len(chunks) < len(summaries):
+        return chunks or summaries[:1]
+    # The summaries did not shrink enough to pack tighter, so trim each one
+    # until pairs fit in a chunk; this halves the count at every level
+    limit = max(1, (chunk_size - 2) // 2)
+    trimmed = [_truncate(summary, limit) for summary in summaries]
+    dropped = sum(len(summary) - len(cut) for summary, cut in zip(summaries, trimmed))
+    if dropped:
+        logger.warning(
+            'Partial summaries did not shrink below chunk_size=%d; truncated them to %d characters each, '
+            'dropping %d characters',
+            chunk_size, limit, dropped
+        )
+    return [
+        '\n\n'.join(trimmed[i:i + 2])
+        for i in range(0, len(trimmed), 2)
+    ]
+
+def _raise_first_error(results: List[BatchItemResult]) -> List:
+    """Unwrap batch results, raising the first failure"""
+    for item in results:
+        if item['error'] is not None:
+            raise item['error']
+    return [item['result'] for item in results]
+
 class TextCapabilities(BaseCapability):
     @property
     def base_path(self) -> str:
@@ -23,11 +125,53 @@ class TextCapabilities(BaseCapability):
         Returns:
             A concise summary of the input text
         """
+        return self._summarize_result(text)['summary']
+
+    def _summarize_result(self, text: str) -> SummaryResult:
+        """Summarize text, keeping the API metadata"""
         response = self._client.post(
             self.endpoint('/summarize'),
-            {'text': text}
+            {'text': text},
+            idempotent=True,
+            cacheable=True
         )
-        return response['result']['summary']
+        return response['result']
+
+    def summarize_long(
+        self,
+        text: str,
+        chunk_size: int = 4000,
+        concurrency: int = 8
+    ) -> LongSummaryResult:
+        """
+        Summarize a document too long for a single request
+        
+        The text is split on paragraph and sentence boundaries, the chunks
+        are summarized in parallel, and the partial summaries are reduced
+        level by level until a single summary remains. If a level fails to
+        shrink, each of its summaries is cut to (chunk_size - 2) // 2
+        characters so that no request ever exceeds chunk_size; the cut text
+        is lost from the final summary, and a warning is logged.
+        
+        Args:
+            text: The text to summarize
+            chunk_size: Maximum characters sent per request
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            The final summary and per-level length and compression statistics
+        """
+        inputs = _split_text(text, chunk_size) or [text]
+        levels = []
+        while True:
+            results = _raise_first_error(list(
+                self._map_concurrent(self._summarize_result, inputs, concurrency)
+            ))
+            levels.append(_summary_level(len(levels) + 1, results))
+            summaries = [r['summary'] for r in results]
+            if len(summaries) == 1:
+                return {'summary': summaries[0], 'levels': levels}
+            inputs = _reduce_inputs(summaries, chunk_size)
 
     def translate(
         self,
@@ -55,7 +199,9 @@ class TextCapabilities(BaseCapability):
 
         response = self._client.post(
             self.endpoint('/translate'),
-            request_data
+            request_data,
+            idempotent=True,
+            cacheable=True
         )
         return response['result']['translation']
 
@@ -71,6 +217,280 @@ class TextCapabilities(BaseCapability):
         """
         response = self._client.post(
             self.endpoint('/sentiment'),
-            {'text': text}
+            {'text': text},
+            idempotent=True,
+            cacheable=True
+        )
+        return response['result']
+
+    def summarize_many(
+        self,
+        texts: Iterable[str],
+        concurrency: int = 8
+    ) -> List[BatchItemResult[str]]:
+        """
+        Summarize many texts concurrently
+        
+        Args:
+            texts: The texts to summarize
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            One result per input, in input order; failed items carry an error
+            instead of a summary
+        """
+        return list(self._map_concurrent(self.summarize, texts, concurrency))
+
+    def translate_many(
+        self,
+        texts: Iterable[str],
+        target_lang: LanguageCode,
+        source_lang: Optional[LanguageCode] = None,
+        concurrency: int = 8
+    ) -> List[BatchItemResult[str]]:
+        """
+        Translate many texts concurrently
+        
+        Args:
+            texts: The texts to translate
+            target_lang: The target language code
+            source_lang: Optional source language code (auto-detected if not provided)
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            One result per input, in input order; failed items carry an error
+            instead of a translation
+        """
+        return list(self._map_concurrent(
+            lambda text: self.translate(text, target_lang, source_lang),
+            texts,
+            concurrency
+        ))
+
+    def analyze_sentiment_many(
+        self,
+        texts: Iterable[str],
+        concurrency: int = 8
+    ) -> List[BatchItemResult[SentimentResult]]:
+        """
+        Analyze the sentiment of many texts concurrently
+        
+        Args:
+            texts: The texts to analyze
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            One result per input, in input order; failed items carry an error
+            instead of a sentiment result
+        """
+        return list(self._map_concurrent(self.analyze_sentiment, texts, concurrency))
+
+    def analyze_sentiment_stream(
+        self,
+        texts: Iterable[str],
+        concurrency: int = 8,
+        ordered: bool = True
+    ) -> Iterator[BatchItemResult[SentimentResult]]:
+        """
+        Analyze the sentiment of a large or unbounded stream of texts
+        
+        Texts are pulled from the input only as request slots free up, so
+        memory stays flat regardless of corpus size.
+        
+        Args:
+            texts: The texts to analyze, e.g. lines of a file
+            concurrency: Maximum number of requests in flight
+            ordered: Yield results in input order; if False, yield them as
+                they complete and use `index` to match them to inputs
+            
+        Yields:
+            One result per input; failed items carry an error instead of a
+            sentiment result
+        """
+        return self._map_concurrent(self.analyze_sentiment, texts, concurrency, ordered)
+
+class AsyncTextCapabilities(TextCapabilities):
+    """Async variant of TextCapabilities"""
+
+    async def summarize(self, text: str) -> str:
+        """
+        Generate a summary of the provided text
+        
+        Args:
+            text: The text to summarize
+            
+        Returns:
+            A concise summary of the input text
+        """
+        return (await self._summarize_result(text))['summary']
+
+    async def _summarize_result(self, text: str) -> SummaryResult:
+        """Summarize text, keeping the API metadata"""
+        response = await self._client.post(
+            self.endpoint('/summarize'),
+            {'text': text},
+            idempotent=True,
+            cacheable=True
         )
         return response['result']
+
+    async def summarize_long(
+        self,
+        text: str,
+        chunk_size: int = 4000,
+        concurrency: int = 8
+    ) -> LongSummaryResult:
+        """
+        Summarize a document too long for a single request
+        
+        Args:
+            text: The text to summarize
+            chunk_size: Maximum characters sent per request
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            The final summary and per-level length and compression statistics
+        """
+        inputs = _split_text(text, chunk_size) or [text]
+        levels = []
+        while True:
+            results = _raise_first_error(
+                await self._amap_concurrent(self._summarize_result, inputs, concurrency)
+            )
+            levels.append(_summary_level(len(levels) + 1, results))
+            summaries = [r['summary'] for r in results]
+            if len(summaries) == 1:
+                return {'summary': summaries[0], 'levels': levels}
+            inputs = _reduce_inputs(summaries, chunk_size)
+
+    async def translate(
+        self,
+        text: str,
+        target_lang: LanguageCode,
+        source_lang: Optional[LanguageCode] = None
+    ) -> str:
+        """
+        Translate text from one language to another
+        
+        Args:
+            text: The text to translate
+            target_lang: The target language code
+            source_lang: Optional source language code (auto-detected if not provided)
+            
+        Returns:
+            The translated text
+        """
+        request_data = {
+            'text': text,
+            'target_lang': target_lang
+        }
+        if source_lang:
+            request_data['source_lang'] = source_lang
+
+        response = await self._client.post(
+            self.endpoint('/translate'),
+            request_data,
+            idempotent=True,
+            cacheable=True
+        )
+        return response['result']['translation']
+
+    async def analyze_sentiment(self, text: str) -> SentimentResult:
+        """
+        Analyze the sentiment of the provided text
+        
+        Args:
+            text: The text to analyze
+            
+        Returns:
+            Sentiment analysis result with confidence score
+        """
+        response = await self._client.post(
+            self.endpoint('/sentiment'),
+            {'text': text},
+            idempotent=True,
+            cacheable=True
+        )
+        return response['result']
+
+    async def summarize_many(
+        self,
+        texts: Iterable[str],
+        concurrency: int = 8
+    ) -> List[BatchItemResult[str]]:
+        """
+        Summarize many texts concurrently
+        
+        Args:
+            texts: The texts to summarize
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            One result per input, in input order; failed items carry an error
+            instead of a summary
+        """
+        return await self._amap_concurrent(self.summarize, texts, concurrency)
+
+    async def translate_many(
+        self,
+        texts: Iterable[str],
+        target_lang: LanguageCode,
+        source_lang: Optional[LanguageCode] = None,
+        concurrency: int = 8
+    ) -> List[BatchItemResult[str]]:
+        """
+        Translate many texts concurrently
+        
+        Args:
+            texts: The texts to translate
+            target_lang: The target language code
+            source_lang: Optional source language code (auto-detected if not provided)
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            One result per input, in input order; failed items carry an error
+            instead of a translation
+        """
+        return await self._amap_concurrent(
+            lambda text: self.translate(text, target_lang, source_lang),
+            texts,
+            concurrency
+        )
+
+    async def analyze_sentiment_many(
+        self,
+        texts: Iterable[str],
+        concurrency: int = 8
+    ) -> List[BatchItemResult[SentimentResult]]:
+        """
+        Analyze the sentiment of many texts concurrently
+        
+        Args:
+            texts: The texts to analyze
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            One result per input, in input order; failed items carry an error
+            instead of a sentiment result
+        """
+        return await self._amap_concurrent(self.analyze_sentiment, texts, concurrency)
+
+    def analyze_sentiment_stream(
+        self,
+        texts: Union[Iterable[str], AsyncIterable[str]],
+        concurrency: int = 8,
+        ordered: bool = True
+    ) -> AsyncIterator[BatchItemResult[SentimentResult]]:
+        """
+        Analyze the sentiment of a large or unbounded stream of texts
+        
+        Args:
+            texts: The texts to analyze, as a sync or async iterable
+            concurrency: Maximum number of requests in flight
+            ordered: Yield results in input order; if False, yield them as
+                they complete and use `index` to match them to inputs
+            
+        Returns:
+            Async iterator of one result per input
+        """
+        return self._astream_concurrent(self.analyze_sentiment, texts, concurrency, ordered)
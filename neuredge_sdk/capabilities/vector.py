@@ -1,4 +1,13 @@
-from typing import List, Optional, Union, Dict, Any
+from typing import (
+    List, Optional, Union, Dict, Any, Iterable, Iterator, AsyncIterable,
+    AsyncIterator, Awaitable, Sequence, Callable, Tuple
+)
+from contextlib import contextmanager
+import asyncio
+import base64
+import itertools
+import logging
+import threading
 import time
 
 from ..types import (
@@ -8,28 +17,618 @@ from ..types import (
     VectorIndexResponse,
     SearchVectorMatch,
     AddVectorsResult,
+    BulkUpsertStats,
+    BulkDeleteStats,
+    ImportStats,
+    SnapshotManifest,
+    BatchItemResult,
+    ReplicaStats,
     NeuredgeError
 )
-from .base import BaseCapability
+from .base import BaseCapability, _anumbered
+from ..arrays import is_array, encode_float32, decode_float32, unpack_float32
+from ..filters import filter_matches
+from ..snapshot import SnapshotWriter, SnapshotReader, ImportCheckpoint
+
+logger = logging.getLogger(__name__)
+
+# How vector values are sent: 'auto' uses base64 float32 for numpy arrays and
+# buffers and JSON floats for lists, 'base64' and 'json' force one encoding
+VECTOR_ENCODINGS = ('auto', 'base64', 'json')
+
+# Statuses with which a server may reject base64-encoded values
+BASE64_REJECTED_STATUSES = (400, 415, 422)
+
+# Candidates fetched per requested match when filtering or reranking
+CANDIDATE_FACTOR = 4
+
+# Seconds that cached index metadata is trusted; 0 disables the cache
+DEFAULT_INDEX_CACHE_TTL = 5.0
+
+def _is_buffer(values: Any) -> bool:
+    """Whether vector values are a numpy array or raw float32 buffer"""
+    return is_array(values) or isinstance(values, (bytes, bytearray, memoryview))
+
+def _json_values(values: Any) -> List[float]:
+    """Vector values as a JSON float list"""
+    if is_array(values):
+        return values.tolist()
+    if isinstance(values, (bytes, bytearray, memoryview)):
+        return unpack_float32(values)
+    return values
+
+def _decode_matches(matches: List[Dict[str, Any]], as_array: bool) -> List[SearchVectorMatch]:
+    """Normalize returned vectors to float32 arrays, or to float lists"""
+    for match in matches:
+        vector = match.get('vector')
+        if vector is None:
+            continue
+        if as_array:
+            match['vector'] = decode_float32(vector)
+        elif isinstance(vector, str):
+            match['vector'] = unpack_float32(base64.b64decode(vector))
+    return matches
+
+def _vector_dimension(values: Any) -> Optional[int]:
+    """Dimension of vector values, or None if it cannot be told without decoding"""
+    if is_array(values):
+        return values.shape[0] if values.ndim == 1 else -1
+    if isinstance(values, memoryview):
+        return values.nbytes // 4
+    if isinstance(values, (bytes, bytearray)):
+        return len(values) // 4
+    if isinstance(values, str):
+        return None
+    return len(values)
+
+def _candidate_count(options: Dict[str, Any]) -> int:
+    """Matches to request from the server before client-side filtering and reranking"""
+    top_k = options.get('top_k', 10)
+    if options.get('filter') is None and not options.get('rerank'):
+        return top_k
+    return max(top_k, options.get('candidates', CANDIDATE_FACTOR * top_k))
+
+def _refine_matches(matches: List[SearchVectorMatch], query: Any, options: Dict[str, Any]) -> List[SearchVectorMatch]:
+    """Apply filter and rerank options to server results, then trim to top_k"""
+    if options.get('filter') is None and not options.get('rerank'):
+        return matches
+    top_k = options.get('top_k', 10)
+    if options.get('filter') is not None:
+        if matches and all('metadata' not in match for match in matches):
+            # The server ignored return_metadata, so the filter cannot be
+            # checked here; its results may only be used if it applied it
+            if not options.get('trust_server_filter'):
+                raise NeuredgeError(
+                    'Search results carry no metadata, so the filter cannot be applied; '
+                    'set trust_server_filter to accept the server-filtered results',
+                    'INVALID_RESPONSE',
+                    500
+                )
+            logger.warning('Search results carry no metadata; relying on the server-side filter')
+        else:
+            matches = filter_matches(matches, options['filter'])
+    if options.get('rerank'):
+        from ..vector.rerank import rerank_matches
+
+        matches = rerank_matches(matches, query, top_k, options['rerank'])
+    # Drop fields fetched only for filtering or reranking
+    dropped = {
+        key for key, wanted in (('vector', 'return_vectors'), ('metadata', 'return_metadata'))
+        if not options.get(wanted)
+    }
+    return [{key: value for key, value in match.items() if key not in dropped} for match in matches[:top_k]]
+
+def _iter_batches(
+    vectors: Union[Iterable[Vector], Any],
+    batch_size: int,
+    ids: Optional[Sequence[Union[str, int]]] = None
+) -> Iterator[List[Vector]]:
+    """Group vectors into batches lazily; array rows become views, not copies"""
+    if is_array(vectors):
+        for start in range(0, len(vectors), batch_size):
+            rows = vectors[start:start + batch_size]
+            row_ids = ids[start:start + len(rows)] if ids is not None else [
+                str(i) for i in range(start, start + len(rows))
+            ]
+            yield [{'id': id, 'values': row} for id, row in zip(row_ids, rows)]
+        return
+
+    batch = []
+    for vector in vectors:
+        batch.append(vector)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+async def _aiter_batches(
+    vectors: Union[Iterable[Vector], AsyncIterable[Vector], Any],
+    batch_size: int,
+    ids: Optional[Sequence[Union[str, int]]] = None
+) -> AsyncIterator[List[Vector]]:
+    """Group a sync or async stream of vectors into batches lazily"""
+    if not hasattr(vectors, '__aiter__'):
+        for batch in _iter_batches(vectors, batch_size, ids):
+            yield batch
+        return
+
+    batch = []
+    async for vector in vectors:
+        batch.append(vector)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def _export_snapshot(
+    path: str,
+    index: VectorIndex,
+    vectors: Iterable[Vector],
+    resume: bool,
+    checkpoint_every: int
+) -> SnapshotManifest:
+    """Stream vectors into a snapshot, checkpointing every `checkpoint_every` vectors"""
+    writer = SnapshotWriter(path, index, resume)
+    try:
+        # Vectors before the last checkpoint were exported by an earlier run
+        for batch in _iter_batches(itertools.islice(vectors, writer.count, None), checkpoint_every):
+            writer.write(batch)
+            writer.checkpoint()
+    except BaseException:
+        writer.abort()
+        raise
+    return writer.close()
+
+def _snapshot_target(reader: SnapshotReader, index: Optional[VectorIndex], index_name: str) -> Optional[VectorIndex]:
+    """Check that a snapshot can be imported into an index; returns the config to create it with if missing"""
+    manifest = reader.manifest
+    if not manifest['complete']:
+        raise NeuredgeError(
+            f"Snapshot at {reader.path} is incomplete; resume its export first",
+            'INVALID_REQUEST',
+            400
+        )
+    if index is None:
+        return {'name': index_name, 'dimension': manifest['dimension'], 'metric': manifest['metric']}
+    if index['dimension'] != manifest['dimension']:
+        raise NeuredgeError(
+            f"Index {index_name} has dimension {index['dimension']}, snapshot has {manifest['dimension']}",
+            'INVALID_REQUEST',
+            400
+        )
+    return None
+
+def _skipped_vectors(done: Iterable[int], batch_size: int, count: int) -> int:
+    """Vectors in batches finished by earlier runs"""
+    return sum(max(0, min(batch_size, count - number * batch_size)) for number in done)
+
+def _poll_delays(initial_delay: float, max_delay: float, deadline: float) -> Iterator[float]:
+    """Exponentially growing poll intervals, clipped to end at the deadline"""
+    delay = initial_delay
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        yield min(delay, remaining)
+        delay = min(max_delay, delay * 2)
+
+def _count_reached(
+    expected_count: int,
+    settle: Optional[float],
+    baseline: Optional[int] = None
+) -> Callable[[Optional[VectorIndex]], bool]:
+    """
+    Readiness check for wait_until_indexed: the count reached the target,
+    or with `settle`, it has not changed for that many seconds after
+    moving off `baseline`
+    """
+    last = {'count': None, 'since': 0.0}
+
+    def ready(index: Optional[VectorIndex]) -> bool:
+        if index is None:
+            return False
+        count = index.get('vector_count', 0)
+        if count >= expected_count:
+            return True
+        now = time.monotonic()
+        if count != last['count']:
+            last['count'], last['since'] = count, now
+            return False
+        if settle is None or count == baseline:
+            return False
+        return now - last['since'] >= settle
+
+    return ready
+
+def _consistency_timeout(consistency: Dict[str, Any]) -> float:
+    """Seconds to wait for consistency; defaults to the old max_retries * retry_delay budget"""
+    if 'timeout' in consistency:
+        return consistency['timeout']
+    return consistency.get('max_retries', 5) * consistency.get('retry_delay', 3000) / 1000
+
+class _BulkProgress:
+    """Running counters for upsert_bulk"""
+
+    def __init__(self, on_progress: Optional[Callable[[BulkUpsertStats], None]]):
+        self._on_progress = on_progress
+        self._started = time.monotonic()
+        self.inserted = 0
+        self.batches = 0
+        self.retried_batches = 0
+        self.failed_batches = 0
+        self.failed_ids = []
+
+    def record(self, batch: List[Vector], inserted: int, error: Optional[NeuredgeError], final: bool):
+        """Count a finished batch upload and report progress"""
+        if error is None:
+            self.inserted += inserted
+            self.batches += 1
+        elif not final:
+            self.retried_batches += 1
+        if self._on_progress:
+            self._on_progress(self.stats())
+
+    def fail(self, batches: List[List[Vector]], errors: List[NeuredgeError]):
+        """Record batches that failed every attempt, with their last errors"""
+        self.failed_batches = len(batches)
+        self.failed_ids = [v['id'] for batch in batches for v in batch]
+
+    def stats(self) -> BulkUpsertStats:
+        elapsed = time.monotonic() - self._started
+        return {
+            'inserted': self.inserted,
+            'failed': len(self.failed_ids),
+            'batches': self.batches,
+            'retried_batches': self.retried_batches,
+            'failed_batches': self.failed_batches,
+            'failed_ids': self.failed_ids,
+            'elapsed': elapsed,
+            'vectors_per_second': self.inserted / elapsed if elapsed > 0 else 0.0,
+        }
+
+class _DeleteProgress(_BulkProgress):
+    """Running counters for delete_bulk, whose batches are lists of IDs"""
+
+    def __init__(self, on_progress: Optional[Callable[[BulkDeleteStats], None]]):
+        super().__init__(on_progress)
+        self.errors = []
+
+    def fail(self, batches: List[List[Union[str, int]]], errors: List[NeuredgeError]):
+        self.failed_batches = len(batches)
+        self.failed_ids = [id for batch in batches for id in batch]
+        self.errors = [
+            {'ids': len(batch), 'code': error.code, 'message': error.message}
+            for batch, error in zip(batches, errors)
+        ]
+
+    def stats(self) -> BulkDeleteStats:
+        elapsed = time.monotonic() - self._started
+        return {
+            'deleted': self.inserted,
+            'failed': len(self.failed_ids),
+            'batches': self.batches,
+            'retried_batches': self.retried_batches,
+            'failed_batches': self.failed_batches,
+            'failed_ids': self.failed_ids,
+            'errors': self.errors,
+            'elapsed': elapsed,
+            'ids_per_second': self.inserted / elapsed if elapsed > 0 else 0.0,
+        }
 
 class VectorStoreCapabilities(BaseCapability):
+    def __init__(self, client):
+        super().__init__(client)
+        # Set once the server rejects base64 values, so later calls send JSON
+        self._base64_rejected = False
+        # Local mirrors of hot indexes, by index name
+        self._replicas: Dict[str, Any] = {}
+        # Index metadata by name: the index without its vector count, which
+        # never changes while the index exists, plus the last count read from
+        # the server and the monotonic time it was read
+        self.index_cache_ttl = DEFAULT_INDEX_CACHE_TTL
+        self._index_cache: Dict[str, Dict[str, Any]] = {}
+        self._index_cache_lock = threading.Lock()
+
     @property
     def base_path(self) -> str:
         return '/v1'  # Vector store endpoints use v1 prefix
 
-    def create_index(self, config: VectorIndex) -> None:
+    def invalidate_index_cache(self, name: Optional[str] = None) -> None:
+        """
+        Drop cached index metadata, e.g. after changes made by another client
+        
+        Args:
+            name: Index to forget, or None for all
+        """
+        with self._index_cache_lock:
+            if name is None:
+                self._index_cache.clear()
+            else:
+                self._index_cache.pop(name, None)
+
+    def _cache_index(self, index: Optional[VectorIndex]):
+        """Remember an index read from the server, including its vector count"""
+        if index is not None and self.index_cache_ttl > 0:
+            with self._index_cache_lock:
+                self._index_cache[index['name']] = {
+                    'index': {k: v for k, v in index.items() if k != 'vector_count'},
+                    'count': index.get('vector_count', 0),
+                    'counted_at': time.monotonic(),
+                }
+
+    def _cached_index(self, name: str) -> Optional[VectorIndex]:
+        """
+        Cached name, dimension and metric, or None; these hold until the
+        index is deleted, so they are kept until a 404 or invalidation
+        """
+        with self._index_cache_lock:
+            entry = self._index_cache.get(name)
+            return dict(entry['index']) if entry is not None else None
+
+    def _cached_count(self, name: str) -> Optional[int]:
+        """Vector count read from the server within the TTL and not since written to, or None"""
+        with self._index_cache_lock:
+            entry = self._index_cache.get(name)
+            if entry is None or entry['count'] is None:
+                return None
+            if time.monotonic() - entry['counted_at'] >= self.index_cache_ttl:
+                return None
+            return entry['count']
+
+    def _record_write(self, name: str, vectors: Optional[List[Vector]] = None):
+        """
+        A successful write confirms the index exists and, for an index not
+        yet cached, that it takes the written vectors' dimension; its vector
+        count is left unknown, since upserts may have replaced existing IDs
+        """
+        if self.index_cache_ttl <= 0:
+            return
+        with self._index_cache_lock:
+            entry = self._index_cache.get(name)
+            if entry is not None:
+                entry['count'] = None
+                return
+            dimensions = (_vector_dimension(v['values']) for v in vectors or ())
+            dimension = next((d for d in dimensions if d is not None and d >= 0), None)
+            if dimension is not None:
+                self._index_cache[name] = {
+                    'index': {'name': name, 'dimension': dimension, 'metric': 'cosine'},
+                    'count': None,
+                    'counted_at': 0.0,
+                }
+
+    @contextmanager
+    def _forget_on_missing(self, name: str):
+        """Drop cached metadata for an index the server reports as missing"""
+        try:
+            yield
+        except NeuredgeError as e:
+            if e.status_code == 404:
+                self.invalidate_index_cache(name)
+            raise
+
+    def _check_dimensions(self, index_name: str, vectors: List[Vector]):
+        """
+        Reject vectors whose dimension differs from the cached index's
+        before uploading them; an index is cached from its first read or
+        successful write, so only a first write is left to the server
+        """
+        index = self._cached_index(index_name)
+        if index is None:
+            return
+        for vector in vectors:
+            dimension = _vector_dimension(vector['values'])
+            if dimension is not None and dimension != index['dimension']:
+                raise NeuredgeError(
+                    f"Vector {vector['id']} has dimension {dimension}, "
+                    f"index {index_name} expects {index['dimension']}",
+                    'INVALID_REQUEST',
+                    400
+                )
+
+    def _use_base64(self, encoding: str, values: List[Any]) -> bool:
+        """Decide the transport encoding for a request carrying these values"""
+        if encoding not in VECTOR_ENCODINGS:
+            raise NeuredgeError(
+                f"encoding must be one of {', '.join(VECTOR_ENCODINGS)}",
+                'INVALID_REQUEST',
+                400
+            )
+        if encoding == 'json' or self._base64_rejected:
+            return False
+        return encoding == 'base64' or any(_is_buffer(v) for v in values)
+
+    def _vectors_body(self, vectors: List[Vector], base64_values: bool) -> Dict[str, Any]:
+        """Build an add-vectors request body"""
+        encode = encode_float32 if base64_values else _json_values
+        return {'vectors': [{**v, 'values': encode(v['values'])} for v in vectors]}
+
+    def _search_body(self, vector: Any, options: Dict[str, Any], base64_values: bool) -> Dict[str, Any]:
+        """Build a search request body"""
+        body = {'limit': _candidate_count(options)}
+        if options.get('return_vectors') or options.get('rerank'):
+            body['return_vectors'] = True
+        if options.get('return_metadata') or options.get('filter') is not None:
+            body['return_metadata'] = True
+        if options.get('filter') is not None:
+            # Servers that filter natively return fewer, already-matching candidates
+            body['filter'] = options['filter']
+        if base64_values:
+            # Also ask for returned vectors as base64
+            body.update(vector=encode_float32(vector), vector_encoding='base64')
+        else:
+            body['vector'] = _json_values(vector)
+        return body
+
+    def _post_vectors(self, endpoint: str, build, base64_values: bool) -> Any:
+        """
+        POST a body carrying vector values, falling back to JSON floats
+        if the server rejects base64 values
+        
+        Args:
+            endpoint: API endpoint path
+            build: Called with the chosen encoding to build the body
+            base64_values: Whether to try base64 values first
+            
+        Returns:
+            Parsed response data
+        """
+        if not base64_values:
+            return self._client.post(endpoint, build(False), idempotent=True)
+        try:
+            return self._client.post(endpoint, build(True), idempotent=True)
+        except NeuredgeError as e:
+            if e.status_code not in BASE64_REJECTED_STATUSES:
+                raise
+            base64_error = e
+        try:
+            response = self._client.post(endpoint, build(False), idempotent=True)
+        except NeuredgeError:
+            # JSON failed too, so the request itself was bad
+            raise base64_error
+        self._base64_rejected = True
+        return response
+
+    def _to_index(self, data: Dict[str, Any]) -> VectorIndex:
+        """Convert an index payload from the API into a VectorIndex"""
+        return {
+            'name': data['name'],
+            'dimension': data['dimension'],
+            'metric': 'cosine',
+            'vector_count': data.get('vector_count', 0)
+        }
+
+    def _parse_index_response(self, response: Any) -> Optional[VectorIndex]:
+        """Validate a get-index response, returning None if it is unusable"""
+        if not response:
+            return None
+
+        # Ensure we have required properties
+        if 'name' not in response or 'dimension' not in response:
+            logger.warning('Invalid index response format: %r', response)
+            return None
+
+        return self._to_index(response)
+
+    def _parse_add_response(self, response: Any) -> AddVectorsResult:
+        """Validate an add-vectors response"""
+        # Ensure response has required properties
+        if not response or 'inserted' not in response:
+            raise NeuredgeError(
+                'Invalid response from add vectors',
+                'INVALID_RESPONSE',
+                500
+            )
+        return {
+            'inserted': response['inserted'],
+            'ids': response.get('ids', [])
+        }
+
+    def create_index(self, config: VectorIndex, wait: bool = False, timeout: float = 30.0) -> None:
         """
         Create a new vector index
         
         Args:
             config: Vector index configuration
+            wait: Block until the index is visible via get_index
+            timeout: Maximum seconds to wait when `wait` is set
         """
-        try:
-            self._client.post(self.endpoint('/indexes'), config)
-            # Wait briefly to allow index creation to propagate
-            time.sleep(1)
-        except Exception as e:
-            raise e
+        self._client.post(self.endpoint('/indexes'), config)
+        self._cache_index(self._to_index({**config, 'vector_count': 0}))
+        if wait:
+            self.wait_for_index_ready(config['name'], timeout=timeout)
+
+    def wait_for_index_ready(
+        self,
+        name: str,
+        timeout: float = 30.0,
+        initial_delay: float = 0.05,
+        max_delay: float = 2.0
+    ) -> VectorIndex:
+        """
+        Wait until an index is visible
+        
+        Polls quickly at first and backs off exponentially, so the call
+        returns soon after the index propagates.
+        
+        Args:
+            name: Name of the index
+            timeout: Maximum seconds to wait
+            initial_delay: First poll interval in seconds
+            max_delay: Longest poll interval in seconds
+            
+        Returns:
+            The index configuration
+            
+        Raises:
+            NeuredgeError: With code TIMEOUT if the index is not visible in time
+        """
+        return self._poll_index(
+            name,
+            lambda index: index is not None,
+            f"Index {name} not ready",
+            timeout, initial_delay, max_delay
+        )
+
+    def wait_until_indexed(
+        self,
+        index_name: str,
+        expected_count: int,
+        timeout: float = 30.0,
+        initial_delay: float = 0.05,
+        max_delay: float = 2.0,
+        settle: Optional[float] = None,
+        baseline: Optional[int] = None
+    ) -> VectorIndex:
+        """
+        Wait until an index reports at least `expected_count` vectors
+        
+        Args:
+            index_name: Name of the index
+            expected_count: Vector count to wait for
+            timeout: Maximum seconds to wait
+            initial_delay: First poll interval in seconds
+            max_delay: Longest poll interval in seconds
+            settle: Also return once the count has not changed for this many
+                seconds, for writes that replaced some existing vectors and
+                so never raise the count to `expected_count`
+            baseline: Count from before the write; with `settle`, a count
+                still at this value never ends the wait
+            
+        Returns:
+            The index configuration with the reached vector count
+            
+        Raises:
+            NeuredgeError: With code TIMEOUT if the count is not reached in time
+        """
+        return self._poll_index(
+            index_name,
+            _count_reached(expected_count, settle, baseline),
+            f"Index {index_name} did not reach {expected_count} vectors",
+            timeout, initial_delay, max_delay
+        )
+
+    def _poll_index(
+        self,
+        name: str,
+        ready: Callable[[Optional[VectorIndex]], bool],
+        message: str,
+        timeout: float,
+        initial_delay: float,
+        max_delay: float
+    ) -> VectorIndex:
+        """Poll get_index with growing intervals until `ready` holds or time runs out"""
+        delays = _poll_delays(initial_delay, max_delay, time.monotonic() + timeout)
+        while True:
+            index = self._fetch_index(name)
+            if ready(index):
+                return index
+            delay = next(delays, None)
+            if delay is None:
+                raise NeuredgeError(message, 'TIMEOUT', 408)
+            time.sleep(delay)
 
     def list_indexes(self) -> List[VectorIndex]:
         """
@@ -43,47 +642,43 @@ class VectorStoreCapabilities(BaseCapability):
         # Handle direct response structure without result wrapper
         indexes_data = response.get('indexes', [])
         
-        return [
-            {
-                'name': index['name'],
-                'dimension': index['dimension'],
-                'metric': 'cosine',
-                'vector_count': index.get('vector_count', 0)
-            }
-            for index in indexes_data
-        ]
+        indexes = [self._to_index(index) for index in indexes_data]
+        for index in indexes:
+            self._cache_index(index)
+        return indexes
 
     def get_index(self, name: str) -> Optional[VectorIndex]:
         """
         Get details of a specific index
         
+        The index is served from the cache if its vector count was read
+        from the server within `index_cache_ttl` seconds and nothing has
+        been written to it through this client since.
+        
         Args:
             name: Name of the index
             
         Returns:
             Vector index configuration if found, None otherwise
         """
+        index = self._cached_index(name)
+        count = self._cached_count(name)
+        if index is not None and count is not None:
+            return {**index, 'vector_count': count}
+        return self._fetch_index(name)
+
+    def _fetch_index(self, name: str) -> Optional[VectorIndex]:
+        """Get an index from the server, refreshing the cache"""
         try:
             response = self._client.get(self.endpoint(f'/indexes/{name}'))
-            
-            if not response:
-                return None
-
-            # Ensure we have required properties
-            if 'name' not in response or 'dimension' not in response:
-                print('Warning: Invalid index response format:', response)
-                return None
-
-            return {
-                'name': response['name'],
-                'dimension': response['dimension'],
-                'metric': 'cosine',
-                'vector_count': response.get('vector_count', 0)
-            }
         except NeuredgeError as e:
             if e.status_code == 404:
+                self.invalidate_index_cache(name)
                 return None
             raise e
+        index = self._parse_index_response(response)
+        self._cache_index(index)
+        return index
 
     def delete_index(self, name: str) -> None:
         """
@@ -92,6 +687,8 @@ class VectorStoreCapabilities(BaseCapability):
         Args:
             name: Name of the index to delete
         """
+        self._replicas.pop(name, None)
+        self.invalidate_index_cache(name)
         try:
             self._client.delete(self.endpoint(f'/indexes/{name}'))
         except NeuredgeError as e:
@@ -111,7 +708,8 @@ class VectorStoreCapabilities(BaseCapability):
         
         Args:
             index_name: Name of the index
-            vectors: Array of vectors to store
+            vectors: Array of vectors to store; values may be float lists,
+                numpy arrays or raw float32 buffers
             options: Vector operation options
             
         Returns:
@@ -123,46 +721,265 @@ class VectorStoreCapabilities(BaseCapability):
         # Get current count if consistency mode is enabled
         before_count = 0
         if consistency.get('enabled'):
-            index = self.get_index(index_name)
-            if not index:
-                raise NeuredgeError(
-                    f"Index {index_name} not found",
-                    'INDEX_NOT_FOUND',
-                    404
-                )
-            before_count = index.get('vector_count', 0)
+            before_count = self._vector_count(index_name)
 
-        # Store vectors
-        response = self._client.post(
-            self.endpoint(f'/indexes/{index_name}/vectors'),
-            {'vectors': vectors}
-        )
+        self._check_dimensions(index_name, vectors)
 
-        # Ensure response has required properties
-        if not response or 'inserted' not in response:
-            raise NeuredgeError(
-                'Invalid response from add vectors',
-                'INVALID_RESPONSE',
-                500
+        # Store vectors; upserts by ID, so safe to retry
+        with self._forget_on_missing(index_name):
+            response = self._post_vectors(
+                self.endpoint(f'/indexes/{index_name}/vectors'),
+                lambda base64_values: self._vectors_body(vectors, base64_values),
+                self._use_base64(options.get('encoding', 'auto'), [v['values'] for v in vectors])
             )
 
+        result = self._parse_add_response(response)
+        self._record_write(index_name, vectors)
+        self._mirror_write(index_name, vectors)
+
         # Wait for vectors to be indexed if consistency mode is enabled
         if consistency.get('enabled'):
-            expected_count = before_count + len(vectors)
-            max_retries = consistency.get('max_retries', 5)
-            retry_delay = consistency.get('retry_delay', 3000) / 1000  # Convert to seconds
-
-            for attempt in range(max_retries):
-                index = self.get_index(index_name)
-                if index and index.get('vector_count') == expected_count:
-                    break
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
+            self._wait_for_count(index_name, before_count, len(vectors), consistency)
 
-        return {
-            'inserted': response['inserted'],
-            'ids': response.get('ids', [])
-        }
+        return result
+
+    def _vector_count(self, index_name: str) -> int:
+        """Current vector count of an index, which must exist"""
+        index = self.get_index(index_name)
+        if not index:
+            raise NeuredgeError(
+                f"Index {index_name} not found",
+                'INDEX_NOT_FOUND',
+                404
+            )
+        return index.get('vector_count', 0)
+
+    def _wait_for_count(self, index_name: str, before_count: int, written: int, consistency: Dict[str, Any]):
+        """
+        Best-effort wait for the expected vector count; the write itself
+        already succeeded, so a timeout is logged rather than raised
+        """
+        try:
+            self.wait_until_indexed(
+                index_name, before_count + written,
+                timeout=_consistency_timeout(consistency),
+                settle=consistency.get('settle'),
+                baseline=before_count
+            )
+        except NeuredgeError as e:
+            if e.code != 'TIMEOUT':
+                raise
+            # The last count polled may still grow, so do not reuse it
+            self._record_write(index_name)
+            logger.warning('Consistency wait gave up: %s', e.message)
+
+    def upsert_bulk(
+        self,
+        index_name: str,
+        vectors: Union[Iterable[Vector], Any],
+        batch_size: int = 500,
+        concurrency: int = 4,
+        ids: Optional[Sequence[Union[str, int]]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        on_progress: Optional[Callable[[BulkUpsertStats], None]] = None,
+        max_batch_retries: int = 2
+    ) -> BulkUpsertStats:
+        """
+        Upload a large stream of vectors in parallel batches
+        
+        Vectors are read lazily and grouped into batches, which are uploaded
+        with at most `concurrency` requests in flight, so memory stays bounded
+        by the upload window rather than the input. Batches that fail are
+        retried after the pass, and with consistency enabled the index is
+        checked once at the end instead of after every batch.
+        
+        Args:
+            index_name: Name of the index
+            vectors: Iterable of vectors (e.g. a generator), or a 2-d numpy
+                array with one vector per row
+            batch_size: Maximum number of vectors per request
+            concurrency: Maximum number of batch requests in flight
+            ids: IDs for the rows of an array input (defaults to row numbers)
+            options: Consistency and encoding options, as for add_vectors
+            on_progress: Called with running stats after each batch
+            max_batch_retries: Extra attempts for each failed batch
+            
+        Returns:
+            Counts of inserted and failed vectors, failed IDs and throughput
+        """
+        options = options or {}
+        consistency = options.get('consistency', {})
+        encoding = options.get('encoding', 'auto')
+        before_count = self._vector_count(index_name) if consistency.get('enabled') else 0
+        progress = _BulkProgress(on_progress)
+        self._run_batches(
+            lambda batch: self._upload_batch(index_name, batch, encoding),
+            enumerate(_iter_batches(vectors, batch_size, ids)),
+            concurrency, max_batch_retries, progress
+        )
+
+        if consistency.get('enabled') and progress.inserted:
+            self._wait_for_count(index_name, before_count, progress.inserted, consistency)
+
+        return progress.stats()
+
+    def _run_batches(
+        self,
+        send: Callable[[List[Any]], int],
+        batches: Iterable[Tuple[int, List[Any]]],
+        concurrency: int,
+        max_batch_retries: int,
+        progress: _BulkProgress,
+        on_done: Optional[Callable[[int], None]] = None
+    ):
+        """
+        Send numbered batches in parallel; batches that fail are retried
+        in later rounds, up to `max_batch_retries` extra times
+        
+        Args:
+            send: Sends one batch, returning how many items it applied
+            batches: (number, batch) pairs, consumed lazily
+            concurrency: Maximum number of requests in flight
+            max_batch_retries: Extra attempts for each failed batch
+            progress: Counters to update
+            on_done: Called with the number of each batch that succeeds
+        """
+        def run(item: Tuple[int, List[Any]]):
+            number, batch = item
+            try:
+                return number, batch, send(batch), None
+            except Exception as e:
+                return number, batch, 0, self._handle_error(e)
+
+        pending = batches
+        for attempt in range(max_batch_retries + 1):
+            failed = []
+            for item in self._map_concurrent(run, pending, concurrency, ordered=False):
+                number, batch, applied, error = item['result']
+                progress.record(batch, applied, error, final=attempt == max_batch_retries)
+                if error is not None:
+                    failed.append((number, batch, error))
+                elif on_done:
+                    on_done(number)
+            if not failed:
+                break
+            pending = [(number, batch) for number, batch, _ in failed]
+        progress.fail([batch for _, batch, _ in failed], [error for _, _, error in failed])
+
+    def export_index(
+        self,
+        index_name: str,
+        path: str,
+        vectors: Optional[Iterable[Vector]] = None,
+        resume: bool = False,
+        checkpoint_every: int = 10000
+    ) -> SnapshotManifest:
+        """
+        Write an index's vectors to a snapshot directory
+        
+        A snapshot holds a raw float32 matrix (`vectors.f32`, memory-mappable
+        with numpy), a JSON-lines sidecar of IDs and metadata and a manifest.
+        The API cannot list vectors, so they come from `vectors`, e.g. the
+        data the index was built from, or otherwise from the index's replica.
+        
+        Args:
+            index_name: Name of the index
+            path: Snapshot directory
+            vectors: Contents of the index; defaults to its replica
+            resume: Continue an interrupted export after its last checkpoint,
+                skipping that many vectors of the source, which must yield
+                them in the same order
+            checkpoint_every: Vectors between checkpoints
+            
+        Returns:
+            The snapshot manifest
+        """
+        if vectors is None:
+            replica = self._replica(index_name)
+            return _export_snapshot(
+                path, replica.index.describe(), replica.index.iter_vectors(), resume, checkpoint_every
+            )
+        index = self.get_index(index_name)
+        if not index:
+            raise NeuredgeError(f"Index {index_name} not found", 'INDEX_NOT_FOUND', 404)
+        return _export_snapshot(path, index, iter(vectors), resume, checkpoint_every)
+
+    def import_index(
+        self,
+        index_name: str,
+        path: str,
+        batch_size: int = 500,
+        concurrency: int = 4,
+        resume: bool = True,
+        options: Optional[Dict[str, Any]] = None,
+        on_progress: Optional[Callable[[BulkUpsertStats], None]] = None,
+        max_batch_retries: int = 2
+    ) -> ImportStats:
+        """
+        Upload a snapshot written by export_index into an index
+        
+        The index is created from the snapshot's manifest if it does not
+        exist. Batches are uploaded in parallel as in upsert_bulk, and each
+        finished batch is recorded in a checkpoint file in the snapshot
+        directory, so an interrupted import resumes with the batches it had
+        not finished. The checkpoint is removed once every batch succeeds,
+        and ignored if the snapshot or the destination index has changed.
+        
+        Args:
+            index_name: Destination index
+            path: Snapshot directory
+            batch_size: Maximum number of vectors per request; a resumed
+                import keeps its original batch size
+            concurrency: Maximum number of batch requests in flight
+            resume: Skip batches finished by an earlier run
+            options: Consistency and encoding options, as for add_vectors
+            on_progress: Called with running stats after each batch
+            max_batch_retries: Extra attempts for each failed batch
+            
+        Returns:
+            Upload counts, plus the number of vectors skipped as already imported
+        """
+        options = options or {}
+        reader = SnapshotReader(path)
+        config = _snapshot_target(reader, self.get_index(index_name), index_name)
+        if config is not None:
+            self.create_index(config, wait=True)
+
+        consistency = options.get('consistency', {})
+        before_count = self._vector_count(index_name) if consistency.get('enabled') else 0
+        checkpoint = ImportCheckpoint(path, index_name, batch_size, resume, self._client.get_base_url())
+        done = checkpoint.done()
+        progress = _BulkProgress(on_progress)
+        try:
+            encoding = options.get('encoding', 'auto')
+            self._run_batches(
+                lambda batch: self._upload_batch(index_name, batch, encoding),
+                reader.batches(checkpoint.batch_size, done),
+                concurrency, max_batch_retries, progress, checkpoint.mark
+            )
+        finally:
+            checkpoint.save(force=True)
+        if not progress.failed_ids:
+            checkpoint.clear()
+
+        if consistency.get('enabled') and progress.inserted:
+            self._wait_for_count(index_name, before_count, progress.inserted, consistency)
+
+        return {**progress.stats(), 'skipped': _skipped_vectors(done, checkpoint.batch_size, len(reader))}
+
+    def _upload_batch(self, index_name: str, batch: List[Vector], encoding: str) -> int:
+        """Upload one batch of vectors, returning how many were inserted"""
+        self._check_dimensions(index_name, batch)
+        with self._forget_on_missing(index_name):
+            response = self._post_vectors(
+                self.endpoint(f'/indexes/{index_name}/vectors'),
+                lambda base64_values: self._vectors_body(batch, base64_values),
+                self._use_base64(encoding, [v['values'] for v in batch])
+            )
+        inserted = self._parse_add_response(response)['inserted']
+        self._record_write(index_name, batch)
+        self._mirror_write(index_name, batch)
+        return inserted
 
     def delete_vectors(
         self,
@@ -176,15 +993,62 @@ class VectorStoreCapabilities(BaseCapability):
             index_name: Name of the index
             ids: Array of vector IDs to delete
         """
-        self._client.delete(
-            self.endpoint(f'/indexes/{index_name}/vectors'),
-            {'ids': ids}
+        self._delete_batch(index_name, list(ids))
+
+    def _delete_batch(self, index_name: str, ids: List[Union[str, int]]) -> int:
+        """Delete one batch of IDs, returning how many were sent"""
+        with self._forget_on_missing(index_name):
+            self._client.delete(
+                self.endpoint(f'/indexes/{index_name}/vectors'),
+                {'ids': ids}
+            )
+        # The server count drops by an unknown amount
+        self._record_write(index_name)
+        self._mirror_delete(index_name, ids)
+        return len(ids)
+
+    def delete_bulk(
+        self,
+        index_name: str,
+        ids: Iterable[Union[str, int]],
+        batch_size: int = 1000,
+        concurrency: int = 4,
+        on_progress: Optional[Callable[[BulkDeleteStats], None]] = None,
+        max_batch_retries: int = 2
+    ) -> BulkDeleteStats:
+        """
+        Delete a large stream of IDs in parallel batches
+        
+        IDs are read lazily, e.g. from a generator over a purge list, and
+        sent in batches with at most `concurrency` requests in flight. A
+        failed batch is retried on its own after the pass; batches that
+        still fail are reported rather than raised, so the rest of the
+        purge goes through and the failed IDs can be retried later.
+        
+        Args:
+            index_name: Name of the index
+            ids: Iterable of IDs to delete
+            batch_size: Maximum number of IDs per request
+            concurrency: Maximum number of batch requests in flight
+            on_progress: Called with running stats after each batch
+            max_batch_retries: Extra attempts for each failed batch
+            
+        Returns:
+            Counts of deleted and failed IDs, failed IDs and the last error
+            of each failed batch
+        """
+        progress = _DeleteProgress(on_progress)
+        self._run_batches(
+            lambda batch: self._delete_batch(index_name, batch),
+            enumerate(_iter_batches(iter(ids), batch_size)),
+            concurrency, max_batch_retries, progress
         )
+        return progress.stats()
 
     def search_vector(
         self,
         index_name: str,
-        vector: List[float],
+        vector: Union[List[float], Any],
         options: Optional[Dict[str, Any]] = None
     ) -> List[SearchVectorMatch]:
         """
@@ -192,8 +1056,11 @@ class VectorStoreCapabilities(BaseCapability):
         
         Args:
             index_name: Name of the index
-            vector: Query vector
-            options: Search and consistency options
+            vector: Query vector, as a float list, numpy array or float32 buffer
+            options: Search, consistency and encoding options. With `filter`
+                or `rerank`, `candidates` matches are fetched (default
+                4 * top_k), filtered on their metadata, reranked using their
+                vectors and trimmed to top_k
             
         Returns:
             List of matched vectors with similarity scores
@@ -203,32 +1070,852 @@ class VectorStoreCapabilities(BaseCapability):
         max_retries = consistency.get('max_retries', 1)
         retry_delay = consistency.get('retry_delay', 0) / 1000  # Convert to seconds
 
+        replica = self._local_replica(index_name)
+        if replica is not None:
+            return replica.search(decode_float32(vector), options)[0]
+
+        base64_values = self._use_base64(options.get('encoding', 'auto'), [vector])
+        as_array = is_array(vector)
+
         for attempt in range(max_retries):
             try:
-                response = self._client.post(
-                    self.endpoint(f'/indexes/{index_name}/search'),
-                    {
-                        'vector': vector,
-                        'limit': options.get('top_k', 10),
-                    }
-                )
+                with self._forget_on_missing(index_name):
+                    response = self._post_vectors(
+                        self.endpoint(f'/indexes/{index_name}/search'),
+                        lambda base64_values: self._search_body(vector, options, base64_values),
+                        base64_values
+                    )
                 
                 # If we have results, return them immediately
                 if response.get('results') and len(response['results']) > 0:
-                    return response['results']
+                    return _refine_matches(_decode_matches(response['results'], as_array), vector, options)
                 
                 # Only retry if we have no results and consistency is enabled
                 if not consistency.get('enabled'):
                     return response.get('results', [])
 
                 if attempt < max_retries - 1:
-                    print(f"Search attempt {attempt + 1}/{max_retries}: No results, retrying...")
+                    logger.debug('Search attempt %d/%d: no results, retrying', attempt + 1, max_retries)
                     time.sleep(retry_delay)
 
             except Exception as e:
-                print(f"Search attempt {attempt + 1} failed:", e)
+                logger.debug('Search attempt %d/%d failed: %s', attempt + 1, max_retries, e)
                 if attempt == max_retries - 1:
                     raise e
                 time.sleep(retry_delay)
 
         return []
+
+    def enable_replica(
+        self,
+        index_name: str,
+        vectors: Optional[Iterable[Vector]] = None,
+        engine: str = 'brute_force',
+        check_interval: float = 5.0,
+        metric: Optional[str] = None,
+        **engine_options: Any
+    ) -> ReplicaStats:
+        """
+        Mirror an index locally and answer its searches in-process
+        
+        The replica is kept up to date by writes made through this client.
+        Every `check_interval` seconds a search also compares the server's
+        vector count with the local one; after a mismatch (writes from
+        elsewhere) searches go to the server until `sync_replica` is called.
+        The API cannot list vectors, so existing contents must be supplied,
+        e.g. from the data the index was built from. Requires numpy.
+        
+        Args:
+            index_name: Name of the index
+            vectors: Current contents of the index, if it is not empty
+            engine: Local search engine, 'brute_force', 'ivf' or 'quantized'
+            check_interval: Seconds between vector count checks
+            metric: Scoring metric, if it differs from the index's reported one
+            **engine_options: Options for the engine
+            
+        Returns:
+            Replica counters; `stale` is False if the replica is in use
+        """
+        from ..vector.replica import IndexReplica
+
+        index = self._fetch_index(index_name)
+        if not index:
+            raise NeuredgeError(f"Index {index_name} not found", 'INDEX_NOT_FOUND', 404)
+        replica = IndexReplica(
+            index_name, index['dimension'], metric or index.get('metric', 'cosine'),
+            engine, check_interval, **engine_options
+        )
+        self._replicas[index_name] = replica
+        return self._load_replica(replica, vectors, index)
+
+    def sync_replica(self, index_name: str, vectors: Optional[Iterable[Vector]] = None) -> ReplicaStats:
+        """
+        Re-validate a replica, optionally reloading its contents
+        
+        Args:
+            index_name: Name of the index
+            vectors: Full current contents of the index; None keeps the local data
+            
+        Returns:
+            Replica counters; `stale` is False if the replica is in use
+        """
+        return self._load_replica(self._replica(index_name), vectors, self._fetch_index(index_name))
+
+    def disable_replica(self, index_name: str) -> None:
+        """
+        Stop mirroring an index; searches go to the server again
+        
+        Args:
+            index_name: Name of the index
+        """
+        self._replicas.pop(index_name, None)
+
+    def replica_stats(self, index_name: str) -> ReplicaStats:
+        """
+        Get replica counters
+        
+        Args:
+            index_name: Name of the index
+            
+        Returns:
+            Local and server vector counts, staleness and hit counters
+        """
+        return self._replica(index_name).stats()
+
+    def _replica(self, index_name: str):
+        """The replica of an index, which must be enabled"""
+        replica = self._replicas.get(index_name)
+        if replica is None:
+            raise NeuredgeError(
+                f"No replica enabled for index {index_name}",
+                'INVALID_REQUEST',
+                400
+            )
+        return replica
+
+    def _load_replica(self, replica, vectors: Optional[Iterable[Vector]], index: Optional[VectorIndex]) -> ReplicaStats:
+        """Load contents into a replica and compare counts with the server"""
+        if vectors is not None:
+            replica.load(vectors)
+        replica.observe_count(index.get('vector_count', 0) if index else None, synced=True)
+        return replica.stats()
+
+    def _local_replica(self, index_name: str):
+        """The replica to answer a search with, or None to ask the server"""
+        replica = self._replicas.get(index_name)
+        if replica is None:
+            return None
+        if replica.needs_check():
+            index = self._fetch_index(index_name)
+            replica.observe_count(index.get('vector_count', 0) if index else None)
+        if replica.usable:
+            return replica
+        replica.count_fallback()
+        return None
+
+    def _mirror_write(self, index_name: str, vectors: List[Vector]):
+        """Apply vectors written to the server to the index replica"""
+        replica = self._replicas.get(index_name)
+        if replica is not None:
+            replica.record_write(vectors)
+
+    def _mirror_delete(self, index_name: str, ids: Iterable[Union[str, int]]):
+        """Apply deletions on the server to the index replica"""
+        replica = self._replicas.get(index_name)
+        if replica is not None:
+            replica.record_delete(ids)
+
+    def search_vectors(
+        self,
+        index_name: str,
+        queries: Union[Iterable[List[float]], Any],
+        top_k: int = 10,
+        concurrency: int = 8,
+        options: Optional[Dict[str, Any]] = None
+    ) -> List[BatchItemResult[List[SearchVectorMatch]]]:
+        """
+        Search for many query vectors concurrently
+        
+        Latency is bounded by the slowest query rather than the sum of all.
+        
+        Args:
+            index_name: Name of the index
+            queries: Query vectors, or a 2-d numpy array with one query per row
+            top_k: Number of matches per query
+            concurrency: Maximum number of requests in flight
+            options: Search and encoding options, as for search_vector
+            
+        Returns:
+            One result per query, in query order; failed queries carry an
+            error instead of matches
+        """
+        options = {**(options or {}), 'top_k': top_k}
+        replica = self._local_replica(index_name)
+        if replica is not None:
+            return replica.search_many(queries, options)
+        return list(self._map_concurrent(
+            lambda query: self.search_vector(index_name, query, options),
+            queries,
+            concurrency
+        ))
+
+class AsyncVectorStoreCapabilities(VectorStoreCapabilities):
+    """Async variant of VectorStoreCapabilities"""
+
+    async def _post_vectors(self, endpoint: str, build, base64_values: bool) -> Any:
+        """
+        POST a body carrying vector values, falling back to JSON floats
+        if the server rejects base64 values
+        
+        Args:
+            endpoint: API endpoint path
+            build: Called with the chosen encoding to build the body
+            base64_values: Whether to try base64 values first
+            
+        Returns:
+            Parsed response data
+        """
+        if not base64_values:
+            return await self._client.post(endpoint, build(False), idempotent=True)
+        try:
+            return await self._client.post(endpoint, build(True), idempotent=True)
+        except NeuredgeError as e:
+            if e.status_code not in BASE64_REJECTED_STATUSES:
+                raise
+            base64_error = e
+        try:
+            response = await self._client.post(endpoint, build(False), idempotent=True)
+        except NeuredgeError:
+            # JSON failed too, so the request itself was bad
+            raise base64_error
+        self._base64_rejected = True
+        return response
+
+    async def create_index(self, config: VectorIndex, wait: bool = False, timeout: float = 30.0) -> None:
+        """
+        Create a new vector index
+        
+        Args:
+            config: Vector index configuration
+            wait: Wait until the index is visible via get_index
+            timeout: Maximum seconds to wait when `wait` is set
+        """
+        await self._client.post(self.endpoint('/indexes'), config)
+        self._cache_index(self._to_index({**config, 'vector_count': 0}))
+        if wait:
+            await self.wait_for_index_ready(config['name'], timeout=timeout)
+
+    async def wait_for_index_ready(
+        self,
+        name: str,
+        timeout: float = 30.0,
+        initial_delay: float = 0.05,
+        max_delay: float = 2.0
+    ) -> VectorIndex:
+        """
+        Wait until an index is visible
+        
+        Args:
+            name: Name of the index
+            timeout: Maximum seconds to wait
+            initial_delay: First poll interval in seconds
+            max_delay: Longest poll interval in seconds
+            
+        Returns:
+            The index configuration
+            
+        Raises:
+            NeuredgeError: With code TIMEOUT if the index is not visible in time
+        """
+        return await self._poll_index(
+            name,
+            lambda index: index is not None,
+            f"Index {name} not ready",
+            timeout, initial_delay, max_delay
+        )
+
+    async def wait_until_indexed(
+        self,
+        index_name: str,
+        expected_count: int,
+        timeout: float = 30.0,
+        initial_delay: float = 0.05,
+        max_delay: float = 2.0,
+        settle: Optional[float] = None,
+        baseline: Optional[int] = None
+    ) -> VectorIndex:
+        """
+        Wait until an index reports at least `expected_count` vectors
+        
+        Args:
+            index_name: Name of the index
+            expected_count: Vector count to wait for
+            timeout: Maximum seconds to wait
+            initial_delay: First poll interval in seconds
+            max_delay: Longest poll interval in seconds
+            settle: Also return once the count has not changed for this many
+                seconds, for writes that replaced some existing vectors and
+                so never raise the count to `expected_count`
+            baseline: Count from before the write; with `settle`, a count
+                still at this value never ends the wait
+            
+        Returns:
+            The index configuration with the reached vector count
+            
+        Raises:
+            NeuredgeError: With code TIMEOUT if the count is not reached in time
+        """
+        return await self._poll_index(
+            index_name,
+            _count_reached(expected_count, settle, baseline),
+            f"Index {index_name} did not reach {expected_count} vectors",
+            timeout, initial_delay, max_delay
+        )
+
+    async def _poll_index(
+        self,
+        name: str,
+        ready: Callable[[Optional[VectorIndex]], bool],
+        message: str,
+        timeout: float,
+        initial_delay: float,
+        max_delay: float
+    ) -> VectorIndex:
+        """Poll get_index with growing intervals until `ready` holds or time runs out"""
+        delays = _poll_delays(initial_delay, max_delay, time.monotonic() + timeout)
+        while True:
+            index = await self._fetch_index(name)
+            if ready(index):
+                return index
+            delay = next(delays, None)
+            if delay is None:
+                raise NeuredgeError(message, 'TIMEOUT', 408)
+            await asyncio.sleep(delay)
+
+    async def list_indexes(self) -> List[VectorIndex]:
+        """
+        List all vector indexes
+        
+        Returns:
+            List of vector index configurations
+        """
+        response = await self._client.get(self.endpoint('/indexes'))
+        indexes_data = response.get('indexes', [])
+        indexes = [self._to_index(index) for index in indexes_data]
+        for index in indexes:
+            self._cache_index(index)
+        return indexes
+
+    async def get_index(self, name: str) -> Optional[VectorIndex]:
+        """
+        Get details of a specific index
+        
+        The index is served from the cache if its vector count was read
+        from the server within `index_cache_ttl` seconds and nothing has
+        been written to it through this client since.
+        
+        Args:
+            name: Name of the index
+            
+        Returns:
+            Vector index configuration if found, None otherwise
+        """
+        index = self._cached_index(name)
+        count = self._cached_count(name)
+        if index is not None and count is not None:
+            return {**index, 'vector_count': count}
+        return await self._fetch_index(name)
+
+    async def _fetch_index(self, name: str) -> Optional[VectorIndex]:
+        """Get an index from the server, refreshing the cache"""
+        try:
+            response = await self._client.get(self.endpoint(f'/indexes/{name}'))
+        except NeuredgeError as e:
+            if e.status_code == 404:
+                self.invalidate_index_cache(name)
+                return None
+            raise e
+        index = self._parse_index_response(response)
+        self._cache_index(index)
+        return index
+
+    async def delete_index(self, name: str) -> None:
+        """
+        Delete a vector index
+        
+        Args:
+            name: Name of the index to delete
+        """
+        self._replicas.pop(name, None)
+        self.invalidate_index_cache(name)
+        try:
+            await self._client.delete(self.endpoint(f'/indexes/{name}'))
+        except NeuredgeError as e:
+            # Ignore 404 errors during cleanup
+            if e.status_code == 404:
+                return
+            raise e
+
+    async def add_vectors(
+        self,
+        index_name: str,
+        vectors: List[Vector],
+        options: Optional[Dict[str, Any]] = None
+    ) -> AddVectorsResult:
+        """
+        Store vectors in an index
+        
+        Args:
+            index_name: Name of the index
+            vectors: Array of vectors to store; values may be float lists,
+                numpy arrays or raw float32 buffers
+            options: Vector operation options
+            
+        Returns:
+            Result containing number of vectors inserted and their IDs
+        """
+        options = options or {}
+        consistency = options.get('consistency', {})
+
+        # Get current count if consistency mode is enabled
+        before_count = 0
+        if consistency.get('enabled'):
+            before_count = await self._vector_count(index_name)
+
+        self._check_dimensions(index_name, vectors)
+
+        with self._forget_on_missing(index_name):
+            response = await self._post_vectors(
+                self.endpoint(f'/indexes/{index_name}/vectors'),
+                lambda base64_values: self._vectors_body(vectors, base64_values),
+                self._use_base64(options.get('encoding', 'auto'), [v['values'] for v in vectors])
+            )
+        result = self._parse_add_response(response)
+        self._record_write(index_name, vectors)
+        self._mirror_write(index_name, vectors)
+
+        # Wait for vectors to be indexed if consistency mode is enabled
+        if consistency.get('enabled'):
+            await self._wait_for_count(index_name, before_count, len(vectors), consistency)
+
+        return result
+
+    async def _vector_count(self, index_name: str) -> int:
+        """Current vector count of an index, which must exist"""
+        index = await self.get_index(index_name)
+        if not index:
+            raise NeuredgeError(
+                f"Index {index_name} not found",
+                'INDEX_NOT_FOUND',
+                404
+            )
+        return index.get('vector_count', 0)
+
+    async def _wait_for_count(self, index_name: str, before_count: int, written: int, consistency: Dict[str, Any]):
+        """
+        Best-effort wait for the expected vector count; the write itself
+        already succeeded, so a timeout is logged rather than raised
+        """
+        try:
+            await self.wait_until_indexed(
+                index_name, before_count + written,
+                timeout=_consistency_timeout(consistency),
+                settle=consistency.get('settle'),
+                baseline=before_count
+            )
+        except NeuredgeError as e:
+            if e.code != 'TIMEOUT':
+                raise
+            # The last count polled may still grow, so do not reuse it
+            self._record_write(index_name)
+            logger.warning('Consistency wait gave up: %s', e.message)
+
+    async def upsert_bulk(
+        self,
+        index_name: str,
+        vectors: Union[Iterable[Vector], AsyncIterable[Vector], Any],
+        batch_size: int = 500,
+        concurrency: int = 4,
+        ids: Optional[Sequence[Union[str, int]]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        on_progress: Optional[Callable[[BulkUpsertStats], None]] = None,
+        max_batch_retries: int = 2
+    ) -> BulkUpsertStats:
+        """
+        Upload a large stream of vectors in parallel batches
+        
+        Args:
+            index_name: Name of the index
+            vectors: Sync or async iterable of vectors, or a 2-d numpy array
+                with one vector per row
+            batch_size: Maximum number of vectors per request
+            concurrency: Maximum number of batch requests in flight
+            ids: IDs for the rows of an array input (defaults to row numbers)
+            options: Consistency and encoding options, as for add_vectors
+            on_progress: Called with running stats after each batch
+            max_batch_retries: Extra attempts for each failed batch
+            
+        Returns:
+            Counts of inserted and failed vectors, failed IDs and throughput
+        """
+        options = options or {}
+        consistency = options.get('consistency', {})
+        encoding = options.get('encoding', 'auto')
+        before_count = await self._vector_count(index_name) if consistency.get('enabled') else 0
+        progress = _BulkProgress(on_progress)
+        await self._run_batches(
+            lambda batch: self._upload_batch(index_name, batch, encoding),
+            _anumbered(_aiter_batches(vectors, batch_size, ids)),
+            concurrency, max_batch_retries, progress
+        )
+
+        if consistency.get('enabled') and progress.inserted:
+            await self._wait_for_count(index_name, before_count, progress.inserted, consistency)
+
+        return progress.stats()
+
+    async def _run_batches(
+        self,
+        send: Callable[[List[Any]], Awaitable[int]],
+        batches: Union[Iterable[Tuple[int, List[Any]]], AsyncIterable[Tuple[int, List[Any]]]],
+        concurrency: int,
+        max_batch_retries: int,
+        progress: _BulkProgress,
+        on_done: Optional[Callable[[int], None]] = None
+    ):
+        """
+        Send numbered batches concurrently; batches that fail are retried
+        in later rounds, up to `max_batch_retries` extra times
+        """
+        async def run(item: Tuple[int, List[Any]]):
+            number, batch = item
+            try:
+                return number, batch, await send(batch), None
+            except Exception as e:
+                return number, batch, 0, self._handle_error(e)
+
+        pending = batches
+        for attempt in range(max_batch_retries + 1):
+            failed = []
+            async for item in self._astream_concurrent(run, pending, concurrency, ordered=False):
+                number, batch, applied, error = item['result']
+                progress.record(batch, applied, error, final=attempt == max_batch_retries)
+                if error is not None:
+                    failed.append((number, batch, error))
+                elif on_done:
+                    on_done(number)
+            if not failed:
+                break
+            pending = [(number, batch) for number, batch, _ in failed]
+        progress.fail([batch for _, batch, _ in failed], [error for _, _, error in failed])
+
+    async def export_index(
+        self,
+        index_name: str,
+        path: str,
+        vectors: Optional[Iterable[Vector]] = None,
+        resume: bool = False,
+        checkpoint_every: int = 10000
+    ) -> SnapshotManifest:
+        """
+        Write an index's vectors to a snapshot directory
+        
+        Args:
+            index_name: Name of the index
+            path: Snapshot directory
+            vectors: Contents of the index; defaults to its replica
+            resume: Continue an interrupted export after its last checkpoint
+            checkpoint_every: Vectors between checkpoints
+            
+        Returns:
+            The snapshot manifest
+        """
+        if vectors is None:
+            replica = self._replica(index_name)
+            return _export_snapshot(
+                path, replica.index.describe(), replica.index.iter_vectors(), resume, checkpoint_every
+            )
+        index = await self.get_index(index_name)
+        if not index:
+            raise NeuredgeError(f"Index {index_name} not found", 'INDEX_NOT_FOUND', 404)
+        return _export_snapshot(path, index, iter(vectors), resume, checkpoint_every)
+
+    async def import_index(
+        self,
+        index_name: str,
+        path: str,
+        batch_size: int = 500,
+        concurrency: int = 4,
+        resume: bool = True,
+        options: Optional[Dict[str, Any]] = None,
+        on_progress: Optional[Callable[[BulkUpsertStats], None]] = None,
+        max_batch_retries: int = 2
+    ) -> ImportStats:
+        """
+        Upload a snapshot written by export_index into an index
+        
+        Args:
+            index_name: Destination index, created if missing
+            path: Snapshot directory
+            batch_size: Maximum number of vectors per request
+            concurrency: Maximum number of batch requests in flight
+            resume: Skip batches finished by an earlier run
+            options: Consistency and encoding options, as for add_vectors
+            on_progress: Called with running stats after each batch
+            max_batch_retries: Extra attempts for each failed batch
+            
+        Returns:
+            Upload counts, plus the number of vectors skipped as already imported
+        """
+        options = options or {}
+        reader = SnapshotReader(path)
+        config = _snapshot_target(reader, await self.get_index(index_name), index_name)
+        if config is not None:
+            await self.create_index(config, wait=True)
+
+        consistency = options.get('consistency', {})
+        before_count = await self._vector_count(index_name) if consistency.get('enabled') else 0
+        checkpoint = ImportCheckpoint(path, index_name, batch_size, resume, self._client.get_base_url())
+        done = checkpoint.done()
+        progress = _BulkProgress(on_progress)
+        try:
+            encoding = options.get('encoding', 'auto')
+            await self._run_batches(
+                lambda batch: self._upload_batch(index_name, batch, encoding),
+                reader.batches(checkpoint.batch_size, done),
+                concurrency, max_batch_retries, progress, checkpoint.mark
+            )
+        finally:
+            checkpoint.save(force=True)
+        if not progress.failed_ids:
+            checkpoint.clear()
+
+        if consistency.get('enabled') and progress.inserted:
+            await self._wait_for_count(index_name, before_count, progress.inserted, consistency)
+
+        return {**progress.stats(), 'skipped': _skipped_vectors(done, checkpoint.batch_size, len(reader))}
+
+    async def _upload_batch(self, index_name: str, batch: List[Vector], encoding: str) -> int:
+        """Upload one batch of vectors, returning how many were inserted"""
+        self._check_dimensions(index_name, batch)
+        with self._forget_on_missing(index_name):
+            response = await self._post_vectors(
+                self.endpoint(f'/indexes/{index_name}/vectors'),
+                lambda base64_values: self._vectors_body(batch, base64_values),
+                self._use_base64(encoding, [v['values'] for v in batch])
+            )
+        inserted = self._parse_add_response(response)['inserted']
+        self._record_write(index_name, batch)
+        self._mirror_write(index_name, batch)
+        return inserted
+
+    async def delete_vectors(
+        self,
+        index_name: str,
+        ids: List[Union[str, int]]
+    ) -> None:
+        """
+        Delete vectors from an index
+        
+        Args:
+            index_name: Name of the index
+            ids: Array of vector IDs to delete
+        """
+        await self._delete_batch(index_name, list(ids))
+
+    async def _delete_batch(self, index_name: str, ids: List[Union[str, int]]) -> int:
+        """Delete one batch of IDs, returning how many were sent"""
+        with self._forget_on_missing(index_name):
+            await self._client.delete(
+                self.endpoint(f'/indexes/{index_name}/vectors'),
+                {'ids': ids}
+            )
+        # The server count drops by an unknown amount
+        self._record_write(index_name)
+        self._mirror_delete(index_name, ids)
+        return len(ids)
+
+    async def delete_bulk(
+        self,
+        index_name: str,
+        ids: Union[Iterable[Union[str, int]], AsyncIterable[Union[str, int]]],
+        batch_size: int = 1000,
+        concurrency: int = 4,
+        on_progress: Optional[Callable[[BulkDeleteStats], None]] = None,
+        max_batch_retries: int = 2
+    ) -> BulkDeleteStats:
+        """
+        Delete a large stream of IDs in parallel batches
+        
+        Args:
+            index_name: Name of the index
+            ids: Sync or async iterable of IDs
+            batch_size: Maximum number of IDs per request
+            concurrency: Maximum number of batch requests in flight
+            on_progress: Called with running stats after each batch
+            max_batch_retries: Extra attempts for each failed batch
+            
+        Returns:
+            Counts of deleted and failed IDs, failed IDs and the last error
+            of each failed batch
+        """
+        progress = _DeleteProgress(on_progress)
+        await self._run_batches(
+            lambda batch: self._delete_batch(index_name, batch),
+            _anumbered(_aiter_batches(ids if hasattr(ids, '__aiter__') else iter(ids), batch_size)),
+            concurrency, max_batch_retries, progress
+        )
+        return progress.stats()
+
+    async def search_vector(
+        self,
+        index_name: str,
+        vector: Union[List[float], Any],
+        options: Optional[Dict[str, Any]] = None
+    ) -> List[SearchVectorMatch]:
+        """
+        Search for similar vectors
+        
+        Args:
+            index_name: Name of the index
+            vector: Query vector, as a float list, numpy array or float32 buffer
+            options: Search, consistency and encoding options. With `filter`
+                or `rerank`, `candidates` matches are fetched (default
+                4 * top_k), filtered on their metadata, reranked using their
+                vectors and trimmed to top_k
+            
+        Returns:
+            List of matched vectors with similarity scores
+        """
+        options = options or {}
+        consistency = options.get('consistency', {})
+        max_retries = consistency.get('max_retries', 1)
+        retry_delay = consistency.get('retry_delay', 0) / 1000  # Convert to seconds
+
+        replica = await self._local_replica(index_name)
+        if replica is not None:
+            return replica.search(decode_float32(vector), options)[0]
+
+        base64_values = self._use_base64(options.get('encoding', 'auto'), [vector])
+        as_array = is_array(vector)
+
+        for attempt in range(max_retries):
+            try:
+                with self._forget_on_missing(index_name):
+                    response = await self._post_vectors(
+                        self.endpoint(f'/indexes/{index_name}/search'),
+                        lambda base64_values: self._search_body(vector, options, base64_values),
+                        base64_values
+                    )
+
+                # If we have results, return them immediately
+                if response.get('results') and len(response['results']) > 0:
+                    return _refine_matches(_decode_matches(response['results'], as_array), vector, options)
+
+                # Only retry if we have no results and consistency is enabled
+                if not consistency.get('enabled'):
+                    return response.get('results', [])
+
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(retry_delay)
+
+            except Exception as e:
+                if attempt == max_retries - 1:
+                    raise e
+                await asyncio.sleep(retry_delay)
+
+        return []
+
+    async def enable_replica(
+        self,
+        index_name: str,
+        vectors: Optional[Iterable[Vector]] = None,
+        engine: str = 'brute_force',
+        check_interval: float = 5.0,
+        metric: Optional[str] = None,
+        **engine_options: Any
+    ) -> ReplicaStats:
+        """
+        Mirror an index locally and answer its searches in-process
+        
+        Args:
+            index_name: Name of the index
+            vectors: Current contents of the index, if it is not empty
+            engine: Local search engine, 'brute_force', 'ivf' or 'quantized'
+            check_interval: Seconds between vector count checks
+            metric: Scoring metric, if it differs from the index's reported one
+            **engine_options: Options for the engine
+            
+        Returns:
+            Replica counters; `stale` is False if the replica is in use
+        """
+        from ..vector.replica import IndexReplica
+
+        index = await self._fetch_index(index_name)
+        if not index:
+            raise NeuredgeError(f"Index {index_name} not found", 'INDEX_NOT_FOUND', 404)
+        replica = IndexReplica(
+            index_name, index['dimension'], metric or index.get('metric', 'cosine'),
+            engine, check_interval, **engine_options
+        )
+        self._replicas[index_name] = replica
+        return self._load_replica(replica, vectors, index)
+
+    async def sync_replica(self, index_name: str, vectors: Optional[Iterable[Vector]] = None) -> ReplicaStats:
+        """
+        Re-validate a replica, optionally reloading its contents
+        
+        Args:
+            index_name: Name of the index
+            vectors: Full current contents of the index; None keeps the local data
+            
+        Returns:
+            Replica counters; `stale` is False if the replica is in use
+        """
+        replica = self._replica(index_name)
+        return self._load_replica(replica, vectors, await self._fetch_index(index_name))
+
+    async def _local_replica(self, index_name: str):
+        """The replica to answer a search with, or None to ask the server"""
+        replica = self._replicas.get(index_name)
+        if replica is None:
+            return None
+        if replica.needs_check():
+            index = await self._fetch_index(index_name)
+            replica.observe_count(index.get('vector_count', 0) if index else None)
+        if replica.usable:
+            return replica
+        replica.count_fallback()
+        return None
+
+    async def search_vectors(
+        self,
+        index_name: str,
+        queries: Union[Iterable[List[float]], Any],
+        top_k: int = 10,
+        concurrency: int = 8,
+        options: Optional[Dict[str, Any]] = None
+    ) -> List[BatchItemResult[List[SearchVectorMatch]]]:
+        """
+        Search for many query vectors concurrently
+        
+        Args:
+            index_name: Name of the index
+            queries: Query vectors, or a 2-d numpy array with one query per row
+            top_k: Number of matches per query
+            concurrency: Maximum number of requests in flight
+            options: Search and encoding options, as for search_vector
+            
+        Returns:
+            One result per query, in query order; failed queries carry an
+            error instead of matches
+        """
+        options = {**(options or {}), 'top_k': top_k}
+        replica = await self._local_replica(index_name)
+        if replica is not None:
+            return replica.search_many(queries, options)
+        return await self._amap_concurrent(
+            lambda query: self.search_vector(index_name, query, options),
+            queries,
+            concurrency
+        )
@@ -1,12 +1,142 @@
-from typing import Optional, Dict, Any, TypeVar, Generic
+from typing import Optional, Dict, Any, TypeVar, Generic, Callable, Iterator
 import requests
+from requests.adapters import HTTPAdapter
 from dataclasses import dataclass
+import threading
 import time
 
-from .types import ClientConfig, NeuredgeError, ApiResponse
+from .types import ClientConfig, NeuredgeError, ApiResponse, PoolStats
+from .retry import RetryPolicy, parse_retry_after
+from .ratelimit import RateLimiter
+from .cache import CacheBackend, EmbeddingCache, make_cache_key
 
 T = TypeVar('T')
 
+# Accept header for requests that can take a raw image body instead of JSON
+BINARY_ACCEPT = 'image/*, application/octet-stream;q=0.9, application/json;q=0.8'
+
+# Bytes read from a streamed response body at a time
+STREAM_CHUNK_SIZE = 64 * 1024
+
+def _is_binary(content_type: Optional[str]) -> bool:
+    """Whether a Content-Type header denotes a raw binary body"""
+    media_type = (content_type or '').split(';')[0].strip().lower()
+    return media_type.startswith('image/') or media_type == 'application/octet-stream'
+
+def _error_from_response(
+    status_code: int,
+    json_response: Any,
+    headers: Optional[Any] = None
+) -> NeuredgeError:
+    """
+    Map a failed API response to a NeuredgeError
+    
+    Args:
+        status_code: HTTP status code of the response
+        json_response: Parsed JSON body, or None if the body was not JSON
+        headers: Response headers, used to read Retry-After
+        
+    Returns:
+        The error to raise
+    """
+    retry_after = parse_retry_after(headers.get('Retry-After')) if headers else None
+
+    if json_response is None:
+        # Map status codes to appropriate errors
+        if status_code == 401:
+            return NeuredgeError(
+                message='Invalid API key',
+                code='AUTHENTICATION_ERROR',
+                status_code=401
+            )
+        return NeuredgeError(
+            message=f"HTTP {status_code} error",
+            code='REQUEST_FAILED',
+            status_code=status_code,
+            retry_after=retry_after
+        )
+
+    error_data = json_response.get('error', {})
+    if isinstance(error_data, dict):
+        return NeuredgeError(
+            message=error_data.get('message', 'Unknown error'),
+            code=error_data.get('type', 'UNKNOWN_ERROR').upper(),
+            status_code=status_code,
+            details=error_data,
+            retry_after=retry_after
+        )
+    return NeuredgeError(
+        message=str(error_data),
+        code='REQUEST_FAILED',
+        status_code=status_code,
+        retry_after=retry_after
+    )
+
+def _deadline_from_timeout(timeout: Optional[float]) -> Optional[float]:
+    """Convert a timeout in seconds to a monotonic deadline"""
+    return time.monotonic() + timeout if timeout is not None else None
+
+def _remaining_budget(deadline: Optional[float]) -> Optional[float]:
+    """
+    Seconds left before the deadline
+    
+    Raises:
+        NeuredgeError: If the deadline has already passed
+    """
+    if deadline is None:
+        return None
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise NeuredgeError('Request deadline exceeded', 'TIMEOUT', 408)
+    return remaining
+
+def _min_timeout(limit: Optional[float], remaining: Optional[float]) -> Optional[float]:
+    """Tightest of a socket timeout and the remaining budget"""
+    if limit is None:
+        return remaining
+    if remaining is None:
+        return limit
+    return min(limit, remaining)
+
+class _PoolMonitor:
+    """Thread-safe counters used to report connection pool saturation"""
+
+    def __init__(self, max_connections: int, max_connections_per_host: int):
+        self._lock = threading.Lock()
+        self._max_connections = max_connections
+        self._max_connections_per_host = max_connections_per_host
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._total_requests = 0
+        self._saturated_requests = 0
+
+    def acquire(self):
+        """Record the start of a request"""
+        with self._lock:
+            # All core requests target one host, so the per-host limit is the bottleneck
+            if self._in_flight >= self._max_connections_per_host:
+                self._saturated_requests += 1
+            self._in_flight += 1
+            self._total_requests += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+    def release(self):
+        """Record the end of a request"""
+        with self._lock:
+            self._in_flight -= 1
+
+    def stats(self) -> PoolStats:
+        """Snapshot of the current counters"""
+        with self._lock:
+            return {
+                'max_connections': self._max_connections,
+                'max_connections_per_host': self._max_connections_per_host,
+                'in_flight': self._in_flight,
+                'peak_in_flight': self._peak_in_flight,
+                'total_requests': self._total_requests,
+                'saturated_requests': self._saturated_requests,
+            }
+
 class NeuredgeClient:
     """Main client for interacting with the Neuredge API"""
 
@@ -15,17 +145,49 @@ class NeuredgeClient:
         api_key: str,
         base_url: str = "https://api.neuredge.dev",
         max_retries: int = 3,
-        retry_delay: float = 1.0
+        retry_delay: float = 1.0,
+        retry_policy: Optional[RetryPolicy] = None,
+        max_connections: int = 100,
+        max_connections_per_host: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        connect_timeout: Optional[float] = 10.0,
+        read_timeout: Optional[float] = 60.0,
+        timeout: Optional[float] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[CacheBackend] = None,
+        embedding_cache: Optional[EmbeddingCache] = None
     ):
         self._api_key = api_key
         self._base_url = base_url.rstrip('/')
-        self._max_retries = max_retries
-        self._retry_delay = retry_delay
+        self._retry_policy = retry_policy or RetryPolicy(
+            max_retries=max_retries,
+            initial_delay=retry_delay
+        )
+        self._connect_timeout = connect_timeout
+        self._read_timeout = read_timeout
+        self._timeout = timeout
+        self._rate_limiter = rate_limiter
+        self._cache = cache
+        self._embedding_cache = embedding_cache
+        self._pool_monitor = _PoolMonitor(max_connections, max_connections_per_host)
         self._session = requests.Session()
         self._session.headers.update({
             "Authorization": f"Bearer {self._api_key}",
             "Content-Type": "application/json",
         })
+        if not keep_alive:
+            self._session.headers["Connection"] = "close"
+
+        # requests keeps one pool per host, so size the number of cached host
+        # pools from the overall connection budget
+        adapter = HTTPAdapter(
+            pool_connections=max(1, max_connections // max(1, max_connections_per_host)),
+            pool_maxsize=max_connections_per_host,
+            pool_block=pool_block
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
         # Initialize capabilities
         from .capabilities.text import TextCapabilities
@@ -46,64 +208,125 @@ class NeuredgeClient:
         """Get the base URL used by this client"""
         return self._base_url
 
-    def _handle_response(self, response: requests.Response) -> Any:
+    def get_embedding_cache(self) -> Optional[EmbeddingCache]:
+        """Get the embedding cache used by this client, if any"""
+        return self._embedding_cache
+
+    def pool_stats(self) -> PoolStats:
+        """
+        Get connection pool usage counters
+        
+        A growing `saturated_requests` count means requests are waiting on
+        (or overflowing) the per-host pool and `max_connections_per_host`
+        should be raised.
+        
+        Returns:
+            Pool limits plus in-flight, peak and saturation counters
+        """
+        return self._pool_monitor.stats()
+
+    def _handle_response(self, response: requests.Response, binary_response: bool = False) -> Any:
         """Handle API response and errors"""
+        if binary_response and response.ok and _is_binary(response.headers.get('Content-Type')):
+            return response.content
         try:
             json_response = response.json()
         except ValueError:
             if response.status_code >= 400:
-                # Map status codes to appropriate errors
-                if response.status_code == 401:
-                    raise NeuredgeError(
-                        message='Invalid API key',
-                        code='AUTHENTICATION_ERROR',
-                        status_code=401
-                    )
-                raise NeuredgeError(
-                    message=f"HTTP {response.status_code} error",
-                    code='REQUEST_FAILED',
-                    status_code=response.status_code
-                )
+                raise _error_from_response(response.status_code, None, response.headers)
             return response.content
 
         if not response.ok:
-            error_data = json_response.get('error', {})
-            if isinstance(error_data, dict):
-                raise NeuredgeError(
-                    message=error_data.get('message', 'Unknown error'),
-                    code=error_data.get('type', 'UNKNOWN_ERROR').upper(),
-                    status_code=response.status_code,
-                    details=error_data
-                )
-            raise NeuredgeError(
-                message=str(error_data),
-                code='REQUEST_FAILED',
-                status_code=response.status_code
-            )
+            raise _error_from_response(response.status_code, json_response, response.headers)
 
         return json_response
 
-    def _retry_request(self, method: str, *args, **kwargs) -> Any:
-        """Make a request with retries"""
+    def _retry_request(
+        self,
+        method: str,
+        *args,
+        timeout: Optional[float] = None,
+        idempotent: bool = True,
+        binary_response: bool = False,
+        consume: Optional[Callable[[Optional[str], Iterator[bytes]], Any]] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Make a request with retries
+        
+        The retry policy decides which failures are retried and for how
+        long to back off. The timeout is an overall budget: every attempt
+        and backoff sleep draws from it, and retries stop once it is spent.
+
+        With `consume`, a successful response body is streamed to it as
+        `consume(content_type, chunks)` inside the attempt, so a connection
+        dropped mid-body is retried like any other network error.
+        """
+        policy = self._retry_policy
+        deadline = _deadline_from_timeout(timeout if timeout is not None else self._timeout)
         last_error = None
-        for attempt in range(self._max_retries):
+        limiter = self._rate_limiter
+        for attempt in range(policy.max_retries):
+            if limiter:
+                limiter.acquire()
+            try:
+                # Time spent waiting on the rate limiter counts against the deadline
+                remaining = _remaining_budget(deadline)
+            except NeuredgeError:
+                if limiter:
+                    limiter.release()
+                raise
+            self._pool_monitor.acquire()
             try:
+                kwargs['timeout'] = (
+                    _min_timeout(self._connect_timeout, remaining),
+                    _min_timeout(self._read_timeout, remaining)
+                )
+                if consume is not None:
+                    kwargs['stream'] = True
                 response = getattr(self._session, method)(*args, **kwargs)
-                return self._handle_response(response)
+                if consume is not None and response.ok:
+                    try:
+                        result = consume(
+                            response.headers.get('Content-Type'),
+                            response.iter_content(STREAM_CHUNK_SIZE)
+                        )
+                    finally:
+                        response.close()
+                else:
+                    result = self._handle_response(response, binary_response)
+                if limiter:
+                    limiter.observe(response.headers, result)
+                return result
+            except requests.Timeout as e:
+                last_error = NeuredgeError(
+                    f"Request timed out: {str(e)}",
+                    'TIMEOUT',
+                    408
+                )
             except requests.RequestException as e:
                 last_error = NeuredgeError(
                     f"Network error: {str(e)}",
                     'NETWORK_ERROR'
                 )
             except NeuredgeError as e:
-                # Don't retry authentication or quota errors
-                if e.code in ['AUTHENTICATION_ERROR', 'QUOTA_EXCEEDED']:
-                    raise
+                if limiter:
+                    limiter.on_error(e)
                 last_error = e
-            
-            # Wait before retrying
-            if attempt < self._max_retries - 1:
-                time.sleep(self._retry_delay * (2 ** attempt))
+            finally:
+                self._pool_monitor.release()
+                if limiter:
+                    limiter.release()
+
+            if not policy.should_retry(last_error, idempotent):
+                raise last_error
+
+            # Wait before retrying, unless the backoff would outlive the deadline
+            if attempt < policy.max_retries - 1:
+                delay = policy.get_delay(attempt, last_error)
+                if deadline is not None and time.monotonic() + delay >= deadline:
+                    break
+                time.sleep(delay)
         
         raise last_error
 
@@ -111,7 +334,10 @@ class NeuredgeClient:
         self,
         endpoint: str,
         data: Dict[str, Any],
-        binary_response: bool = False
+        binary_response: bool = False,
+        timeout: Optional[float] = None,
+        idempotent: bool = True,
+        cacheable: bool = False
     ) -> Any:
         """
         Make a POST request to the API
@@ -119,31 +345,89 @@ class NeuredgeClient:
         Args:
             endpoint: API endpoint path
             data: Request body data
-            binary_response: Whether to expect a binary response
+            binary_response: Whether to accept a raw binary body, such as
+                image bytes, in place of JSON
+            timeout: Overall time budget in seconds across all retries
+                (defaults to the client timeout)
+            idempotent: Whether the request can safely be repeated after a
+                network error or server failure; pass False for
+                requests with side effects that must not run twice
+            cacheable: Whether the response is deterministic and may be
+                served from the client's response cache
+            
+        Returns:
+            Parsed response data, or bytes for a binary response
+        """
+        url = f"{self._base_url}{endpoint}"
+        cache = self._cache if cacheable else None
+        if cache is not None:
+            key = make_cache_key(url, data)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        response = self._retry_request(
+            'post', url, json=data, timeout=timeout, idempotent=idempotent,
+            binary_response=binary_response,
+            headers={'Accept': BINARY_ACCEPT} if binary_response else None
+        )
+        if cache is not None and isinstance(response, dict):
+            cache.set(key, response)
+        return response
+
+    def post_stream(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        consume: Callable[[Optional[str], Iterator[bytes]], Any],
+        timeout: Optional[float] = None,
+        idempotent: bool = True
+    ) -> Any:
+        """
+        Make a POST request and stream the response body instead of buffering it
+        
+        Args:
+            endpoint: API endpoint path
+            data: Request body data
+            consume: Called as `consume(content_type, chunks)` with the
+                successful response's Content-Type and an iterator of body
+                chunks; it runs once per attempt, so it must start over
+                cleanly if the request is retried
+            timeout: Overall time budget in seconds across all retries
+                (defaults to the client timeout)
+            idempotent: Whether the request can safely be repeated after a
+                network error or server failure; pass False for
+                requests with side effects that must not run twice
             
         Returns:
-            Parsed response data or binary data for images
+            Whatever `consume` returns
         """
         url = f"{self._base_url}{endpoint}"
-        return self._retry_request('post', url, json=data)
+        return self._retry_request(
+            'post', url, json=data, timeout=timeout, idempotent=idempotent,
+            headers={'Accept': BINARY_ACCEPT}, consume=consume
+        )
 
-    def get(self, endpoint: str) -> Any:
+    def get(self, endpoint: str, timeout: Optional[float] = None) -> Any:
         """
         Make a GET request to the API
         
         Args:
             endpoint: API endpoint path
+            timeout: Overall time budget in seconds across all retries
+                (defaults to the client timeout)
             
         Returns:
             Parsed response data
         """
         url = f"{self._base_url}{endpoint}"
-        return self._retry_request('get', url)
+        return self._retry_request('get', url, timeout=timeout)
 
     def delete(
         self,
         endpoint: str,
-        data: Optional[Dict[str, Any]] = None
+        data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
     ) -> Any:
         """
         Make a DELETE request to the API
@@ -151,12 +435,16 @@ class NeuredgeClient:
         Args:
             endpoint: API endpoint path
             data: Optional request body data
+            timeout: Overall time budget in seconds across all retries
+                (defaults to the client timeout)
             
         Returns:
             Parsed response data
         """
         url = f"{self._base_url}{endpoint}"
-        return self._retry_request('delete', url, json=data if data else None)
+        return self._retry_request(
+            'delete', url, json=data if data else None, timeout=timeout
+        )
 
     def close(self):
         """Close the requests session"""
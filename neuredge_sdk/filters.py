@@ -0,0 +1,130 @@
+from typing import Any, Callable, Dict, List, Optional
+
+from .types import NeuredgeError
+
+# Comparison operators usable on a metadata field
+FIELD_OPERATORS = ('$eq', '$ne', '$gt', '$gte', '$lt', '$lte', '$in', '$nin', '$exists')
+
+# Operators that combine whole sub-filters
+LOGICAL_OPERATORS = ('$and', '$or', '$not')
+
+Predicate = Callable[[Optional[Dict[str, Any]]], bool]
+
+_MISSING = object()
+
+def _invalid(message: str) -> NeuredgeError:
+    return NeuredgeError(f"Invalid filter: {message}", 'INVALID_REQUEST', 400)
+
+def _lookup(metadata: Optional[Dict[str, Any]], path: List[str]) -> Any:
+    """Field value at a dotted path, or _MISSING"""
+    value = metadata
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            return _MISSING
+        value = value[key]
+    return value
+
+def _compare(test: Callable[[Any], bool]) -> Callable[[Any], bool]:
+    """Apply a test to a field value, or to any element of a list value"""
+    def check(value: Any) -> bool:
+        if value is _MISSING:
+            return False
+        try:
+            if isinstance(value, list):
+                return any(test(item) for item in value)
+            return test(value)
+        except TypeError:
+            # Values of incomparable types never match
+            return False
+    return check
+
+def _field_test(operator: str, operand: Any) -> Callable[[Any], bool]:
+    if operator == '$eq':
+        return _compare(lambda value: value == operand)
+    if operator == '$ne':
+        equal = _field_test('$eq', operand)
+        return lambda value: not equal(value)
+    if operator == '$gt':
+        return _compare(lambda value: value > operand)
+    if operator == '$gte':
+        return _compare(lambda value: value >= operand)
+    if operator == '$lt':
+        return _compare(lambda value: value < operand)
+    if operator == '$lte':
+        return _compare(lambda value: value <= operand)
+    if operator in ('$in', '$nin'):
+        if not isinstance(operand, (list, tuple, set, frozenset)):
+            raise _invalid(f"{operator} takes a list")
+        options = list(operand)
+        contained = _compare(lambda value: value in options)
+        return contained if operator == '$in' else lambda value: not contained(value)
+    if operator == '$exists':
+        return lambda value: (value is not _MISSING) == bool(operand)
+    raise _invalid(f"unknown operator {operator}; use one of {', '.join(FIELD_OPERATORS)}")
+
+def _compile_field(field: str, condition: Any) -> Predicate:
+    path = field.split('.')
+    if isinstance(condition, dict) and any(key.startswith('$') for key in condition):
+        tests = [_field_test(operator, operand) for operator, operand in condition.items()]
+    else:
+        # A bare value means equality
+        tests = [_field_test('$eq', condition)]
+
+    def predicate(metadata: Optional[Dict[str, Any]]) -> bool:
+        value = _lookup(metadata, path)
+        return all(test(value) for test in tests)
+    return predicate
+
+def compile_filter(expression: Dict[str, Any]) -> Predicate:
+    """
+    Compile a metadata filter expression into a predicate
+
+    Expressions follow the Vectorize/MongoDB style: `{"field": value}` tests
+    equality, `{"field": {"$gte": 2000}}` applies operators, dotted fields
+    reach into nested metadata, and `$and`, `$or` and `$not` combine
+    sub-filters. Operators on list-valued fields match if any element does.
+
+    Args:
+        expression: Filter expression
+
+    Returns:
+        Function taking a metadata dict (or None) and returning whether it matches
+
+    Raises:
+        NeuredgeError: If the expression is malformed
+    """
+    if not isinstance(expression, dict):
+        raise _invalid('expression must be a dict')
+
+    predicates = []
+    for key, condition in expression.items():
+        if key in ('$and', '$or'):
+            if not isinstance(condition, list) or not condition:
+                raise _invalid(f"{key} takes a non-empty list of filters")
+            parts = [compile_filter(part) for part in condition]
+            combine = all if key == '$and' else any
+            predicates.append(lambda metadata, parts=parts, combine=combine: combine(
+                part(metadata) for part in parts
+            ))
+        elif key == '$not':
+            inner = compile_filter(condition)
+            predicates.append(lambda metadata, inner=inner: not inner(metadata))
+        elif key.startswith('$'):
+            raise _invalid(f"unknown operator {key}; use one of {', '.join(LOGICAL_OPERATORS)}")
+        else:
+            predicates.append(_compile_field(key, condition))
+    return lambda metadata: all(predicate(metadata) for predicate in predicates)
+
+def filter_matches(matches: List[Dict[str, Any]], expression: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Keep the search matches whose metadata satisfies a filter
+
+    Args:
+        matches: Search matches carrying a `metadata` field
+        expression: Filter expression, as for compile_filter
+
+    Returns:
+        The matching subset, in the original order
+    """
+    predicate = compile_filter(expression)
+    return [match for match in matches if predicate(match.get('metadata'))]
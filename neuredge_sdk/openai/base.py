@@ -1,14 +1,18 @@
 from typing import Any, Optional
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI, APIStatusError
 from ..capabilities.base import BaseCapability
 from ..client import Client
+from ..types import NeuredgeError
 
 class OpenAICapability(BaseCapability):
     """Base class for OpenAI-compatible capabilities"""
 
+    # OpenAI SDK client class used for requests; async variants override this
+    _openai_class = OpenAI
+
     def __init__(self, client: Client):
         self._client = client
-        self._openai = OpenAI(
+        self._openai = self._openai_class(
             api_key=client.get_api_key(),
             base_url=client.get_base_url() + self.base_path
         )
@@ -20,6 +24,18 @@ class OpenAICapability(BaseCapability):
     def endpoint(self, path: str) -> str:
         return f"{self.base_path}{path}"
 
+    def _handle_error(self, error: Exception) -> NeuredgeError:
+        """Convert OpenAI SDK errors to NeuredgeError, keeping the HTTP status"""
+        if isinstance(error, APIStatusError):
+            body = error.body if isinstance(error.body, dict) else {}
+            return NeuredgeError(
+                error.message,
+                str(body.get('type') or 'API_ERROR').upper(),
+                error.status_code,
+                details=body
+            )
+        return super()._handle_error(error)
+
     def _format_openai_error(self, error_data: dict) -> str:
         """Format OpenAI-style error messages"""
         if 'error' in error_data:
@@ -28,3 +44,8 @@ class OpenAICapability(BaseCapability):
                 return error.get('message', str(error))
             return str(error)
         return str(error_data)
+
+class AsyncOpenAICapability(OpenAICapability):
+    """Base class for async OpenAI-compatible capabilities"""
+
+    _openai_class = AsyncOpenAI
@@ -1,6 +1,6 @@
-from typing import Dict, Any, Iterator, Optional, Union
+from typing import Dict, Any, Iterator, AsyncIterator, Optional, Union
 from openai.types.chat import ChatCompletion, ChatCompletionChunk
-from .base import OpenAICapability
+from .base import OpenAICapability, AsyncOpenAICapability
 
 # Map OpenAI models to our supported models
 MODEL_MAPPINGS = {
@@ -67,17 +67,66 @@ class ChatCompletions(OpenAICapability):
         for chunk in response:
             if not chunk.choices:
                 continue
-            yield {
-                "id": chunk.id,
-                "object": "chat.completion.chunk",
-                "created": chunk.created,
-                "model": chunk.model,
-                "choices": [{
-                    "index": choice.index,
-                    "delta": {
-                        "role": choice.delta.role if choice.delta.role else None,
-                        "content": choice.delta.content if choice.delta.content else None
-                    },
-                    "finish_reason": choice.finish_reason
-                } for choice in chunk.choices]
-            }
+            yield self._format_chunk(chunk)
+
+    def _format_chunk(self, chunk: ChatCompletionChunk) -> Dict[str, Any]:
+        """Format a single streaming chunk"""
+        return {
+            "id": chunk.id,
+            "object": "chat.completion.chunk",
+            "created": chunk.created,
+            "model": chunk.model,
+            "choices": [{
+                "index": choice.index,
+                "delta": {
+                    "role": choice.delta.role if choice.delta.role else None,
+                    "content": choice.delta.content if choice.delta.content else None
+                },
+                "finish_reason": choice.finish_reason
+            } for choice in chunk.choices]
+        }
+
+class AsyncChatCompletions(AsyncOpenAICapability, ChatCompletions):
+    """Async chat completions capability using OpenAI-compatible endpoints"""
+
+    async def create(
+        self,
+        messages: list[Dict[str, str]],
+        model: str = "gpt-3.5-turbo",
+        stream: bool = False,
+        **kwargs: Any
+    ) -> Union[Dict[str, Any], AsyncIterator[Dict[str, Any]]]:
+        """
+        Create a chat completion
+        
+        Args:
+            messages: List of chat messages in the conversation
+            model: Model to use for completion
+            stream: Whether to stream the response
+            **kwargs: Additional parameters
+            
+        Returns:
+            Chat completion response, or an async iterator of chunks when streaming
+        """
+        mapped_model = MODEL_MAPPINGS.get(model, model)
+
+        response = await self._openai.chat.completions.create(
+            messages=messages,
+            model=mapped_model,
+            stream=stream,
+            **kwargs
+        )
+
+        if not stream:
+            return self._format_completion(response)
+        return self._astream_completion(response)
+
+    async def _astream_completion(
+        self,
+        response: AsyncIterator[ChatCompletionChunk]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Format streaming completion responses"""
+        async for chunk in response:
+            if not chunk.choices:
+                continue
+            yield self._format_chunk(chunk)
@@ -1,6 +1,11 @@
-from typing import Dict, Any, Union, List
+from typing import Dict, Any, Union, List, Optional, Tuple, Callable
+import json
 from openai.types.create_embedding_response import CreateEmbeddingResponse
-from .base import OpenAICapability
+from .base import OpenAICapability, AsyncOpenAICapability
+from ..arrays import require_numpy, decode_float32, stack_float32
+from ..types import NeuredgeError, EmbeddingArrayResult
+from ..retry import DEFAULT_RETRY_STATUSES
+from ..cache import _off_loop
 
 # Map OpenAI embedding models to our models
 MODEL_MAPPINGS = {
@@ -8,6 +13,219 @@ MODEL_MAPPINGS = {
     'text-embedding-3-small': '@cf/baai/bge-base-en-v1.5',  # 768 dimensions
 }
 
+# Result formats for create(return_type=...)
+RETURN_TYPES = ('list', 'numpy')
+
+def _is_text_input(input: Any) -> bool:
+    """Whether the input is text (cacheable) rather than token ids"""
+    if isinstance(input, str):
+        return True
+    return isinstance(input, list) and len(input) > 0 and all(isinstance(i, str) for i in input)
+
+def _is_batch(input: Any) -> bool:
+    """Whether the input is a list of items (texts or token arrays) that can be batched"""
+    return isinstance(input, list) and len(input) > 0 and all(isinstance(i, (str, list)) for i in input)
+
+def _cache_namespace(mapped_model: str, kwargs: Dict[str, Any]) -> str:
+    """Cache namespace: the model plus any parameters that change the vectors"""
+    if not kwargs:
+        return mapped_model
+    return f"{mapped_model}:{json.dumps(kwargs, sort_keys=True, default=str)}"
+
+# Defaults for embed_many
+DEFAULT_BATCH_SIZE = 96
+DEFAULT_MAX_BATCH_TOKENS = 8000
+
+# Extra attempts for each batch that still fails after the client's own retries
+DEFAULT_BATCH_RETRIES = 2
+
+# Statuses meaning the batch was rejected as too large, so it is worth
+# splitting rather than failing outright
+SPLITTABLE_STATUSES = (413,)
+
+# Error text that marks a 400 as a batch-size rejection rather than a bad request
+TOO_LARGE_MESSAGES = ('too many tokens', 'too many inputs')
+
+def _estimate_tokens(item: Union[str, List[int]]) -> int:
+    """Rough token count: ~4 characters per token for text, exact for token ids"""
+    if isinstance(item, str):
+        return len(item) // 4 + 1
+    return len(item)
+
+def _split_batches(
+    items: List[Any],
+    batch_size: Optional[int],
+    max_batch_tokens: Optional[int]
+) -> List[List[Any]]:
+    """Split inputs into consecutive batches bounded by item count and estimated tokens"""
+    batches = []
+    current = []
+    tokens = 0
+    for item in items:
+        item_tokens = _estimate_tokens(item) if max_batch_tokens else 0
+        if current and (
+            (batch_size and len(current) >= batch_size)
+            or (max_batch_tokens and tokens + item_tokens > max_batch_tokens)
+        ):
+            batches.append(current)
+            current = []
+            tokens = 0
+        current.append(item)
+        tokens += item_tokens
+    if current:
+        batches.append(current)
+    return batches
+
+def _is_splittable(error: Exception, batch: List[Any]) -> bool:
+    """Whether a failed batch was rejected as too large and should be retried as two halves"""
+    if len(batch) < 2:
+        return False
+    status = getattr(error, 'status_code', None)
+    if status in SPLITTABLE_STATUSES:
+        return True
+    message = str(getattr(error, 'message', None) or error).lower()
+    return status == 400 and any(text in message for text in TOO_LARGE_MESSAGES)
+
+def _is_permanent(error: Exception) -> bool:
+    """Whether a failed batch was refused in a way that retrying cannot fix"""
+    status = getattr(error, 'status_code', None)
+    return status is not None and 400 <= status < 500 and status not in DEFAULT_RETRY_STATUSES
+
+def _index_ranges(indices: List[int]) -> List[Tuple[int, int]]:
+    """Collapse sorted indices into half-open (start, stop) ranges"""
+    ranges = []
+    for index in indices:
+        if ranges and ranges[-1][1] == index:
+            ranges[-1] = (ranges[-1][0], index + 1)
+        else:
+            ranges.append((index, index + 1))
+    return ranges
+
+def _batch_failure(
+    failed_indices: List[int],
+    errors: List[NeuredgeError],
+    embeddings: List[Optional[Any]]
+) -> NeuredgeError:
+    """
+    One error for all batches that failed every attempt
+
+    The details carry the failed input ranges, the per-batch errors and
+    the embeddings that did succeed (None for failed inputs), so the work
+    already paid for is not lost.
+    """
+    ranges = _index_ranges(failed_indices)
+    described = ', '.join(
+        str(start) if stop == start + 1 else f"{start}-{stop - 1}"
+        for start, stop in ranges
+    )
+    return NeuredgeError(
+        f"{len(errors)} embedding batch(es) failed for inputs {described}: {errors[0].message}",
+        'BATCH_FAILED',
+        errors[0].status_code,
+        details={
+            'failed_ranges': ranges,
+            'errors': errors,
+            'embeddings': embeddings,
+        }
+    )
+
+def _numbered_batches(
+    items: List[Any],
+    batch_size: Optional[int],
+    max_batch_tokens: Optional[int]
+) -> List[Tuple[int, List[Any]]]:
+    """Split inputs into batches paired with the input offset of their first item"""
+    numbered = []
+    start = 0
+    for batch in _split_batches(items, batch_size, max_batch_tokens):
+        numbered.append((start, batch))
+        start += len(batch)
+    return numbered
+
+def _failure_from_batches(
+    failed: List[Tuple[int, List[Any], NeuredgeError]],
+    results: Dict[int, Dict[str, Any]],
+    total: int
+) -> NeuredgeError:
+    """Aggregate error for the batches of one _embed call that never succeeded"""
+    embeddings = [None] * total
+    for start, result in results.items():
+        for offset, item in enumerate(result["data"]):
+            embeddings[start + offset] = item["embedding"]
+    failed = sorted(failed, key=lambda entry: entry[0])
+    failed_indices = [
+        index
+        for start, batch, _ in failed
+        for index in range(start, start + len(batch))
+    ]
+    return _batch_failure(failed_indices, [error for _, _, error in failed], embeddings)
+
+def _remap_failure(
+    error: NeuredgeError,
+    texts: List[str],
+    vectors: List[Optional[Any]],
+    missing: List[str]
+) -> NeuredgeError:
+    """Restate a failure over the cache misses in terms of the caller's input"""
+    by_text = {}
+    failed = set()
+    for text, vector in zip(missing, error.details['embeddings']):
+        if vector is None:
+            failed.add(text)
+        else:
+            by_text[text] = vector
+    embeddings = [
+        vector if vector is not None else by_text.get(text)
+        for text, vector in zip(texts, vectors)
+    ]
+    failed_indices = [
+        index for index, text in enumerate(texts)
+        if vectors[index] is None and text in failed
+    ]
+    return _batch_failure(failed_indices, error.details['errors'], embeddings)
+
+def _fetched_vector(embedding: Any) -> Any:
+    """A response embedding in a form the embedding cache can store"""
+    return decode_float32(embedding) if isinstance(embedding, str) else embedding
+
+def _store_batch(cache: Any, namespace: str, texts: List[str], response: Dict[str, Any]):
+    """Cache the embeddings of one successful request"""
+    cache.set_many(namespace, texts, [_fetched_vector(item["embedding"]) for item in response["data"]])
+
+def _merge_batches(results: List[Dict[str, Any]], mapped_model: str) -> Dict[str, Any]:
+    """Concatenate batch responses in order and sum their usage"""
+    usage = {"prompt_tokens": 0, "total_tokens": 0}
+    for result in results:
+        for key in usage:
+            usage[key] += result["usage"].get(key) or 0
+    return {
+        "data": [item for result in results for item in result["data"]],
+        "model": results[0]["model"] if results else mapped_model,
+        "usage": usage
+    }
+
+def _check_return_type(return_type: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate return_type and build the request parameters for it"""
+    if return_type not in RETURN_TYPES:
+        raise NeuredgeError(
+            f"return_type must be one of {', '.join(RETURN_TYPES)}",
+            'INVALID_REQUEST',
+            400
+        )
+    if return_type == 'numpy':
+        require_numpy()
+        # Packed float32 decodes straight into the array, skipping JSON floats
+        return {'encoding_format': 'base64', **kwargs}
+    return kwargs
+
+def _as_array_result(response: Dict[str, Any]) -> EmbeddingArrayResult:
+    """Decode a formatted response into one (n, dim) float32 array"""
+    return {
+        "embeddings": stack_float32([item["embedding"] for item in response["data"]]),
+        "model": response["model"],
+        "usage": response["usage"]
+    }
+
 class Embeddings(OpenAICapability):
     """Embeddings capability using OpenAI-compatible endpoints"""
 
@@ -15,34 +233,405 @@ class Embeddings(OpenAICapability):
         self,
         input: Union[str, List[str], List[int], List[List[int]]],
         model: str = "text-embedding-ada-002",
+        batch_size: Optional[int] = None,
+        concurrency: int = 4,
+        max_batch_tokens: Optional[int] = None,
+        return_type: str = "list",
+        max_batch_retries: int = DEFAULT_BATCH_RETRIES,
         **kwargs: Any
-    ) -> Dict[str, Any]:
+    ) -> Union[Dict[str, Any], EmbeddingArrayResult]:
         """
         Create embeddings for the given input
         
         Args:
             input: Text or array of text/tokens to embed
             model: Model to use for embeddings
+            batch_size: Split a list of texts or token arrays into requests of at
+                most this many items; a single token array is sent whole
+            concurrency: Maximum number of batch requests in flight
+            max_batch_tokens: Also cap each request at this many estimated tokens
+            return_type: "list" for lists of floats, or "numpy" for a single
+                (n, dim) float32 array under "embeddings" (requires numpy)
+            max_batch_retries: Extra attempts for each failed batch
             **kwargs: Additional parameters
             
         Returns:
             Response containing the generated embeddings
+            
+        Raises:
+            NeuredgeError: BATCH_FAILED if some batches failed every attempt;
+                its details name the failed input ranges and hold the
+                embeddings that succeeded, which are also cached; a batch
+                refused with a 4xx that retrying cannot fix raises that
+                error at once
         """
         # Map OpenAI model to our model
         mapped_model = MODEL_MAPPINGS.get(model, model)
+        batching = (batch_size, concurrency, max_batch_tokens, max_batch_retries)
+        as_array = return_type == 'numpy'
+        params = _check_return_type(return_type, kwargs)
+
+        cache = self._client.get_embedding_cache()
+        if cache is not None and _is_text_input(input) and 'encoding_format' not in kwargs:
+            texts = [input] if isinstance(input, str) else input
+            namespace = _cache_namespace(mapped_model, kwargs)
+            vectors, missing = self._lookup_cached(cache, namespace, texts, as_array)
+            response = None
+            if missing:
+                # Only the misses go to the API; each batch is cached as it lands
+                try:
+                    response = self._embed(
+                        missing, mapped_model, params, *batching,
+                        on_batch=lambda batch, result: _store_batch(cache, namespace, batch, result)
+                    )
+                except NeuredgeError as e:
+                    if e.code != 'BATCH_FAILED':
+                        raise
+                    raise _remap_failure(e, texts, vectors, missing)
+            response = self._stitch_cached(texts, vectors, missing, response, mapped_model)
+        else:
+            response = self._embed(input, mapped_model, params, *batching)
+
+        return _as_array_result(response) if as_array else response
+
+    def embed_many(
+        self,
+        input: Union[List[str], List[List[int]]],
+        model: str = "text-embedding-ada-002",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        concurrency: int = 4,
+        max_batch_tokens: Optional[int] = DEFAULT_MAX_BATCH_TOKENS,
+        return_type: str = "list",
+        max_batch_retries: int = DEFAULT_BATCH_RETRIES,
+        **kwargs: Any
+    ) -> Union[Dict[str, Any], EmbeddingArrayResult]:
+        """
+        Embed a large list of inputs in concurrent, size-bounded batches
         
-        response = self._openai.embeddings.create(
-            input=input,
-            model=mapped_model,
+        Inputs are split by item count and by an estimated token budget,
+        batches run concurrently, a batch the server rejects as too large is
+        retried as two halves on its own, batches that fail transiently are
+        retried in later rounds, and embeddings are returned in input order.
+        Any other 4xx, e.g. an unknown model, is raised at once.
+        
+        Args:
+            input: Texts or token arrays to embed
+            model: Model to use for embeddings
+            batch_size: Maximum number of items per request
+            concurrency: Maximum number of batch requests in flight
+            max_batch_tokens: Maximum estimated tokens per request
+            return_type: "list" or "numpy", as for create
+            max_batch_retries: Extra attempts for each failed batch
+            **kwargs: Additional parameters
+            
+        Returns:
+            Response containing one embedding per input, in order
+            
+        Raises:
+            NeuredgeError: BATCH_FAILED if some batches failed every attempt,
+                as for create
+        """
+        return self.create(
+            input,
+            model=model,
+            batch_size=batch_size,
+            concurrency=concurrency,
+            max_batch_tokens=max_batch_tokens,
+            return_type=return_type,
+            max_batch_retries=max_batch_retries,
             **kwargs
         )
+
+    def _embed(
+        self,
+        input: Any,
+        mapped_model: str,
+        kwargs: Dict[str, Any],
+        batch_size: Optional[int],
+        concurrency: int,
+        max_batch_tokens: Optional[int],
+        max_batch_retries: int = DEFAULT_BATCH_RETRIES,
+        on_batch: Optional[Callable[[List[Any], Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Send input in one request, or in concurrent batches when batching is enabled
         
-        # Convert OpenAI response to compatible format
+        Batches that fail are retried in later rounds, up to
+        `max_batch_retries` extra times, unless the server refused them
+        with a 4xx that retrying cannot fix; `on_batch` is called with each
+        successful batch and its response as soon as it lands.
+        """
+        if not _is_batch(input) or not (batch_size or max_batch_tokens):
+            response = self._format_response(self._openai.embeddings.create(
+                input=input,
+                model=mapped_model,
+                **kwargs
+            ))
+            if on_batch:
+                on_batch(input, response)
+            return response
+
+        pending = _numbered_batches(input, batch_size, max_batch_tokens)
+        results = {}
+        for _ in range(max(0, max_batch_retries) + 1):
+            failed = []
+            for item in self._map_concurrent(
+                lambda numbered: self._embed_batch(numbered[1], mapped_model, kwargs),
+                pending,
+                concurrency
+            ):
+                start, batch = pending[item['index']]
+                if item['error'] is not None:
+                    if _is_permanent(item['error']):
+                        # A bad request fails the same way on every attempt
+                        raise item['error']
+                    failed.append((start, batch, item['error']))
+                    continue
+                results[start] = item['result']
+                if on_batch:
+                    on_batch(batch, item['result'])
+            if not failed:
+                return _merge_batches([results[start] for start in sorted(results)], mapped_model)
+            pending = [(start, batch) for start, batch, _ in failed]
+        raise _failure_from_batches(failed, results, len(input))
+
+    def _embed_batch(self, batch: List[Any], mapped_model: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Embed one batch, splitting it in half if the server rejects it"""
+        try:
+            return self._format_response(self._openai.embeddings.create(
+                input=batch,
+                model=mapped_model,
+                **kwargs
+            ))
+        except Exception as e:
+            if not _is_splittable(e, batch):
+                raise
+        middle = len(batch) // 2
+        return _merge_batches([
+            self._embed_batch(batch[:middle], mapped_model, kwargs),
+            self._embed_batch(batch[middle:], mapped_model, kwargs)
+        ], mapped_model)
+
+    def _lookup_cached(
+        self,
+        cache: Any,
+        namespace: str,
+        texts: List[str],
+        packed: bool = False
+    ) -> Tuple[List[Optional[Any]], List[str]]:
+        """Fetch cached vectors, returning them with the unique texts still missing"""
+        # Packed float32 blobs skip the float list round trip for array results
+        vectors = cache.get_blobs(namespace, texts) if packed else cache.get_many(namespace, texts)
+        missing = list(dict.fromkeys(
+            text for text, vector in zip(texts, vectors) if vector is None
+        ))
+        return vectors, missing
+
+    def _stitch_cached(
+        self,
+        texts: List[str],
+        vectors: List[Optional[Any]],
+        missing: List[str],
+        response: Optional[Dict[str, Any]],
+        mapped_model: str
+    ) -> Dict[str, Any]:
+        """Merge freshly embedded misses with the hits in input order"""
+        usage = {"prompt_tokens": 0, "total_tokens": 0}
+        model = mapped_model
+        if response is not None:
+            fetched = [_fetched_vector(item["embedding"]) for item in response["data"]]
+            by_text = dict(zip(missing, fetched))
+            vectors = [
+                vector if vector is not None else by_text[text]
+                for text, vector in zip(texts, vectors)
+            ]
+            model = response["model"]
+            usage = response["usage"] or usage
+        return {
+            "data": [{"embedding": vector} for vector in vectors],
+            "model": model,
+            "usage": usage
+        }
+
+    def _format_response(self, response: CreateEmbeddingResponse) -> Dict[str, Any]:
+        """Convert OpenAI response to compatible format"""
         return {
             "data": [
                 {"embedding": embedding.embedding} 
-                for embedding in response.data
+                for embedding in sorted(response.data, key=lambda e: e.index)
             ],
             "model": response.model,
             "usage": response.usage.dict() if response.usage else {}
         }
+
+class AsyncEmbeddings(AsyncOpenAICapability, Embeddings):
+    """Async embeddings capability using OpenAI-compatible endpoints"""
+
+    async def create(
+        self,
+        input: Union[str, List[str], List[int], List[List[int]]],
+        model: str = "text-embedding-ada-002",
+        batch_size: Optional[int] = None,
+        concurrency: int = 4,
+        max_batch_tokens: Optional[int] = None,
+        return_type: str = "list",
+        max_batch_retries: int = DEFAULT_BATCH_RETRIES,
+        **kwargs: Any
+    ) -> Union[Dict[str, Any], EmbeddingArrayResult]:
+        """
+        Create embeddings for the given input
+        
+        Args:
+            input: Text or array of text/tokens to embed
+            model: Model to use for embeddings
+            batch_size: Split a list of texts or token arrays into requests of at
+                most this many items; a single token array is sent whole
+            concurrency: Maximum number of batch requests in flight
+            max_batch_tokens: Also cap each request at this many estimated tokens
+            return_type: "list" for lists of floats, or "numpy" for a single
+                (n, dim) float32 array under "embeddings" (requires numpy)
+            max_batch_retries: Extra attempts for each failed batch
+            **kwargs: Additional parameters
+            
+        Returns:
+            Response containing the generated embeddings
+            
+        Raises:
+            NeuredgeError: BATCH_FAILED if some batches failed every attempt;
+                its details name the failed input ranges and hold the
+                embeddings that succeeded, which are also cached; a batch
+                refused with a 4xx that retrying cannot fix raises that
+                error at once
+        """
+        mapped_model = MODEL_MAPPINGS.get(model, model)
+        batching = (batch_size, concurrency, max_batch_tokens, max_batch_retries)
+        as_array = return_type == 'numpy'
+        params = _check_return_type(return_type, kwargs)
+
+        cache = self._client.get_embedding_cache()
+        if cache is not None and _is_text_input(input) and 'encoding_format' not in kwargs:
+            texts = [input] if isinstance(input, str) else input
+            namespace = _cache_namespace(mapped_model, kwargs)
+            # The cache is SQLite, so its lookups and writes run off the event loop
+            vectors, missing = await _off_loop(self._lookup_cached, cache, namespace, texts, as_array)
+            response = None
+            if missing:
+                try:
+                    response = await self._embed(
+                        missing, mapped_model, params, *batching,
+                        on_batch=lambda batch, result: _store_batch(cache, namespace, batch, result)
+                    )
+                except NeuredgeError as e:
+                    if e.code != 'BATCH_FAILED':
+                        raise
+                    raise _remap_failure(e, texts, vectors, missing)
+            response = self._stitch_cached(texts, vectors, missing, response, mapped_model)
+        else:
+            response = await self._embed(input, mapped_model, params, *batching)
+
+        return _as_array_result(response) if as_array else response
+
+    async def embed_many(
+        self,
+        input: Union[List[str], List[List[int]]],
+        model: str = "text-embedding-ada-002",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        concurrency: int = 4,
+        max_batch_tokens: Optional[int] = DEFAULT_MAX_BATCH_TOKENS,
+        return_type: str = "list",
+        max_batch_retries: int = DEFAULT_BATCH_RETRIES,
+        **kwargs: Any
+    ) -> Union[Dict[str, Any], EmbeddingArrayResult]:
+        """
+        Embed a large list of inputs in concurrent, size-bounded batches
+        
+        Args:
+            input: Texts or token arrays to embed
+            model: Model to use for embeddings
+            batch_size: Maximum number of items per request
+            concurrency: Maximum number of batch requests in flight
+            max_batch_tokens: Maximum estimated tokens per request
+            return_type: "list" or "numpy", as for create
+            max_batch_retries: Extra attempts for each failed batch
+            **kwargs: Additional parameters
+            
+        Returns:
+            Response containing one embedding per input, in order
+            
+        Raises:
+            NeuredgeError: BATCH_FAILED if some batches failed every attempt,
+                as for create
+        """
+        return await self.create(
+            input,
+            model=model,
+            batch_size=batch_size,
+            concurrency=concurrency,
+            max_batch_tokens=max_batch_tokens,
+            return_type=return_type,
+            max_batch_retries=max_batch_retries,
+            **kwargs
+        )
+
+    async def _embed(
+        self,
+        input: Any,
+        mapped_model: str,
+        kwargs: Dict[str, Any],
+        batch_size: Optional[int],
+        concurrency: int,
+        max_batch_tokens: Optional[int],
+        max_batch_retries: int = DEFAULT_BATCH_RETRIES,
+        on_batch: Optional[Callable[[List[Any], Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """Send input in one request, or in concurrent batches when batching is enabled"""
+        if not _is_batch(input) or not (batch_size or max_batch_tokens):
+            response = self._format_response(await self._openai.embeddings.create(
+                input=input,
+                model=mapped_model,
+                **kwargs
+            ))
+            if on_batch:
+                await _off_loop(on_batch, input, response)
+            return response
+
+        pending = _numbered_batches(input, batch_size, max_batch_tokens)
+        results = {}
+        for _ in range(max(0, max_batch_retries) + 1):
+            failed = []
+            for item in await self._amap_concurrent(
+                lambda numbered: self._embed_batch(numbered[1], mapped_model, kwargs),
+                pending,
+                concurrency
+            ):
+                start, batch = pending[item['index']]
+                if item['error'] is not None:
+                    if _is_permanent(item['error']):
+                        # A bad request fails the same way on every attempt
+                        raise item['error']
+                    failed.append((start, batch, item['error']))
+                    continue
+                results[start] = item['result']
+                if on_batch:
+                    await _off_loop(on_batch, batch, item['result'])
+            if not failed:
+                return _merge_batches([results[start] for start in sorted(results)], mapped_model)
+            pending = [(start, batch) for start, batch, _ in failed]
+        raise _failure_from_batches(failed, results, len(input))
+
+    async def _embed_batch(self, batch: List[Any], mapped_model: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Embed one batch, splitting it in half if the server rejects it"""
+        try:
+            return self._format_response(await self._openai.embeddings.create(
+                input=batch,
+                model=mapped_model,
+                **kwargs
+            ))
+        except Exception as e:
+            if not _is_splittable(e, batch):
+                raise
+        middle = len(batch) // 2
+        return _merge_batches([
+            await self._embed_batch(batch[:middle], mapped_model, kwargs),
+            await self._embed_batch(batch[middle:], mapped_model, kwargs)
+        ], mapped_model)
@@ -1,7 +1,7 @@
 from typing import Any
-from .base import OpenAICapability
-from .completions import ChatCompletions
-from .embeddings import Embeddings
+from .base import OpenAICapability, AsyncOpenAICapability
+from .completions import ChatCompletions, AsyncChatCompletions
+from .embeddings import Embeddings, AsyncEmbeddings
 
 class OpenAINamespace(OpenAICapability):
     """
@@ -22,3 +22,16 @@ class OpenAINamespace(OpenAICapability):
     def chat(self) -> ChatCompletions:
         """Access to chat completion endpoints"""
         return self._chat
+
+class AsyncOpenAINamespace(AsyncOpenAICapability, OpenAINamespace):
+    """Async OpenAI-compatible API namespace"""
+
+    def __init__(self, client: Any):
+        AsyncOpenAICapability.__init__(self, client)
+        self._chat = AsyncChatCompletions(client)
+        self.embeddings = AsyncEmbeddings(client)
+
+    @property
+    def chat(self) -> AsyncChatCompletions:
+        """Access to chat completion endpoints"""
+        return self._chat
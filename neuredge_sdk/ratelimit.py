@@ -0,0 +1,213 @@
+from typing import Optional, Dict, Any, Mapping
+import asyncio
+import threading
+import time
+
+from .types import NeuredgeError, ApiQuota
+
+class RateLimiter:
+    """
+    Client-side token bucket and in-flight limit shared by all requests of a client
+
+    The bucket starts at `requests_per_second` and adapts to the server:
+    throttling responses (429) halve the rate and pause until Retry-After,
+    successful responses grow it back additively, rate-limit headers pause
+    the bucket until the window resets, and an exhausted quota fails fast
+    locally instead of sending requests that are bound to be rejected.
+
+    Example:
+        ```python
+        from neuredge_sdk import Neuredge, RateLimiter
+
+        client = Neuredge(
+            api_key="your-api-key",
+            rate_limiter=RateLimiter(requests_per_second=20, max_in_flight=32)
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        adaptive: bool = True,
+        min_rate: float = 0.5,
+        quota_cooldown: float = 60.0,
+        max_pause: float = 30.0
+    ):
+        """
+        Args:
+            requests_per_second: Sustained request rate, or None for no rate limit
+            burst: Bucket capacity (defaults to one second of requests)
+            max_in_flight: Maximum concurrent requests, or None for no limit
+            adaptive: Whether to adjust the rate from server feedback
+            min_rate: Lowest rate the adaptive mode backs off to
+            quota_cooldown: Seconds to fail fast after the quota is exhausted
+                before probing the server again
+            max_pause: Upper bound for any pause requested by Retry-After or
+                rate-limit reset headers
+        """
+        self._max_rate = requests_per_second
+        self._rate = requests_per_second
+        self._capacity = float(burst or max(1.0, requests_per_second or 1.0))
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._adaptive = adaptive
+        self._min_rate = min_rate
+        self._quota_cooldown = quota_cooldown
+        self._max_pause = max_pause
+        self._lock = threading.Lock()
+
+        self._max_in_flight = max_in_flight
+        self._semaphore = threading.BoundedSemaphore(max_in_flight) if max_in_flight else None
+        # Created on first use inside the event loop
+        self._async_semaphore: Optional[asyncio.Semaphore] = None
+
+        self._paused_until = 0.0
+        self._quota_exhausted_until = 0.0
+        self._quota: Optional[ApiQuota] = None
+        self._throttled = 0
+
+    def _reserve(self) -> float:
+        """Take a token, returning how long the caller must wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._quota_exhausted_until:
+                raise NeuredgeError(
+                    'Quota exhausted; request not sent',
+                    'QUOTA_EXCEEDED',
+                    429
+                )
+            wait = max(0.0, self._paused_until - now)
+            if self._rate:
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._last_refill) * self._rate
+                )
+                self._last_refill = now
+                # Tokens may go negative: later callers queue behind this one
+                self._tokens -= 1
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens / self._rate)
+            return wait
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        if self._semaphore:
+            self._semaphore.acquire()
+        try:
+            wait = self._reserve()
+            if wait > 0:
+                time.sleep(wait)
+        except BaseException:
+            self.release()
+            raise
+
+    def release(self):
+        """Mark a request started with acquire() as finished"""
+        if self._semaphore:
+            self._semaphore.release()
+
+    async def acquire_async(self):
+        """Wait until a request may be sent"""
+        if self._max_in_flight:
+            if self._async_semaphore is None:
+                self._async_semaphore = asyncio.Semaphore(self._max_in_flight)
+            await self._async_semaphore.acquire()
+        try:
+            wait = self._reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+        except BaseException:
+            # Includes cancellation while waiting for a token
+            self.release_async()
+            raise
+
+    def release_async(self):
+        """Mark a request started with acquire_async() as finished"""
+        if self._async_semaphore:
+            self._async_semaphore.release()
+
+    def observe(self, headers: Optional[Mapping[str, str]], payload: Any):
+        """
+        Adapt to a successful response
+
+        Args:
+            headers: Response headers, checked for X-RateLimit-* values
+            payload: Parsed response body, checked for quota information
+        """
+        quota = _extract_quota(payload)
+        with self._lock:
+            now = time.monotonic()
+            if quota is not None:
+                self._quota = quota
+                if quota.get('remaining', 1) <= 0:
+                    self._quota_exhausted_until = now + self._quota_cooldown
+
+            remaining = _header_number(headers, 'X-RateLimit-Remaining')
+            reset = _header_number(headers, 'X-RateLimit-Reset')
+            if remaining is not None and remaining <= 0 and reset is not None:
+                # Reset is either an epoch timestamp or seconds from now
+                delay = reset - time.time() if reset > 1e9 else reset
+                delay = min(max(0.0, delay), self._max_pause)
+                self._paused_until = max(self._paused_until, now + delay)
+
+            if self._adaptive and self._rate and self._rate < self._max_rate:
+                self._rate = min(self._max_rate, self._rate + self._max_rate * 0.05)
+
+    def on_error(self, error: NeuredgeError):
+        """
+        Adapt to a failed response
+
+        Args:
+            error: The error raised for the request
+        """
+        with self._lock:
+            now = time.monotonic()
+            if error.code == 'QUOTA_EXCEEDED':
+                self._quota_exhausted_until = now + self._quota_cooldown
+                return
+            if error.status_code != 429:
+                return
+            self._throttled += 1
+            if error.retry_after is not None:
+                delay = min(error.retry_after, self._max_pause)
+                self._paused_until = max(self._paused_until, now + delay)
+            if self._adaptive and self._rate:
+                self._rate = max(self._min_rate, self._rate / 2)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of the limiter state
+
+        Returns:
+            Current and configured rate, throttle count and last seen quota
+        """
+        with self._lock:
+            return {
+                'rate': self._rate,
+                'max_rate': self._max_rate,
+                'max_in_flight': self._max_in_flight,
+                'throttled': self._throttled,
+                'paused_for': max(0.0, self._paused_until - time.monotonic()),
+                'quota': self._quota,
+            }
+
+def _extract_quota(payload: Any) -> Optional[ApiQuota]:
+    """Find quota information in a response body"""
+    if not isinstance(payload, dict):
+        return None
+    quota = payload.get('quota')
+    if quota is None and isinstance(payload.get('data'), dict):
+        quota = payload['data'].get('quota')
+    return quota if isinstance(quota, dict) else None
+
+def _header_number(headers: Optional[Mapping[str, str]], name: str) -> Optional[float]:
+    """Read a numeric header, ignoring missing or malformed values"""
+    if not headers or headers.get(name) is None:
+        return None
+    try:
+        return float(headers[name])
+    except ValueError:
+        return None
@@ -0,0 +1,128 @@
+from typing import Optional, Iterable
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+import random
+
+from .types import NeuredgeError
+
+# Errors that are never worth retrying
+NON_RETRYABLE_CODES = ('AUTHENTICATION_ERROR', 'QUOTA_EXCEEDED')
+
+# Errors raised before a response was received
+TRANSPORT_ERROR_CODES = ('NETWORK_ERROR', 'TIMEOUT')
+
+# Statuses that indicate a transient server-side failure
+DEFAULT_RETRY_STATUSES = (408, 425, 429, 500, 502, 503, 504)
+
+# Statuses where the server refused the request without processing it,
+# so even non-idempotent requests can be sent again
+DEFAULT_SAFE_STATUSES = (429, 503)
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+class RetryPolicy:
+    """
+    Decides which failed requests are retried and how long to wait in between
+
+    Delays use capped exponential backoff with full jitter, so clients that
+    fail together do not retry in lockstep. A server-provided Retry-After
+    takes precedence over the computed delay.
+
+    Example:
+        ```python
+        from neuredge_sdk import Neuredge, RetryPolicy
+
+        client = Neuredge(
+            api_key="your-api-key",
+            retry_policy=RetryPolicy(max_retries=5, max_delay=10.0)
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        initial_delay: float = 1.0,
+        max_delay: float = 30.0,
+        jitter: bool = True,
+        respect_retry_after: bool = True,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        safe_statuses: Iterable[int] = DEFAULT_SAFE_STATUSES
+    ):
+        """
+        Args:
+            max_retries: Total number of attempts per request
+            initial_delay: Backoff base in seconds
+            max_delay: Upper bound for any single wait, including Retry-After
+            jitter: Whether to randomize delays between 0 and the backoff cap
+            respect_retry_after: Whether to honor Retry-After headers
+            retry_statuses: Statuses retried for idempotent requests
+            safe_statuses: Statuses retried for any request
+        """
+        self.max_retries = max_retries
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.retry_statuses = frozenset(retry_statuses)
+        self.safe_statuses = frozenset(safe_statuses)
+
+    def should_retry(self, error: NeuredgeError, idempotent: bool = True) -> bool:
+        """
+        Whether a failed attempt should be retried
+
+        Args:
+            error: The error raised by the attempt
+            idempotent: Whether repeating the request is free of side effects
+
+        Returns:
+            True if the request should be sent again
+        """
+        if error.code in NON_RETRYABLE_CODES:
+            return False
+        if error.code in TRANSPORT_ERROR_CODES:
+            # The request may have reached the server before the failure
+            return idempotent
+        if error.status_code in self.safe_statuses:
+            return True
+        return idempotent and error.status_code in self.retry_statuses
+
+    def get_delay(self, attempt: int, error: Optional[NeuredgeError] = None) -> float:
+        """
+        Seconds to wait before the next attempt
+
+        Args:
+            attempt: Zero-based index of the attempt that just failed
+            error: The error raised by the attempt
+
+        Returns:
+            The delay in seconds
+        """
+        if self.respect_retry_after and error is not None and error.retry_after is not None:
+            return min(error.retry_after, self.max_delay)
+        cap = min(self.max_delay, self.initial_delay * (2 ** attempt))
+        if self.jitter:
+            return random.uniform(0, cap)
+        return cap
@@ -0,0 +1,321 @@
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+import hashlib
+import json
+import logging
+import os
+import time
+
+from .types import Vector, SnapshotManifest, NeuredgeError
+from .arrays import pack_float32, require_numpy
+
+SNAPSHOT_FORMAT = 'neuredge-vectors'
+SNAPSHOT_VERSION = 1
+
+# Files inside a snapshot directory
+MANIFEST_FILE = 'manifest.json'
+VECTORS_FILE = 'vectors.f32'  # (count, dimension) little-endian float32, row-major
+RECORDS_FILE = 'records.jsonl'  # one {"id", "metadata"} object per row
+
+# Minimum seconds between import checkpoint writes
+CHECKPOINT_INTERVAL = 1.0
+
+logger = logging.getLogger(__name__)
+
+def _write_json(path: str, data: Dict[str, Any]):
+    """Replace a JSON file atomically, so a crash never leaves it half-written"""
+    staging = path + '.tmp'
+    with open(staging, 'w') as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(staging, path)
+
+def read_manifest(path: str) -> SnapshotManifest:
+    """
+    Read a snapshot's manifest
+
+    Args:
+        path: Snapshot directory
+
+    Returns:
+        The manifest
+
+    Raises:
+        NeuredgeError: If the directory is not a snapshot
+    """
+    try:
+        with open(os.path.join(path, MANIFEST_FILE)) as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        raise NeuredgeError(f"No vector snapshot at {path}", 'INVALID_REQUEST', 400)
+    if manifest.get('format') != SNAPSHOT_FORMAT or manifest.get('version') != SNAPSHOT_VERSION:
+        raise NeuredgeError(f"Unsupported snapshot format at {path}", 'INVALID_REQUEST', 400)
+    return manifest
+
+class SnapshotWriter:
+    """
+    Appends vectors to a snapshot directory
+
+    Vectors go to a raw float32 matrix that numpy can memory-map, and IDs
+    and metadata to a JSON-lines sidecar. `checkpoint` flushes both and
+    records how many rows and bytes are durable; resuming truncates
+    anything written after the last checkpoint.
+    """
+
+    def __init__(self, path: str, index: Dict[str, Any], resume: bool = False):
+        """
+        Args:
+            path: Snapshot directory, created if missing
+            index: Index description with name, dimension and metric
+            resume: Continue an incomplete snapshot instead of starting over
+        """
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self._manifest: SnapshotManifest = {
+            'format': SNAPSHOT_FORMAT,
+            'version': SNAPSHOT_VERSION,
+            'index': index['name'],
+            'dimension': index['dimension'],
+            'metric': index.get('metric', 'cosine'),
+            'count': 0,
+            'records_bytes': 0,
+            'complete': False,
+        }
+        if resume and os.path.exists(os.path.join(path, MANIFEST_FILE)):
+            previous = read_manifest(path)
+            if previous['dimension'] != index['dimension']:
+                raise NeuredgeError(
+                    f"Snapshot at {path} has dimension {previous['dimension']}, not {index['dimension']}",
+                    'INVALID_REQUEST',
+                    400
+                )
+            self._manifest.update(count=previous['count'], records_bytes=previous['records_bytes'])
+
+        row_bytes = 4 * self._manifest['dimension']
+        self._vectors = open(os.path.join(path, VECTORS_FILE), 'a+b')
+        self._records = open(os.path.join(path, RECORDS_FILE), 'a+b')
+        # Drop rows written after the last checkpoint
+        self._vectors.truncate(self._manifest['count'] * row_bytes)
+        self._records.truncate(self._manifest['records_bytes'])
+        self._count = self._manifest['count']
+        self._write_manifest()
+
+    @property
+    def count(self) -> int:
+        """Rows written so far, including those from a resumed run"""
+        return self._count
+
+    def write(self, vectors: List[Vector]):
+        """Append vectors; values may be float lists, arrays or float32 buffers"""
+        dimension = self._manifest['dimension']
+        for vector in vectors:
+            packed = pack_float32(vector['values'])
+            if len(packed) != 4 * dimension:
+                raise NeuredgeError(
+                    f"Vector {vector['id']} does not have dimension {dimension}",
+                    'INVALID_REQUEST',
+                    400
+                )
+            self._vectors.write(packed)
+            record = {'id': vector['id'], 'metadata': vector.get('metadata')}
+            self._records.write(json.dumps(record).encode('utf-8') + b'\n')
+        self._count += len(vectors)
+
+    def _write_manifest(self):
+        _write_json(os.path.join(self.path, MANIFEST_FILE), self._manifest)
+
+    def checkpoint(self):
+        """Make everything written so far durable"""
+        for f in (self._vectors, self._records):
+            f.flush()
+            os.fsync(f.fileno())
+        self._manifest.update(count=self._count, records_bytes=self._records.tell())
+        self._write_manifest()
+
+    def abort(self):
+        """Close the files without a checkpoint; a resume restarts from the last one"""
+        self._vectors.close()
+        self._records.close()
+
+    def close(self, complete: bool = True) -> SnapshotManifest:
+        """
+        Checkpoint and close the files
+
+        Args:
+            complete: Mark the snapshot as finished
+
+        Returns:
+            The final manifest
+        """
+        self.checkpoint()
+        if complete:
+            self._manifest['complete'] = True
+            self._write_manifest()
+        self._vectors.close()
+        self._records.close()
+        return dict(self._manifest)
+
+class SnapshotReader:
+    """
+    Reads a snapshot directory in batches
+
+    Values are returned as raw float32 buffers, which uploads send as base64
+    without converting to Python floats, so reading needs no numpy.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Snapshot directory
+        """
+        self.path = path
+        self.manifest = read_manifest(path)
+
+    def __len__(self) -> int:
+        return self.manifest['count']
+
+    def batches(self, batch_size: int, skip: Optional[Set[int]] = None) -> Iterator[Tuple[int, List[Vector]]]:
+        """
+        Yield numbered batches of vectors
+
+        Args:
+            batch_size: Vectors per batch
+            skip: Batch numbers to leave out, e.g. those already imported
+
+        Yields:
+            (batch number, vectors) pairs
+        """
+        skip = skip or set()
+        row_bytes = 4 * self.manifest['dimension']
+        remaining = self.manifest['count']
+        with open(os.path.join(self.path, VECTORS_FILE), 'rb') as vectors, \
+                open(os.path.join(self.path, RECORDS_FILE), 'rb') as records:
+            number = 0
+            while remaining > 0:
+                size = min(batch_size, remaining)
+                remaining -= size
+                lines = [records.readline() for _ in range(size)]
+                if number in skip:
+                    vectors.seek(size * row_bytes, os.SEEK_CUR)
+                else:
+                    values = memoryview(vectors.read(size * row_bytes))
+                    batch = []
+                    for row, line in enumerate(lines):
+                        record = json.loads(line)
+                        vector = {'id': record['id'], 'values': values[row * row_bytes:(row + 1) * row_bytes]}
+                        if record.get('metadata') is not None:
+                            vector['metadata'] = record['metadata']
+                        batch.append(vector)
+                    yield number, batch
+                number += 1
+
+    def matrix(self) -> Any:
+        """
+        Memory-map the vectors as a read-only (count, dimension) float32 array
+
+        Requires numpy.
+        """
+        np = require_numpy()
+        return np.memmap(
+            os.path.join(self.path, VECTORS_FILE), dtype='<f4', mode='r',
+            shape=(self.manifest['count'], self.manifest['dimension'])
+        )
+
+def snapshot_fingerprint(path: str) -> str:
+    """
+    Identify a snapshot's contents without reading its vectors
+
+    Hashes the manifest, which records the row count and sidecar size,
+    together with the size of the vector file.
+
+    Args:
+        path: Snapshot directory
+
+    Returns:
+        A hex digest that changes whenever the snapshot is rewritten
+    """
+    manifest = read_manifest(path)
+    vectors_size = os.path.getsize(os.path.join(path, VECTORS_FILE))
+    data = json.dumps({'manifest': manifest, 'vectors_bytes': vectors_size}, sort_keys=True)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+class ImportCheckpoint:
+    """
+    Tracks which batches of a snapshot have been uploaded to an index
+
+    Batches finish out of order under parallel uploads, so the checkpoint
+    keeps a watermark below which every batch is done plus the set of
+    finished batches above it. It is saved at most once per
+    CHECKPOINT_INTERVAL seconds, and always on `save(force=True)`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        index_name: str,
+        batch_size: int,
+        resume: bool = True,
+        base_url: Optional[str] = None
+    ):
+        """
+        Args:
+            path: Snapshot directory
+            index_name: Destination index
+            batch_size: Batch size for a fresh checkpoint; a resumed one
+                keeps the batch size it was started with
+            resume: Load an existing checkpoint instead of starting over
+            base_url: API the destination index lives on
+
+        A saved checkpoint is only resumed if it was made for the same
+        snapshot contents and the same index on the same API; otherwise
+        the import starts over.
+        """
+        self._file = os.path.join(path, f"import-{index_name}.checkpoint.json")
+        self._snapshot = snapshot_fingerprint(path)
+        self._target = {'index': index_name, 'base_url': base_url}
+        self.batch_size = batch_size
+        self._watermark = 0
+        self._done: Set[int] = set()
+        self._saved_at = 0.0
+        if resume and os.path.exists(self._file):
+            with open(self._file) as f:
+                state = json.load(f)
+            if state.get('snapshot') != self._snapshot or state.get('target') != self._target:
+                logger.warning(
+                    'Import checkpoint %s was made for a different snapshot or target; starting over',
+                    self._file
+                )
+                return
+            self.batch_size = state['batch_size']
+            self._watermark = state['watermark']
+            self._done = set(state['done'])
+
+    def done(self) -> Set[int]:
+        """Numbers of all finished batches"""
+        return set(range(self._watermark)) | self._done
+
+    def mark(self, number: int):
+        """Record a finished batch"""
+        self._done.add(number)
+        while self._watermark in self._done:
+            self._done.remove(self._watermark)
+            self._watermark += 1
+        self.save()
+
+    def save(self, force: bool = False):
+        now = time.monotonic()
+        if not force and now - self._saved_at < CHECKPOINT_INTERVAL:
+            return
+        self._saved_at = now
+        _write_json(self._file, {
+            'snapshot': self._snapshot,
+            'target': self._target,
+            'batch_size': self.batch_size,
+            'watermark': self._watermark,
+            'done': sorted(self._done),
+        })
+
+    def clear(self):
+        """Remove the checkpoint once the import has finished"""
+        if os.path.exists(self._file):
+            os.remove(self._file)
@@ -9,12 +9,14 @@ class ErrorCode(str, Enum):
     """API Error Codes"""
     UNKNOWN_ERROR = 'UNKNOWN_ERROR'
     NETWORK_ERROR = 'NETWORK_ERROR'
+    TIMEOUT = 'TIMEOUT'
     REQUEST_FAILED = 'REQUEST_FAILED'
     QUOTA_EXCEEDED = 'QUOTA_EXCEEDED'
     INDEX_NOT_FOUND = 'INDEX_NOT_FOUND'
     INDEX_EXISTS = 'INDEX_EXISTS'
     INVALID_REQUEST = 'INVALID_REQUEST'
     INVALID_RESPONSE = 'INVALID_RESPONSE'
+    BATCH_FAILED = 'BATCH_FAILED'
 
 class NeuredgeError(Exception):
     """Standardized error handling for Neuredge SDK"""
@@ -24,12 +26,14 @@ class NeuredgeError(Exception):
         message: str,
         code: str = 'UNKNOWN_ERROR',
         status_code: int = 500,
-        details: Optional[Dict[str, Any]] = None
+        details: Optional[Dict[str, Any]] = None,
+        retry_after: Optional[float] = None
     ):
         self.message = message
         self.code = code
         self.status_code = status_code
         self.details = details or {}
+        self.retry_after = retry_after  # Seconds from the Retry-After header, if any
         super().__init__(self.message)
 
     @classmethod
@@ -67,6 +71,26 @@ class ClientConfig(TypedDict):
     base_url: NotRequired[str]  # Optional with default "https://api.neuredge.dev"
     max_retries: NotRequired[int]  # Optional with default 3
     retry_delay: NotRequired[float]  # Optional with default 1.0
+    retry_policy: NotRequired[Any]  # Optional RetryPolicy, overrides max_retries/retry_delay
+    max_connections: NotRequired[int]  # Optional with default 100
+    max_connections_per_host: NotRequired[int]  # Optional with default 10
+    pool_block: NotRequired[bool]  # Optional with default False
+    keep_alive: NotRequired[bool]  # Optional with default True
+    connect_timeout: NotRequired[float]  # Optional with default 10.0 seconds
+    read_timeout: NotRequired[float]  # Optional with default 60.0 seconds
+    timeout: NotRequired[float]  # Optional overall budget per call, including retries
+    rate_limiter: NotRequired[Any]  # Optional RateLimiter shared by all requests
+    cache: NotRequired[Any]  # Optional CacheBackend for deterministic text endpoints
+    embedding_cache: NotRequired[Any]  # Optional EmbeddingCache for openai.embeddings
+
+class PoolStats(TypedDict):
+    """Connection pool usage counters"""
+    max_connections: int
+    max_connections_per_host: int
+    in_flight: int
+    peak_in_flight: int
+    total_requests: int
+    saturated_requests: int  # Requests started while the per-host pool was full
 
 class ApiMetadata(TypedDict):
     compression_ratio: float
@@ -100,6 +124,12 @@ class ApiResponse(TypedDict, Generic[T]):
     data: NotRequired[ApiResponseData[T]]
     error: NotRequired[ApiErrorData]
 
+class BatchItemResult(TypedDict, Generic[T]):
+    """Outcome of one item in a batch call; exactly one of result/error is set"""
+    index: int
+    result: Optional[T]
+    error: Optional[NeuredgeError]
+
 # Vector Store Types
 class VectorMetric(str, Enum):
     COSINE = 'cosine'
@@ -116,23 +146,39 @@ class VectorIndex(TypedDict):
 class Vector(TypedDict):
     """Vector with ID for storage"""
     id: Union[str, int]
-    values: List[float]
+    values: Any  # List[float], numpy array or raw float32 buffer
+    metadata: NotRequired[Dict[str, Any]]
 
 class SearchVectorMatch(TypedDict):
     """Search result for vector similarity search"""
     id: Union[str, int]
     score: float
-    vector: NotRequired[List[float]]
+    vector: NotRequired[Any]  # List[float], or a float32 array for array queries
+    metadata: NotRequired[Dict[str, Any]]  # with return_metadata
 
 class ConsistencyOptions(TypedDict):
     enabled: bool
     max_retries: NotRequired[int]  # default 5
     retry_delay: NotRequired[int]  # default 3000ms
+    timeout: NotRequired[float]  # seconds; default max_retries * retry_delay
+
+class RerankOptions(TypedDict):
+    """Client-side reordering of search candidates"""
+    method: Literal['exact', 'mmr']  # full-precision rescoring, or diversity
+    metric: NotRequired[Literal['cosine', 'euclidean', 'dot']]  # for 'exact'; default "cosine"
+    diversity: NotRequired[float]  # for 'mmr', 0 (relevance) to 1 (novelty); default 0.5
 
 class VectorOptions(TypedDict):
     """Options for vector operations"""
     top_k: NotRequired[int]  # default 10
+    return_vectors: NotRequired[bool]  # include stored vectors in search results
+    return_metadata: NotRequired[bool]  # include stored metadata in search results
+    filter: NotRequired[Dict[str, Any]]  # metadata filter, e.g. {"year": {"$gte": 2000}}
+    trust_server_filter: NotRequired[bool]  # accept results without metadata as filtered by the server
+    rerank: NotRequired[RerankOptions]
+    candidates: NotRequired[int]  # matches fetched before filtering/reranking; default 4 * top_k
     consistency: NotRequired[ConsistencyOptions]
+    encoding: NotRequired[Literal['auto', 'base64', 'json']]  # default "auto"
 
 # API Response Types
 class VectorIndexResponse(TypedDict):
@@ -155,6 +201,58 @@ class AddVectorsResult(TypedDict):
 class SearchVectorResult(TypedDict):
     results: List[SearchVectorMatch]
 
+class ReplicaStats(TypedDict):
+    """State of a local index replica"""
+    local_count: int
+    server_count: Optional[int]  # Last count seen from get_index
+    stale: bool  # Searches go to the server while True
+    local_hits: int  # Queries answered locally
+    remote_fallbacks: int  # Searches sent to the server because the replica was stale
+
+class BulkUpsertStats(TypedDict):
+    """Progress and outcome of an upsert_bulk call"""
+    inserted: int
+    failed: int  # Vectors in batches that failed every attempt
+    batches: int  # Batches uploaded successfully
+    retried_batches: int
+    failed_batches: int
+    failed_ids: List[Union[str, int]]
+    elapsed: float  # Seconds since the upload started
+    vectors_per_second: float
+
+class BatchFailure(TypedDict):
+    """Last error of a batch that failed every attempt"""
+    ids: int  # IDs in the batch
+    code: str
+    message: str
+
+class BulkDeleteStats(TypedDict):
+    """Progress and outcome of a delete_bulk call"""
+    deleted: int  # IDs in batches the server accepted
+    failed: int  # IDs in batches that failed every attempt
+    batches: int  # Batches deleted successfully
+    retried_batches: int
+    failed_batches: int
+    failed_ids: List[Union[str, int]]
+    errors: List[BatchFailure]  # One per failed batch
+    elapsed: float  # Seconds since the deletion started
+    ids_per_second: float
+
+class ImportStats(BulkUpsertStats):
+    """Outcome of an import_index call"""
+    skipped: int  # Vectors already imported by an earlier, interrupted run
+
+class SnapshotManifest(TypedDict):
+    """Description of an exported index snapshot"""
+    format: str  # "neuredge-vectors"
+    version: int
+    index: str  # Name of the exported index
+    dimension: int
+    metric: str
+    count: int  # Rows made durable by the last checkpoint
+    records_bytes: int  # Durable length of the ID and metadata sidecar
+    complete: bool  # False while an export is running or was interrupted
+
 # Language and Text Types
 class LanguageCode(str, Enum):
     EN = 'en'  # English
@@ -184,6 +282,24 @@ class SummaryResult(TypedDict):
     summary: str
     metadata: ApiMetadata
 
+class SummaryLevel(TypedDict):
+    """Statistics for one reduction level of a long summary"""
+    level: int  # 1 is the original chunks
+    chunks: int
+    original_length: int
+    summary_length: int
+    compression_ratio: float  # Per-chunk API ratios weighted by input length
+
+class LongSummaryResult(TypedDict):
+    summary: str
+    levels: List[SummaryLevel]
+
+# Embedding Types
+class EmbeddingArrayResult(TypedDict):
+    embeddings: Any  # numpy.ndarray of shape (n, dim), float32
+    model: str
+    usage: Dict[str, int]
+
 # Image Types
 class ImageGenerationMode(str, Enum):
     FAST = 'fast'
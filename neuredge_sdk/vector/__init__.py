@@ -0,0 +1,25 @@
+from .local import (
+    LocalVectorStore,
+    LocalIndex,
+    SearchEngine,
+    BruteForceEngine,
+    IVFEngine
+)
+from .quantization import (
+    Quantizer,
+    ScalarQuantizer,
+    ProductQuantizer,
+    QuantizedEngine
+)
+
+__all__ = [
+    "LocalVectorStore",
+    "LocalIndex",
+    "SearchEngine",
+    "BruteForceEngine",
+    "IVFEngine",
+    "Quantizer",
+    "ScalarQuantizer",
+    "ProductQuantizer",
+    "QuantizedEngine",
+]
@@ -0,0 +1,790 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Union, Dict, Any, Iterable, Iterator, Sequence, Tuple
+import importlib
+import os
+import threading
+
+import numpy as np
+
+from ..types import (
+    VectorIndex,
+    Vector,
+    SearchVectorMatch,
+    AddVectorsResult,
+    BatchItemResult,
+    NeuredgeError
+)
+from ..arrays import decode_float32
+from ..filters import compile_filter
+from .rerank import rerank_matches
+
+# Rows allocated when an index is created; storage doubles as it fills
+INITIAL_CAPACITY = 1024
+
+# Candidates fetched per requested match before reranking
+CANDIDATE_FACTOR = 4
+
+def _top_k(scores: np.ndarray, k: int, ascending: bool) -> np.ndarray:
+    """Column positions of the k best scores in each row, best first"""
+    k = min(k, scores.shape[1])
+    if k == 0:
+        return np.empty((scores.shape[0], 0), dtype=np.intp)
+    keyed = scores if ascending else -scores
+    if k < scores.shape[1]:
+        part = np.argpartition(keyed, k - 1, axis=1)[:, :k]
+    else:
+        part = np.broadcast_to(np.arange(scores.shape[1]), scores.shape).copy()
+    order = np.take_along_axis(keyed, part, axis=1).argsort(axis=1, kind='stable')
+    return np.take_along_axis(part, order, axis=1)
+
+def _kmeans(points: np.ndarray, k: int, iterations: int, rng: np.random.Generator) -> np.ndarray:
+    """Lloyd's k-means; returns (k, dim) centroids"""
+    centroids = points[rng.choice(len(points), k, replace=False)].copy()
+    for _ in range(iterations):
+        # |p|^2 is the same for every centroid, so it does not affect argmin
+        distances = points @ (-2 * centroids.T)
+        distances += np.einsum('ij,ij->i', centroids, centroids)
+        nearest = distances.argmin(axis=1)
+        counts = np.bincount(nearest, minlength=k)
+        order = np.argsort(nearest, kind='stable')
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        filled = counts > 0
+        sums = np.zeros_like(centroids)
+        sums[filled] = np.add.reduceat(points[order], starts[filled], axis=0)
+        centroids[filled] = sums[filled] / counts[filled, None]
+    return centroids
+
+class SearchEngine(ABC):
+    """
+    Strategy that picks and ranks rows of a LocalIndex for a query batch
+
+    Engines only decide which rows to score; scoring itself is exact and
+    shared, so every engine reports the same scores for the same rows.
+    """
+
+    def bind(self, index: 'LocalIndex'):
+        """Attach to the index this engine serves"""
+        self._index = index
+
+    def on_write(self, rows: np.ndarray):
+        """Rows whose vectors were added or replaced"""
+        pass
+
+    def on_compact(self):
+        """Row numbers changed; rebuild any per-row state"""
+        pass
+
+    @abstractmethod
+    def search(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the best rows for each query
+
+        Args:
+            queries: (m, dim) float32 queries
+            k: Number of matches per query
+
+        Returns:
+            (scores, rows), each (m, <=k), best first; -1 rows pad short results
+        """
+        pass
+
+def _exhaustive_search(index: 'LocalIndex', queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Score every live row with one matrix product for the whole batch"""
+    rows = index._live_rows()
+    scores = index._score(queries, rows)
+    best = _top_k(scores, k, index._ascending)
+    return np.take_along_axis(scores, best, axis=1), rows[best]
+
+class BruteForceEngine(SearchEngine):
+    """Exact search over every stored vector"""
+
+    def search(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        return _exhaustive_search(self._index, queries, k)
+
+class IVFEngine(SearchEngine):
+    """
+    Approximate search with an inverted file index
+
+    Vectors are clustered with k-means; a query scores only the rows in its
+    `n_probe` nearest clusters. Below `min_train_size` vectors, or until the
+    first search, it searches exhaustively. Clusters are retrained when the
+    index has doubled since the last training.
+    """
+
+    def __init__(
+        self,
+        n_lists: Optional[int] = None,
+        n_probe: int = 8,
+        min_train_size: int = 4096,
+        iterations: int = 10,
+        seed: int = 0
+    ):
+        """
+        Args:
+            n_lists: Number of clusters (defaults to sqrt of the index size)
+            n_probe: Clusters scored per query; higher is slower and more exact
+            min_train_size: Vector count below which search is exhaustive
+            iterations: k-means iterations per training
+            seed: Random seed for centroid initialization
+        """
+        self._n_lists = n_lists
+        self._n_probe = n_probe
+        self._min_train_size = min_train_size
+        self._iterations = iterations
+        self._rng = np.random.default_rng(seed)
+        self._centroids: Optional[np.ndarray] = None
+        self._assignment = np.empty(0, dtype=np.int32)
+        self._trained_size = 0
+        # Rows grouped by cluster: rows of list l are _order[_offsets[l]:_offsets[l + 1]]
+        self._order: Optional[np.ndarray] = None
+        self._offsets: Optional[np.ndarray] = None
+
+    def on_write(self, rows: np.ndarray):
+        if self._centroids is None:
+            return
+        self._ensure_assignment()
+        self._assignment[rows] = self._nearest_lists(self._index._vectors[rows], 1)[:, 0]
+        self._order = None
+
+    def on_compact(self):
+        if self._centroids is not None:
+            self._assignment = np.empty(0, dtype=np.int32)
+            self._ensure_assignment()
+            rows = np.arange(self._index._size)
+            self._assignment[rows] = self._nearest_lists(self._index._vectors[rows], 1)[:, 0]
+            self._order = None
+
+    def _inverted_lists(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Rows sorted by cluster plus list offsets, rebuilt lazily after writes"""
+        if self._order is None:
+            assignment = self._assignment[:self._index._size]
+            self._order = np.argsort(assignment, kind='stable')
+            self._offsets = np.searchsorted(
+                assignment[self._order], np.arange(len(self._centroids) + 1)
+            )
+        return self._order, self._offsets
+
+    def _ensure_assignment(self):
+        """Grow the row-to-cluster table with the index storage"""
+        size = self._index._vectors.shape[0]
+        if self._assignment.shape[0] < size:
+            grown = np.full(size, -1, dtype=np.int32)
+            grown[:self._assignment.shape[0]] = self._assignment
+            self._assignment = grown
+
+    def _training_view(self, vectors: np.ndarray) -> np.ndarray:
+        """Vectors in the space clustering happens in"""
+        if self._index._metric == 'cosine':
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            return vectors / np.maximum(norms, 1e-12)
+        return vectors
+
+    def _nearest_lists(self, vectors: np.ndarray, n: int) -> np.ndarray:
+        """The n nearest centroids (by L2 in the training space) for each vector"""
+        points = self._training_view(vectors)
+        distances = (
+            (points ** 2).sum(axis=1, keepdims=True)
+            - 2 * points @ self._centroids.T
+            + (self._centroids ** 2).sum(axis=1)
+        )
+        return _top_k(distances, n, ascending=True)
+
+    def train(self):
+        """Cluster the live vectors and assign every row to a cluster"""
+        index = self._index
+        rows = index._live_rows()
+        n_lists = self._n_lists or max(1, int(np.sqrt(len(rows))))
+        n_lists = min(n_lists, len(rows))
+        sample = rows
+        if len(rows) > n_lists * 64:
+            sample = self._rng.choice(rows, n_lists * 64, replace=False)
+        points = self._training_view(index._vectors[sample])
+        self._centroids = _kmeans(points, n_lists, self._iterations, self._rng)
+        self._trained_size = len(rows)
+        self.on_compact()
+
+    def search(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        index = self._index
+        live = index._live_count()
+        if live < self._min_train_size:
+            return _exhaustive_search(index, queries, k)
+        if self._centroids is None or live >= 2 * self._trained_size:
+            self.train()
+
+        probes = self._nearest_lists(queries, min(self._n_probe, len(self._centroids)))
+        order, offsets = self._inverted_lists()
+        out_scores = np.full((len(queries), k), np.nan, dtype=np.float32)
+        out_rows = np.full((len(queries), k), -1, dtype=np.intp)
+        for i, lists in enumerate(probes):
+            rows = np.concatenate([order[offsets[l]:offsets[l + 1]] for l in lists])
+            rows = rows[index._alive[rows]]
+            scores = index._score(queries[i:i + 1], rows)
+            best = _top_k(scores, k, index._ascending)[0]
+            out_scores[i, :len(best)] = scores[0, best]
+            out_rows[i, :len(best)] = rows[best]
+        return out_scores, out_rows
+
+ENGINES = {
+    'brute_force': BruteForceEngine,
+    'ivf': IVFEngine,
+}
+
+# Engines defined in other modules, which add themselves to ENGINES on import
+_LAZY_ENGINES = {
+    'quantized': 'quantization',
+}
+
+def _engine_class(name: Optional[str]) -> type:
+    """Look up an engine by name, importing its module on first use"""
+    if name not in ENGINES and name in _LAZY_ENGINES:
+        importlib.import_module(f'.{_LAZY_ENGINES[name]}', __package__)
+    if name not in ENGINES:
+        names = list(ENGINES) + [n for n in _LAZY_ENGINES if n not in ENGINES]
+        raise NeuredgeError(
+            f"Unknown engine {name}; use one of {', '.join(names)}",
+            'INVALID_REQUEST',
+            400
+        )
+    return ENGINES[name]
+
+def _make_engine(engine: Union[str, SearchEngine, None], options: Dict[str, Any]) -> SearchEngine:
+    """Build an engine from a name, or pass an instance through"""
+    if isinstance(engine, SearchEngine):
+        return engine
+    return _engine_class(engine)(**options)
+
+class LocalIndex:
+    """
+    In-process vector index over a contiguous float32 matrix
+
+    Deleted rows are tombstoned and compacted away once they make up a
+    quarter of the storage. All operations are thread-safe.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        dimension: int,
+        metric: str = 'cosine',
+        engine: Optional[SearchEngine] = None,
+        storage_path: Optional[str] = None
+    ):
+        """
+        Args:
+            name: Index name
+            dimension: Vector dimension
+            metric: 'cosine', 'euclidean' or 'dot'
+            engine: Search engine (defaults to exact brute force)
+            storage_path: File to memory-map full-precision vectors from
+                instead of holding them in RAM; pairs with QuantizedEngine,
+                which keeps only compact codes in memory
+        """
+        if metric not in ('cosine', 'euclidean', 'dot'):
+            raise NeuredgeError(f"Unsupported metric {metric}", 'INVALID_REQUEST', 400)
+        self.name = name
+        self.dimension = dimension
+        self._metric = metric
+        # Euclidean scores are distances, so smaller is better
+        self._ascending = metric == 'euclidean'
+        self._lock = threading.RLock()
+        self._storage_path = storage_path
+        self._vectors = self._allocate_vectors(INITIAL_CAPACITY)
+        self._sq_norms = np.empty(INITIAL_CAPACITY, dtype=np.float32)
+        self._alive = np.zeros(INITIAL_CAPACITY, dtype=bool)
+        self._ids: List[Optional[Union[str, int]]] = []
+        self._row_of: Dict[Union[str, int], int] = {}
+        self._metadata: Dict[Union[str, int], Dict[str, Any]] = {}
+        self._size = 0
+        self._engine = engine or BruteForceEngine()
+        self._engine.bind(self)
+
+    def describe(self) -> VectorIndex:
+        """Index configuration in the same shape as the API returns"""
+        return {
+            'name': self.name,
+            'dimension': self.dimension,
+            'metric': self._metric,
+            'vector_count': len(self),
+        }
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    def _live_count(self) -> int:
+        return len(self._row_of)
+
+    def _live_rows(self) -> np.ndarray:
+        return np.flatnonzero(self._alive[:self._size])
+
+    def _allocate_vectors(self, capacity: int, path: Optional[str] = None) -> np.ndarray:
+        """Vector storage for `capacity` rows, in RAM or memory-mapped"""
+        if self._storage_path is None:
+            return np.zeros((capacity, self.dimension), dtype=np.float32)
+        return np.memmap(
+            path or self._storage_path, dtype=np.float32, mode='w+',
+            shape=(capacity, self.dimension)
+        )
+
+    def _grow(self, needed: int):
+        """Make room for `needed` rows, doubling storage"""
+        capacity = self._vectors.shape[0]
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ('_sq_norms', '_alive'):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+        if self._storage_path is None:
+            vectors = self._allocate_vectors(capacity)
+            vectors[:self._size] = self._vectors[:self._size]
+        else:
+            # Build the larger file beside the old one, then swap it in
+            staging = self._storage_path + '.grow'
+            vectors = self._allocate_vectors(capacity, staging)
+            vectors[:self._size] = self._vectors[:self._size]
+            vectors.flush()
+            os.replace(staging, self._storage_path)
+        self._vectors = vectors
+
+    def _check_dimension(self, matrix: np.ndarray):
+        if matrix.ndim != 2 or matrix.shape[1] != self.dimension:
+            raise NeuredgeError(
+                f"Expected vectors of dimension {self.dimension}, got shape {matrix.shape}",
+                'INVALID_REQUEST',
+                400
+            )
+
+    def add(
+        self,
+        ids: Sequence[Union[str, int]],
+        matrix: Any,
+        metadata: Optional[Sequence[Optional[Dict[str, Any]]]] = None
+    ) -> int:
+        """
+        Insert or replace vectors
+
+        Args:
+            ids: One ID per row; existing IDs are overwritten
+            matrix: (n, dim) array-like of vectors
+            metadata: Optional metadata per row; like the API, an overwrite
+                without metadata clears it
+
+        Returns:
+            Number of vectors written
+        """
+        matrix = np.asarray(matrix, dtype=np.float32)
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(1, -1)
+        self._check_dimension(matrix)
+        if len(ids) != len(matrix) or (metadata is not None and len(metadata) != len(ids)):
+            raise NeuredgeError('ids, vectors and metadata differ in length', 'INVALID_REQUEST', 400)
+
+        with self._lock:
+            rows = np.empty(len(ids), dtype=np.intp)
+            new = 0
+            for i, id in enumerate(ids):
+                row = self._row_of.get(id)
+                if row is None:
+                    row = self._size + new
+                    new += 1
+                    self._row_of[id] = row
+                    self._ids.append(id)
+                rows[i] = row
+            self._grow(self._size + new)
+            self._size += new
+            self._vectors[rows] = matrix
+            self._sq_norms[rows] = np.einsum('ij,ij->i', matrix, matrix)
+            self._alive[rows] = True
+            for i, id in enumerate(ids):
+                if metadata is not None and metadata[i] is not None:
+                    self._metadata[id] = metadata[i]
+                else:
+                    self._metadata.pop(id, None)
+            self._engine.on_write(rows)
+        return len(ids)
+
+    def remove(self, ids: Iterable[Union[str, int]]) -> int:
+        """
+        Delete vectors by ID; unknown IDs are ignored
+
+        Returns:
+            Number of vectors deleted
+        """
+        removed = 0
+        with self._lock:
+            for id in ids:
+                row = self._row_of.pop(id, None)
+                if row is not None:
+                    self._metadata.pop(id, None)
+                    self._alive[row] = False
+                    self._ids[row] = None
+                    removed += 1
+            dead = self._size - len(self._row_of)
+            if dead > max(INITIAL_CAPACITY, self._size // 4):
+                self._compact()
+        return removed
+
+    def _compact(self):
+        """Drop tombstoned rows; caller holds the lock"""
+        rows = self._live_rows()
+        count = len(rows)
+        self._vectors[:count] = self._vectors[rows]
+        self._sq_norms[:count] = self._sq_norms[rows]
+        self._alive[:count] = True
+        self._alive[count:] = False
+        self._ids = [self._ids[row] for row in rows]
+        self._row_of = {id: row for row, id in enumerate(self._ids)}
+        self._size = count
+        self._engine.on_compact()
+
+    def get(self, ids: Sequence[Union[str, int]]) -> np.ndarray:
+        """
+        Fetch stored vectors
+
+        Args:
+            ids: IDs to fetch; all must exist
+
+        Returns:
+            (n, dim) float32 copy of the vectors
+        """
+        with self._lock:
+            try:
+                rows = [self._row_of[id] for id in ids]
+            except KeyError as e:
+                raise NeuredgeError(f"Vector {e.args[0]} not found", 'INVALID_REQUEST', 404)
+            return self._vectors[rows].copy()
+
+    def ids(self) -> List[Union[str, int]]:
+        """IDs of all stored vectors"""
+        with self._lock:
+            return [id for id in self._ids if id is not None]
+
+    def iter_vectors(self, batch_size: int = 10000) -> Iterator[Vector]:
+        """
+        Iterate over stored vectors as API-style dicts, in insertion order
+
+        Vectors are copied out in chunks of `batch_size`; ones deleted while
+        iterating are skipped.
+        """
+        ids = self.ids()
+        for start in range(0, len(ids), batch_size):
+            with self._lock:
+                chunk = [id for id in ids[start:start + batch_size] if id in self._row_of]
+                matrix = self._vectors[[self._row_of[id] for id in chunk]]
+                metadata = [self._metadata.get(id) for id in chunk]
+            for id, values, fields in zip(chunk, matrix, metadata):
+                vector = {'id': id, 'values': values}
+                if fields is not None:
+                    vector['metadata'] = fields
+                yield vector
+
+    def _score(self, queries: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Exact (m, len(rows)) scores of queries against stored rows"""
+        dots = queries @ self._vectors[rows].T
+        if self._metric == 'dot':
+            return dots
+        if self._metric == 'cosine':
+            q_norms = np.linalg.norm(queries, axis=1, keepdims=True)
+            norms = np.sqrt(self._sq_norms[rows])
+            return dots / np.maximum(q_norms * norms, 1e-12)
+        q_sq = np.einsum('ij,ij->i', queries, queries)[:, None]
+        return np.sqrt(np.maximum(q_sq + self._sq_norms[rows] - 2 * dots, 0))
+
+    def _filtered_rows(self, expression: Dict[str, Any]) -> np.ndarray:
+        """Live rows whose metadata satisfies a filter; caller holds the lock"""
+        predicate = compile_filter(expression)
+        return np.array(
+            [row for id, row in self._row_of.items() if predicate(self._metadata.get(id))],
+            dtype=np.intp
+        )
+
+    def search(
+        self,
+        queries: Any,
+        k: int = 10,
+        filter: Optional[Dict[str, Any]] = None
+    ) -> Tuple[np.ndarray, List[List[Union[str, int]]]]:
+        """
+        Vectorized top-k search for a batch of queries
+
+        Args:
+            queries: (m, dim) or (dim,) array-like of queries
+            k: Number of matches per query
+            filter: Metadata filter; matching rows are searched exactly, so
+                selective filters never come back short
+
+        Returns:
+            (scores, ids): an (m, <=k) score array and the matching IDs per
+            query, best first
+        """
+        queries = np.asarray(queries, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries.reshape(1, -1)
+        self._check_dimension(queries)
+        with self._lock:
+            if not self._row_of or k <= 0:
+                return np.empty((len(queries), 0), dtype=np.float32), [[] for _ in queries]
+            if filter is None:
+                scores, rows = self._engine.search(queries, k)
+            else:
+                allowed = self._filtered_rows(filter)
+                scores = self._score(queries, allowed)
+                best = _top_k(scores, k, self._ascending)
+                scores, rows = np.take_along_axis(scores, best, axis=1), allowed[best]
+            ids = [[self._ids[row] for row in query_rows if row >= 0] for query_rows in rows]
+        return scores, ids
+
+    def _matches(
+        self,
+        scores: np.ndarray,
+        ids: List[Union[str, int]],
+        return_vectors: bool,
+        return_metadata: bool = False
+    ) -> List[SearchVectorMatch]:
+        """Format one query's results like the API"""
+        matches = [{'id': id, 'score': float(score)} for id, score in zip(ids, scores)]
+        if return_vectors and ids:
+            for match, vector in zip(matches, self.get(ids)):
+                match['vector'] = vector
+        if return_metadata:
+            for match in matches:
+                if match['id'] in self._metadata:
+                    match['metadata'] = self._metadata[match['id']]
+        return matches
+
+    def search_matches(self, queries: Any, options: Dict[str, Any]) -> List[List[SearchVectorMatch]]:
+        """
+        Search and format results like the API, applying filter and rerank options
+
+        Args:
+            queries: (m, dim) or (dim,) array-like of queries
+            options: top_k, filter, rerank, candidates, return_vectors and
+                return_metadata, as for search_vector
+
+        Returns:
+            Matches per query, best first
+        """
+        queries = np.asarray(queries, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries.reshape(1, -1)
+        top_k = options.get('top_k', 10)
+        rerank = options.get('rerank')
+        k = options.get('candidates', CANDIDATE_FACTOR * top_k) if rerank else top_k
+        return_vectors = options.get('return_vectors', False)
+
+        scores, ids = self.search(queries, k, options.get('filter'))
+        results = []
+        for i in range(len(ids)):
+            matches = self._matches(
+                scores[i], ids[i], return_vectors or bool(rerank), options.get('return_metadata', False)
+            )
+            if rerank:
+                matches = rerank_matches(matches, queries[i], top_k, rerank)
+                if not return_vectors:
+                    matches = [{key: value for key, value in match.items() if key != 'vector'} for match in matches]
+            results.append(matches)
+        return results
+
+class LocalVectorStore:
+    """
+    In-process vector store with the same interface as `client.vector`
+
+    Useful for serving hot indexes without a network round trip and for
+    tests that should not depend on the service. Requires numpy.
+
+    Example:
+        ```python
+        from neuredge_sdk.vector import LocalVectorStore
+
+        store = LocalVectorStore(engine="ivf", n_probe=16)
+        store.create_index({"name": "docs", "dimension": 384, "metric": "cosine"})
+        store.add_vectors("docs", [{"id": "1", "values": embedding}])
+        matches = store.search_vector("docs", query, {"top_k": 5})
+        ```
+    """
+
+    def __init__(self, engine: str = 'brute_force', **engine_options: Any):
+        """
+        Args:
+            engine: Default engine for new indexes, 'brute_force', 'ivf' or 'quantized'
+            **engine_options: Options for the default engine, e.g. n_probe
+        """
+        _engine_class(engine)
+        self._engine = engine
+        self._engine_options = engine_options
+        self._indexes: Dict[str, LocalIndex] = {}
+        self._lock = threading.Lock()
+
+    def _index(self, name: str) -> LocalIndex:
+        index = self._indexes.get(name)
+        if index is None:
+            raise NeuredgeError(f"Index {name} not found", 'INDEX_NOT_FOUND', 404)
+        return index
+
+    def create_index(
+        self,
+        config: VectorIndex,
+        engine: Union[str, SearchEngine, None] = None,
+        storage_path: Optional[str] = None,
+        **engine_options: Any
+    ) -> None:
+        """
+        Create a new vector index
+
+        Args:
+            config: Vector index configuration
+            engine: Engine name, or a fresh SearchEngine instance for this
+                index only (defaults to the store's engine)
+            storage_path: File to memory-map full-precision vectors from
+            **engine_options: Options for a named engine
+        """
+        if engine is None:
+            engine, engine_options = self._engine, {**self._engine_options, **engine_options}
+        with self._lock:
+            if config['name'] in self._indexes:
+                raise NeuredgeError(f"Index {config['name']} already exists", 'INDEX_EXISTS', 409)
+            self._indexes[config['name']] = LocalIndex(
+                config['name'],
+                config['dimension'],
+                config.get('metric', 'cosine'),
+                _make_engine(engine, engine_options),
+                storage_path
+            )
+
+    def list_indexes(self) -> List[VectorIndex]:
+        """
+        List all vector indexes
+
+        Returns:
+            List of vector index configurations
+        """
+        return [index.describe() for index in list(self._indexes.values())]
+
+    def get_index(self, name: str) -> Optional[VectorIndex]:
+        """
+        Get details of a specific index
+
+        Args:
+            name: Name of the index
+
+        Returns:
+            Vector index configuration if found, None otherwise
+        """
+        index = self._indexes.get(name)
+        return index.describe() if index else None
+
+    def index(self, name: str) -> LocalIndex:
+        """
+        Get the underlying index for array-level access
+
+        Args:
+            name: Name of the index
+
+        Returns:
+            The LocalIndex
+        """
+        return self._index(name)
+
+    def delete_index(self, name: str) -> None:
+        """
+        Delete a vector index; missing indexes are ignored
+
+        Args:
+            name: Name of the index to delete
+        """
+        with self._lock:
+            self._indexes.pop(name, None)
+
+    def add_vectors(
+        self,
+        index_name: str,
+        vectors: List[Vector],
+        options: Optional[Dict[str, Any]] = None
+    ) -> AddVectorsResult:
+        """
+        Store vectors in an index
+
+        Args:
+            index_name: Name of the index
+            vectors: Array of vectors to store; values may be float lists,
+                numpy arrays or raw float32 buffers
+            options: Accepted for interface parity; writes are immediately visible
+
+        Returns:
+            Result containing number of vectors inserted and their IDs
+        """
+        index = self._index(index_name)
+        ids = [v['id'] for v in vectors]
+        metadata = [v.get('metadata') for v in vectors]
+        matrix = np.empty((len(vectors), index.dimension), dtype=np.float32)
+        for row, vector in enumerate(vectors):
+            values = decode_float32(vector['values'])
+            if values.shape != (index.dimension,):
+                raise NeuredgeError(
+                    f"Vector {vector['id']} does not have dimension {index.dimension}",
+                    'INVALID_REQUEST',
+                    400
+                )
+            matrix[row] = values
+        index.add(ids, matrix, metadata)
+        return {'inserted': len(ids), 'ids': [str(id) for id in ids]}
+
+    def delete_vectors(self, index_name: str, ids: List[Union[str, int]]) -> None:
+        """
+        Delete vectors from an index
+
+        Args:
+            index_name: Name of the index
+            ids: Array of vector IDs to delete
+        """
+        self._index(index_name).remove(ids)
+
+    def search_vector(
+        self,
+        index_name: str,
+        vector: Union[List[float], Any],
+        options: Optional[Dict[str, Any]] = None
+    ) -> List[SearchVectorMatch]:
+        """
+        Search for similar vectors
+
+        Args:
+            index_name: Name of the index
+            vector: Query vector
+            options: top_k, filter, rerank, candidates, return_vectors and
+                return_metadata
+
+        Returns:
+            List of matched vectors with similarity scores, best first
+        """
+        return self._index(index_name).search_matches(decode_float32(vector), options or {})[0]
+
+    def search_vectors(
+        self,
+        index_name: str,
+        queries: Union[Iterable[List[float]], Any],
+        top_k: int = 10,
+        options: Optional[Dict[str, Any]] = None
+    ) -> List[BatchItemResult[List[SearchVectorMatch]]]:
+        """
+        Search for many query vectors in one vectorized pass
+
+        Args:
+            index_name: Name of the index
+            queries: Query vectors, or a 2-d array with one query per row
+            top_k: Number of matches per query
+            options: Search options, as for search_vector
+
+        Returns:
+            One result per query, in query order
+        """
+        options = {**(options or {}), 'top_k': top_k}
+        queries = np.asarray(queries if hasattr(queries, 'shape') else list(queries), dtype=np.float32)
+        return [
+            {'index': i, 'result': matches, 'error': None}
+            for i, matches in enumerate(self._index(index_name).search_matches(queries, options))
+        ]
@@ -0,0 +1,171 @@
+from typing import List, Optional, Union, Dict, Any, Iterable
+import logging
+import threading
+import time
+
+import numpy as np
+
+from ..types import Vector, SearchVectorMatch, BatchItemResult, ReplicaStats
+from ..arrays import decode_float32
+from .local import LocalIndex, _make_engine
+
+logger = logging.getLogger(__name__)
+
+class IndexReplica:
+    """
+    Local mirror of a remote index, used to answer searches in-process
+
+    The replica is filled from writes made through the SDK and from explicit
+    syncs. It is trusted while the server's vector count matches the local
+    count; a mismatch means someone else wrote to the index, so the replica
+    is marked stale and searches go back to the server until the next sync.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        dimension: int,
+        metric: str = 'cosine',
+        engine: str = 'brute_force',
+        check_interval: float = 5.0,
+        **engine_options: Any
+    ):
+        """
+        Args:
+            name: Index name
+            dimension: Vector dimension
+            metric: 'cosine', 'euclidean' or 'dot'
+            engine: Local search engine, 'brute_force', 'ivf' or 'quantized'
+            check_interval: Seconds between vector count checks against the server
+            **engine_options: Options for the engine
+        """
+        self.index = LocalIndex(name, dimension, metric, _make_engine(engine, engine_options))
+        self._check_interval = check_interval
+        self._lock = threading.Lock()
+        self._stale = True  # Until the first sync
+        # Set when a mirror write failed; only reloading the contents clears it
+        self._needs_reload = False
+        self._server_count: Optional[int] = None
+        self._last_check = 0.0
+        self._last_write = 0.0
+        self._local_hits = 0
+        self._remote_fallbacks = 0
+
+    def load(self, vectors: Iterable[Vector], batch_size: int = 10000):
+        """Replace the contents with the given vectors"""
+        with self._lock:
+            # Half-loaded contents must not serve searches if this raises
+            self._stale = True
+            self._needs_reload = True
+        self.index.remove(self.index.ids())
+        batch = []
+        for vector in vectors:
+            batch.append(vector)
+            if len(batch) >= batch_size:
+                self._apply_write(batch)
+                batch = []
+        if batch:
+            self._apply_write(batch)
+        with self._lock:
+            self._needs_reload = False
+
+    def _apply_write(self, vectors: List[Vector]):
+        """Add vectors to the local index, raising if they do not fit it"""
+        matrix = np.empty((len(vectors), self.index.dimension), dtype=np.float32)
+        for row, vector in enumerate(vectors):
+            matrix[row] = decode_float32(vector['values'])
+        self.index.add([v['id'] for v in vectors], matrix, [v.get('metadata') for v in vectors])
+        with self._lock:
+            self._last_write = time.monotonic()
+
+    def record_write(self, vectors: List[Vector]):
+        """
+        Mirror vectors written to the server
+
+        The server write already succeeded, so vectors the replica cannot
+        hold (e.g. of another dimension) do not raise; the replica is marked
+        stale instead and searches go to the server until it is reloaded
+        with sync_replica.
+        """
+        try:
+            self._apply_write(vectors)
+        except Exception as e:
+            logger.warning('Replica of index %s is stale after a failed mirror write: %s', self.index.name, e)
+            with self._lock:
+                self._stale = True
+                self._needs_reload = True
+
+    def record_delete(self, ids: Iterable[Union[str, int]]):
+        """Mirror vectors deleted on the server"""
+        self.index.remove(ids)
+        with self._lock:
+            self._last_write = time.monotonic()
+
+    def needs_check(self) -> bool:
+        """Whether the server's vector count should be fetched again"""
+        with self._lock:
+            return time.monotonic() - self._last_check >= self._check_interval
+
+    def observe_count(self, server_count: Optional[int], synced: bool = False):
+        """
+        Compare the server's vector count with the local one
+
+        Args:
+            server_count: Count from get_index, or None if the index is gone
+            synced: Whether the caller just loaded the full contents
+        """
+        local_count = len(self.index)
+        with self._lock:
+            now = time.monotonic()
+            self._last_check = now
+            self._server_count = server_count
+            if self._needs_reload:
+                # Counts can match while the local contents are wrong
+                self._stale = True
+            elif server_count == local_count:
+                self._stale = False
+            elif synced:
+                # The server may still be applying recent writes
+                self._stale = server_count is None or server_count > local_count
+            elif now - self._last_write >= self._check_interval:
+                # Server counts lag behind writes; only judge once they settle
+                self._stale = True
+
+    def invalidate(self):
+        """Stop answering searches locally until the next sync"""
+        with self._lock:
+            self._stale = True
+
+    @property
+    def usable(self) -> bool:
+        with self._lock:
+            return not self._stale
+
+    def count_fallback(self):
+        with self._lock:
+            self._remote_fallbacks += 1
+
+    def search(self, queries: Any, options: Dict[str, Any]) -> List[List[SearchVectorMatch]]:
+        """Answer a batch of queries from the local index, with search_vector options"""
+        results = self.index.search_matches(queries, options)
+        with self._lock:
+            self._local_hits += len(results)
+        return results
+
+    def search_many(self, queries: Any, options: Dict[str, Any]) -> List[BatchItemResult[List[SearchVectorMatch]]]:
+        """Answer queries in one vectorized pass, shaped like search_vectors"""
+        queries = np.asarray(queries if hasattr(queries, 'shape') else list(queries), dtype=np.float32)
+        return [
+            {'index': i, 'result': matches, 'error': None}
+            for i, matches in enumerate(self.search(queries, options))
+        ]
+
+    def stats(self) -> ReplicaStats:
+        with self._lock:
+            return {
+                'local_count': len(self.index),
+                'server_count': self._server_count,
+                'stale': self._stale,
+                'local_hits': self._local_hits,
+                'remote_fallbacks': self._remote_fallbacks,
+            }
@@ -0,0 +1,110 @@
+from typing import List, Any
+
+import numpy as np
+
+from ..types import SearchVectorMatch, RerankOptions, NeuredgeError
+from ..arrays import decode_float32, stack_float32
+
+RERANK_METHODS = ('exact', 'mmr')
+
+def exact_scores(query: Any, vectors: np.ndarray, metric: str = 'cosine') -> np.ndarray:
+    """
+    Score candidate vectors against a query in full float32 precision
+
+    Args:
+        query: Query vector
+        vectors: (n, dim) candidate vectors
+        metric: 'cosine', 'euclidean' or 'dot'
+
+    Returns:
+        One score per candidate; for euclidean, smaller is better
+    """
+    query = decode_float32(query)
+    dots = vectors @ query
+    if metric == 'dot':
+        return dots
+    if metric == 'cosine':
+        norms = np.linalg.norm(vectors, axis=1) * np.linalg.norm(query)
+        return dots / np.maximum(norms, 1e-12)
+    if metric == 'euclidean':
+        return np.linalg.norm(vectors - query, axis=1)
+    raise NeuredgeError(f"Unsupported metric {metric}", 'INVALID_REQUEST', 400)
+
+def mmr(query: Any, vectors: np.ndarray, k: int, diversity: float = 0.5) -> np.ndarray:
+    """
+    Maximal marginal relevance: pick k candidates that are relevant to the
+    query but not redundant with each other
+
+    Each step picks the candidate maximizing
+    `(1 - diversity) * sim(query, c) - diversity * max sim(c, picked)`,
+    with cosine similarities computed once as matrix products.
+
+    Args:
+        query: Query vector
+        vectors: (n, dim) candidate vectors
+        k: Number of candidates to pick
+        diversity: 0 ranks by relevance only, 1 by novelty only
+
+    Returns:
+        Positions of the picked candidates, in pick order
+    """
+    k = min(k, len(vectors))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    units = vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+    relevance = exact_scores(query, units)
+    similarity = units @ units.T
+
+    picked = [int(relevance.argmax())]
+    redundancy = similarity[picked[0]].copy()
+    available = np.ones(len(vectors), dtype=bool)
+    available[picked[0]] = False
+    for _ in range(k - 1):
+        gain = (1 - diversity) * relevance - diversity * redundancy
+        gain[~available] = -np.inf
+        best = int(gain.argmax())
+        picked.append(best)
+        available[best] = False
+        np.maximum(redundancy, similarity[best], out=redundancy)
+    return np.array(picked, dtype=np.intp)
+
+def rerank_matches(
+    matches: List[SearchVectorMatch],
+    query: Any,
+    top_k: int,
+    options: RerankOptions
+) -> List[SearchVectorMatch]:
+    """
+    Reorder search candidates using their returned vectors
+
+    Args:
+        matches: Candidates carrying a `vector` field
+        query: Query vector
+        top_k: Number of matches to keep
+        options: Rerank method and its parameters
+
+    Returns:
+        The best top_k matches; 'exact' replaces scores with full-precision
+        ones, 'mmr' keeps the original scores in diversified order
+    """
+    method = options.get('method', 'exact')
+    if method not in RERANK_METHODS:
+        raise NeuredgeError(
+            f"rerank method must be one of {', '.join(RERANK_METHODS)}",
+            'INVALID_REQUEST',
+            400
+        )
+    if not matches:
+        return matches
+    if any(match.get('vector') is None for match in matches):
+        raise NeuredgeError('Reranking needs the matched vectors', 'INVALID_REQUEST', 400)
+    vectors = stack_float32([match['vector'] for match in matches])
+
+    if method == 'mmr':
+        order = mmr(query, vectors, top_k, options.get('diversity', 0.5))
+        return [matches[i] for i in order]
+
+    metric = options.get('metric', 'cosine')
+    scores = exact_scores(query, vectors, metric)
+    order = np.argsort(scores if metric == 'euclidean' else -scores, kind='stable')[:top_k]
+    return [{**matches[i], 'score': float(scores[i])} for i in order]
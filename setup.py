@@ -6,8 +6,12 @@ setup(
     packages=find_packages(),
     install_requires=[
         "requests>=2.28.0",
+        "aiohttp>=3.8.0",
         "typing_extensions>=4.0.0",
     ],
+    extras_require={
+        "numpy": ["numpy>=1.20"],
+    },
     python_requires=">=3.8",
     description="Python SDK for the Neuredge AI Platform",
     classifiers=[
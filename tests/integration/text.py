@@ -67,6 +67,24 @@ def test_translation():
         log_response("French", french)
         assert_with_log(french and isinstance(french, str), "Should return French translation")
 
+def test_batch_sentiment():
+    """Test concurrent batch sentiment analysis"""
+    with timing("batch_sentiment"):
+        log_test_step("Testing batch sentiment analysis...")
+        client = Neuredge(**TEST_CONFIG)
+        
+        texts = ["I love this!", "This is awful.", "Great work, thank you!"]
+        results = client.text.analyze_sentiment_many(texts, concurrency=3)
+        log_response("Batch sentiment", results)
+        
+        assert_with_log(len(results) == len(texts), "Should return one result per input")
+        assert_with_log(
+            [r['index'] for r in results] == list(range(len(texts))),
+            "Results should preserve input order"
+        )
+        assert_with_log(all(r['error'] is None for r in results), "All items should succeed")
+        assert_with_log(results[1]['result']['sentiment'] == 'NEGATIVE', "Should detect negative sentiment")
+
 TEST_CASES = [
     TestCase(
         name="summarization",
@@ -82,6 +100,11 @@ TEST_CASES = [
         name="translation",
         func=test_translation,
         description="Test translation between different languages"
+    ),
+    TestCase(
+        name="batch_sentiment",
+        func=test_batch_sentiment,
+        description="Test concurrent batch sentiment analysis"
     )
 ]
 
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 import time
-from neuredge_sdk import Neuredge
+import asyncio
+from neuredge_sdk import Neuredge, AsyncNeuredge
 from tests.config import TEST_CONFIG
 from tests.utils import log_test_step, log_response, assert_with_log, timing
 
@@ -21,7 +22,7 @@ def test_index_operations():
             "name": index_name,
             "dimension": 768,
             "metric": "cosine"
-        })
+        }, wait=True)
         log_test_step("Created index")
         
         # Verify and cleanup
@@ -29,9 +30,9 @@ def test_index_operations():
         log_response("Index", index)
         assert_with_log(index is not None, "Index should exist")
 
-async def test_vector_operations():
+async def _vector_operations():
     """Test vector storage and search"""
-    client = Neuredge(**TEST_CONFIG)
+    client = AsyncNeuredge(**TEST_CONFIG)
     index_name = f"test-vectors-{int(time.time())}"
     
     try:
@@ -40,7 +41,7 @@ async def test_vector_operations():
             "name": index_name,
             "dimension": 768,
             "metric": "cosine"
-        })
+        }, wait=True)
         
         # Add vectors
         vector = [0.1] * 768
@@ -63,6 +64,10 @@ async def test_vector_operations():
     finally:
         # Cleanup
         await client.vector.delete_index(index_name)
+        await client.close()
+
+def test_vector_operations():
+    asyncio.run(_vector_operations())
 
 TEST_CASES = [
     TestCase(
@@ -87,7 +92,7 @@ def vector_tests():
             "name": index_name,
             "dimension": 768,
             "metric": "cosine"
-        })
+        }, wait=True)
         
         # Add vectors
         vector = [0.1] * 768
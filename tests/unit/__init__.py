@@ -0,0 +1 @@
+"""Offline unit tests"""
@@ -0,0 +1,114 @@
+import base64
+import struct
+
+import pytest
+
+from neuredge_sdk.arrays import (
+    pack_float32, unpack_float32, encode_float32, decode_float32, stack_float32, is_array
+)
+from neuredge_sdk.capabilities.vector import VectorStoreCapabilities
+from neuredge_sdk.types import NeuredgeError
+
+VALUES = [0.5, -1.25, 3.0, 1e-3]
+
+def test_pack_float32_is_little_endian():
+    assert pack_float32(VALUES) == struct.pack('<4f', *VALUES)
+    assert unpack_float32(pack_float32(VALUES)) == pytest.approx(VALUES)
+
+def test_base64_round_trip_without_numpy():
+    encoded = encode_float32(VALUES)
+    assert base64.b64decode(encoded) == struct.pack('<4f', *VALUES)
+    assert unpack_float32(base64.b64decode(encoded)) == pytest.approx(VALUES)
+
+def test_buffers_pass_through_unchanged():
+    packed = struct.pack('<4f', *VALUES)
+    assert pack_float32(memoryview(packed)) == packed
+    assert encode_float32(bytearray(packed)) == base64.b64encode(packed).decode('ascii')
+
+def test_array_round_trip():
+    np = pytest.importorskip('numpy')
+    vector = np.array(VALUES, dtype=np.float64)
+    assert is_array(vector) and not is_array(VALUES)
+    decoded = decode_float32(encode_float32(vector))
+    assert decoded.dtype == np.float32
+    np.testing.assert_array_equal(decoded, vector.astype(np.float32))
+
+def test_decoding_bytes_is_a_view():
+    np = pytest.importorskip('numpy')
+    packed = bytearray(struct.pack('<4f', *VALUES))
+    decoded = decode_float32(packed)
+    packed[:4] = struct.pack('<f', 9.0)
+    assert decoded[0] == 9.0
+    assert decode_float32(VALUES).dtype == np.float32
+
+def test_stack_mixes_encodings():
+    np = pytest.importorskip('numpy')
+    rows = [encode_float32(VALUES), struct.pack('<4f', *VALUES), VALUES]
+    stacked = stack_float32(rows)
+    assert stacked.shape == (3, 4) and stacked.dtype == np.float32
+    np.testing.assert_array_equal(stacked, np.array([VALUES] * 3, dtype=np.float32))
+    assert stack_float32([]).shape == (0, 0)
+
+class _FakeVectorClient:
+    """Rejects base64 vector values with `status`, or fails every request with it if `always`"""
+
+    def __init__(self, status=400, always=False):
+        self.status = status
+        self.always = always
+        self.bodies = []
+
+    def get(self, endpoint, **kwargs):
+        return {'name': 'docs', 'dimension': 4, 'vector_count': 0}
+
+    def post(self, endpoint, data, **kwargs):
+        self.bodies.append(data)
+        values = data['vectors'][0]['values'] if 'vectors' in data else data['vector']
+        if self.always or isinstance(values, str):
+            raise NeuredgeError('Unsupported values', 'INVALID_REQUEST', self.status)
+        if 'vectors' in data:
+            return {'inserted': len(data['vectors'])}
+        return {'results': [{'id': '1', 'score': 1.0}]}
+
+def _encodings(client):
+    """How each request sent its values"""
+    sent = [body['vectors'][0]['values'] if 'vectors' in body else body['vector'] for body in client.bodies]
+    return ['base64' if isinstance(values, str) else 'json' for values in sent]
+
+@pytest.mark.parametrize('status', [400, 415, 422])
+def test_rejected_base64_falls_back_to_json_and_sticks(status):
+    client = _FakeVectorClient(status)
+    vector = VectorStoreCapabilities(client)
+    packed = struct.pack('<4f', *VALUES)
+    vector.add_vectors('docs', [{'id': '1', 'values': packed}])
+    assert _encodings(client) == ['base64', 'json']
+    assert client.bodies[1]['vectors'][0]['values'] == pytest.approx(VALUES)
+    # Later requests go straight to JSON, searches included
+    vector.add_vectors('docs', [{'id': '2', 'values': packed}])
+    assert vector.search_vector('docs', packed) == [{'id': '1', 'score': 1.0}]
+    assert _encodings(client) == ['base64', 'json', 'json', 'json']
+
+def test_other_failures_do_not_fall_back():
+    client = _FakeVectorClient(status=500)
+    vector = VectorStoreCapabilities(client)
+    with pytest.raises(NeuredgeError) as info:
+        vector.add_vectors('docs', [{'id': '1', 'values': VALUES}], {'encoding': 'base64'})
+    assert info.value.status_code == 500
+    assert _encodings(client) == ['base64']
+    assert not vector._base64_rejected
+
+def test_base64_error_is_raised_when_json_fails_too():
+    client = _FakeVectorClient(status=422, always=True)
+    vector = VectorStoreCapabilities(client)
+    with pytest.raises(NeuredgeError) as info:
+        vector.add_vectors('docs', [{'id': '1', 'values': VALUES}], {'encoding': 'base64'})
+    assert info.value.status_code == 422
+    assert _encodings(client) == ['base64', 'json']
+    assert not vector._base64_rejected
+
+def test_float_lists_are_sent_as_json_by_default():
+    client = _FakeVectorClient()
+    vector = VectorStoreCapabilities(client)
+    vector.add_vectors('docs', [{'id': '1', 'values': VALUES}])
+    assert _encodings(client) == ['json']
+    with pytest.raises(NeuredgeError):
+        vector.add_vectors('docs', [{'id': '1', 'values': VALUES}], {'encoding': 'msgpack'})
@@ -0,0 +1,190 @@
+import asyncio
+import contextlib
+
+import pytest
+from aiohttp import web
+
+from neuredge_sdk.async_client import AsyncNeuredgeClient
+from neuredge_sdk.retry import RetryPolicy
+from neuredge_sdk.types import NeuredgeError
+
+PNG = b'\x89PNG\r\n\x1a\n' + bytes(range(256)) * 64
+
+@contextlib.asynccontextmanager
+async def _serve(routes, **client_options):
+    """Run an aiohttp app on a free local port and yield a client pointed at it"""
+    app = web.Application()
+    app.add_routes(routes)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    options = {'retry_policy': RetryPolicy(max_retries=3, initial_delay=0, jitter=False), **client_options}
+    client = AsyncNeuredgeClient('test-key', base_url=f'http://127.0.0.1:{port}', **options)
+    try:
+        yield client
+    finally:
+        await client.close()
+        await runner.cleanup()
+
+def _run(coro):
+    return asyncio.run(coro)
+
+def test_post_get_and_delete_send_json_and_auth():
+    seen = []
+
+    async def echo(request):
+        body = await request.json() if request.can_read_body else None
+        seen.append((request.method, request.path, request.headers['Authorization'], body))
+        return web.json_response({'method': request.method, 'body': body})
+
+    async def run():
+        async with _serve([web.route('*', '/v1/{tail:.*}', echo)]) as client:
+            return (
+                await client.post('/v1/items', {'a': 1}),
+                await client.get('/v1/items/1'),
+                await client.delete('/v1/items', {'ids': [1]}),
+                await client.delete('/v1/items/2'),
+            )
+
+    posted, got, deleted, deleted_plain = _run(run())
+    assert posted == {'method': 'POST', 'body': {'a': 1}}
+    assert got == {'method': 'GET', 'body': None}
+    assert deleted == {'method': 'DELETE', 'body': {'ids': [1]}}
+    assert deleted_plain['body'] is None
+    assert all(auth == 'Bearer test-key' for _, _, auth, _ in seen)
+
+def test_transient_failures_are_retried():
+    attempts = []
+
+    async def flaky(request):
+        attempts.append(1)
+        if len(attempts) < 3:
+            return web.json_response({'error': {'message': 'busy', 'type': 'unavailable'}}, status=503)
+        return web.json_response({'ok': True})
+
+    async def run():
+        async with _serve([web.post('/x', flaky)]) as client:
+            return await client.post('/x', {})
+
+    assert _run(run()) == {'ok': True}
+    assert len(attempts) == 3
+
+def test_errors_carry_status_code_and_retry_after():
+    attempts = []
+
+    async def rejected(request):
+        attempts.append(1)
+        return web.json_response(
+            {'error': {'message': 'slow down', 'type': 'rate_limited'}},
+            status=429, headers={'Retry-After': '0'}
+        )
+
+    async def bad(request):
+        attempts.append(1)
+        return web.json_response({'error': {'message': 'bad input', 'type': 'invalid_request'}}, status=400)
+
+    async def run():
+        async with _serve([web.post('/throttled', rejected), web.post('/bad', bad)]) as client:
+            with pytest.raises(NeuredgeError) as throttled:
+                await client.post('/throttled', {})
+            retried = len(attempts)
+            with pytest.raises(NeuredgeError) as invalid:
+                await client.post('/bad', {})
+            return throttled.value, retried, invalid.value
+
+    throttled, retried, invalid = _run(run())
+    assert (throttled.status_code, throttled.code, throttled.retry_after) == (429, 'RATE_LIMITED', 0.0)
+    assert retried == 3
+    assert (invalid.status_code, invalid.code, invalid.message) == (400, 'INVALID_REQUEST', 'bad input')
+
+def test_non_idempotent_post_is_not_retried_on_server_error():
+    attempts = []
+
+    async def failing(request):
+        attempts.append(1)
+        return web.json_response({'error': {'message': 'boom'}}, status=500)
+
+    async def run():
+        async with _serve([web.post('/x', failing)]) as client:
+            with pytest.raises(NeuredgeError):
+                await client.post('/x', {}, idempotent=False)
+
+    _run(run())
+    assert len(attempts) == 1
+
+def test_binary_response_returns_bytes():
+    accepts = []
+
+    async def image(request):
+        accepts.append(request.headers.get('Accept'))
+        return web.Response(body=PNG, content_type='image/png')
+
+    async def run():
+        async with _serve([web.post('/img', image)]) as client:
+            return await client.post('/img', {'prompt': 'x'}, binary_response=True)
+
+    assert _run(run()) == PNG
+    assert 'image/*' in accepts[0]
+
+def test_post_stream_restarts_consume_after_a_failed_attempt():
+    attempts = []
+
+    async def image(request):
+        attempts.append(1)
+        if len(attempts) == 1:
+            return web.json_response({'error': {'message': 'busy'}}, status=503)
+        response = web.StreamResponse(headers={'Content-Type': 'image/png'})
+        await response.prepare(request)
+        for start in range(0, len(PNG), 1000):
+            await response.write(PNG[start:start + 1000])
+        await response.write_eof()
+        return response
+
+    consumed = []
+
+    async def consume(content_type, chunks):
+        consumed.append(content_type)
+        return b''.join([chunk async for chunk in chunks])
+
+    async def run():
+        async with _serve([web.post('/img', image)]) as client:
+            return await client.post_stream('/img', {'prompt': 'x'}, consume)
+
+    assert _run(run()) == PNG
+    # consume only sees the successful attempt
+    assert consumed == ['image/png']
+    assert len(attempts) == 2
+
+def test_network_errors_are_retried_then_raised():
+    async def run():
+        # Nothing listens on this port once the server is gone
+        async with _serve([]) as client:
+            base_url = client.get_base_url()
+        client = AsyncNeuredgeClient(
+            'test-key', base_url=base_url,
+            retry_policy=RetryPolicy(max_retries=2, initial_delay=0, jitter=False)
+        )
+        try:
+            with pytest.raises(NeuredgeError) as info:
+                await client.get('/x')
+        finally:
+            await client.close()
+        return info.value
+
+    assert _run(run()).code == 'NETWORK_ERROR'
+
+def test_session_is_reused_and_closed():
+    async def ok(request):
+        return web.json_response({'ok': True})
+
+    async def run():
+        async with _serve([web.get('/x', ok)]) as client:
+            await client.get('/x')
+            session = client._session
+            await client.get('/x')
+            assert client._session is session
+        return client._session
+
+    assert _run(run()) is None
@@ -0,0 +1,152 @@
+import asyncio
+import threading
+
+import pytest
+
+from neuredge_sdk.capabilities.vector import VectorStoreCapabilities, AsyncVectorStoreCapabilities
+from neuredge_sdk.types import NeuredgeError
+
+class _FakeVectorClient:
+    """
+    Records uploaded and deleted IDs; requests touching an ID in `failing`
+    fail with a 503 until `failures` runs out
+    """
+
+    def __init__(self, failing=(), failures=float('inf')):
+        self.failing = set(failing)
+        self.failures = failures
+        self.requests = []
+        self.bodies = []
+        self.deleted = []
+        self._lock = threading.Lock()
+
+    def _send(self, ids):
+        with self._lock:
+            self.requests.append(list(ids))
+            if self.failing.intersection(ids) and self.failures > 0:
+                self.failures -= 1
+                raise NeuredgeError('Service unavailable', 'SERVICE_UNAVAILABLE', 503)
+
+    def post(self, endpoint, data, **kwargs):
+        ids = [v['id'] for v in data['vectors']]
+        self._send(ids)
+        self.bodies.append(data)
+        return {'inserted': len(ids)}
+
+    def delete(self, endpoint, data=None, **kwargs):
+        self._send(data['ids'])
+        self.deleted.extend(data['ids'])
+
+class _AsyncFakeVectorClient(_FakeVectorClient):
+    async def post(self, endpoint, data, **kwargs):
+        return _FakeVectorClient.post(self, endpoint, data, **kwargs)
+
+    async def delete(self, endpoint, data=None, **kwargs):
+        return _FakeVectorClient.delete(self, endpoint, data, **kwargs)
+
+def _vectors(count):
+    return ({'id': f'v{i}', 'values': [float(i), 0.0]} for i in range(count))
+
+def test_upsert_bulk_batches_an_array_by_rows():
+    np = pytest.importorskip('numpy')
+    client = _FakeVectorClient()
+    matrix = np.arange(14, dtype=np.float32).reshape(7, 2)
+    stats = VectorStoreCapabilities(client).upsert_bulk('docs', matrix, batch_size=3, concurrency=2)
+    assert sorted(client.requests) == [['0', '1', '2'], ['3', '4', '5'], ['6']]
+    assert (stats['inserted'], stats['batches'], stats['failed']) == (7, 3, 0)
+    # Array rows are sent as base64 float32
+    assert all(isinstance(v['values'], str) for body in client.bodies for v in body['vectors'])
+
+def test_upsert_bulk_uses_given_ids_for_array_rows():
+    np = pytest.importorskip('numpy')
+    client = _FakeVectorClient()
+    matrix = np.zeros((3, 2), dtype=np.float32)
+    VectorStoreCapabilities(client).upsert_bulk('docs', matrix, ids=['a', 'b', 'c'], batch_size=2)
+    assert sorted(client.requests) == [['a', 'b'], ['c']]
+
+def test_upsert_bulk_retries_a_failed_batch_in_a_later_round():
+    client = _FakeVectorClient(failing={'v4'}, failures=1)
+    stats = VectorStoreCapabilities(client).upsert_bulk('docs', _vectors(9), batch_size=3, concurrency=1)
+    assert client.requests == [['v0', 'v1', 'v2'], ['v3', 'v4', 'v5'], ['v6', 'v7', 'v8'], ['v3', 'v4', 'v5']]
+    assert (stats['inserted'], stats['retried_batches'], stats['failed']) == (9, 1, 0)
+
+def test_upsert_bulk_reports_the_ids_of_batches_that_never_succeed():
+    client = _FakeVectorClient(failing={'v4'})
+    stats = VectorStoreCapabilities(client).upsert_bulk(
+        'docs', _vectors(9), batch_size=3, concurrency=3, max_batch_retries=2
+    )
+    assert client.requests.count(['v3', 'v4', 'v5']) == 3
+    assert stats['failed_ids'] == ['v3', 'v4', 'v5']
+    assert (stats['inserted'], stats['failed'], stats['failed_batches'], stats['batches']) == (6, 3, 1, 2)
+
+def test_upsert_bulk_reports_progress_after_each_batch():
+    reports = []
+    client = _FakeVectorClient(failing={'v0'}, failures=1)
+    VectorStoreCapabilities(client).upsert_bulk(
+        'docs', _vectors(5), batch_size=2, concurrency=1, on_progress=reports.append
+    )
+    # Three first attempts plus the retry of the failed one
+    assert len(reports) == 4
+    assert [report['inserted'] for report in reports] == [0, 2, 3, 5]
+    assert reports[0]['retried_batches'] == 1
+
+def test_upsert_bulk_rejects_invalid_concurrency():
+    with pytest.raises(NeuredgeError):
+        VectorStoreCapabilities(_FakeVectorClient()).upsert_bulk('docs', _vectors(2), concurrency=0)
+
+def test_async_upsert_bulk_retries_and_reports_failures():
+    client = _AsyncFakeVectorClient(failing={'v7'})
+    vector = AsyncVectorStoreCapabilities(client)
+
+    async def source():
+        for item in _vectors(9):
+            yield item
+
+    stats = asyncio.run(vector.upsert_bulk('docs', source(), batch_size=3, max_batch_retries=1))
+    assert stats['failed_ids'] == ['v6', 'v7', 'v8']
+    assert stats['inserted'] == 6
+    assert client.requests.count(['v6', 'v7', 'v8']) == 2
+
+def test_delete_bulk_reads_ids_lazily_from_a_generator():
+    client = _FakeVectorClient()
+    consumed = []
+
+    def ids():
+        for i in range(7):
+            consumed.append(i)
+            yield f'v{i}'
+
+    stats = VectorStoreCapabilities(client).delete_bulk('docs', ids(), batch_size=3, concurrency=2)
+    assert sorted(client.deleted) == sorted(f'v{i}' for i in range(7))
+    assert (stats['deleted'], stats['batches'], stats['failed']) == (7, 3, 0)
+    assert consumed == list(range(7))
+
+def test_delete_bulk_retries_a_failed_batch_in_a_later_round():
+    client = _FakeVectorClient(failing={'v1'}, failures=2)
+    stats = VectorStoreCapabilities(client).delete_bulk(
+        'docs', (f'v{i}' for i in range(6)), batch_size=2, concurrency=1
+    )
+    assert client.requests.count(['v0', 'v1']) == 3
+    assert (stats['deleted'], stats['retried_batches'], stats['failed']) == (6, 2, 0)
+
+def test_delete_bulk_reports_partial_failure():
+    client = _FakeVectorClient(failing={'v1', 'v4'})
+    reports = []
+    stats = VectorStoreCapabilities(client).delete_bulk(
+        'docs', [f'v{i}' for i in range(6)], batch_size=2, concurrency=2,
+        on_progress=reports.append, max_batch_retries=1
+    )
+    assert sorted(stats['failed_ids']) == ['v0', 'v1', 'v4', 'v5']
+    assert (stats['deleted'], stats['failed'], stats['failed_batches']) == (2, 4, 2)
+    assert client.deleted == ['v2', 'v3']
+    assert [error['code'] for error in stats['errors']] == ['SERVICE_UNAVAILABLE'] * 2
+    assert all(error['ids'] == 2 for error in stats['errors'])
+    assert reports[-1]['deleted'] == 2
+
+def test_async_delete_bulk_reports_partial_failure():
+    client = _AsyncFakeVectorClient(failing={'v0'})
+    stats = asyncio.run(AsyncVectorStoreCapabilities(client).delete_bulk(
+        'docs', (f'v{i}' for i in range(4)), batch_size=2, max_batch_retries=0
+    ))
+    assert stats['failed_ids'] == ['v0', 'v1']
+    assert stats['deleted'] == 2
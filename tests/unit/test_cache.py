@@ -0,0 +1,174 @@
+import asyncio
+import threading
+import types
+
+from neuredge_sdk import cache as cache_module
+from neuredge_sdk.async_client import AsyncNeuredgeClient
+from neuredge_sdk.cache import MemoryCache, SQLiteCache, make_cache_key
+
+class _Clock:
+    """Manually advanced stand-in for the time module"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+def _fake_time(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(cache_module, 'time', types.SimpleNamespace(
+        monotonic=clock.monotonic, time=clock.time
+    ))
+    return clock
+
+def test_cache_key_ignores_payload_key_order():
+    url = 'https://api.neuredge.dev/summarize'
+    assert make_cache_key(url, {'a': 1, 'b': [1, 2]}) == make_cache_key(url, {'b': [1, 2], 'a': 1})
+
+def test_cache_key_depends_on_url_and_payload():
+    key = make_cache_key('https://x/summarize', {'text': 'hi'})
+    assert key != make_cache_key('https://x/sentiment', {'text': 'hi'})
+    assert key != make_cache_key('https://x/summarize', {'text': 'hi '})
+    assert key != make_cache_key('https://x/summarize', {'text': 'hi', 'lang': None})
+
+def test_cache_key_handles_unicode():
+    key = make_cache_key('https://x/translate', {'text': 'café'})
+    assert key == make_cache_key('https://x/translate', {'text': 'café'})
+    assert len(key) == 64
+
+def test_memory_cache_returns_copies():
+    cache = MemoryCache()
+    cache.set('k', {'result': [1, 2]})
+    first = cache.get('k')
+    first['result'].append(3)
+    assert cache.get('k') == {'result': [1, 2]}
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(max_entries=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1  # 'b' is now the oldest
+    cache.set('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.stats()['evictions'] == 1
+
+def test_memory_cache_evicts_by_bytes():
+    cache = MemoryCache(max_entries=100, max_bytes=30)
+    cache.set('a', 'x' * 10)
+    cache.set('b', 'y' * 10)
+    cache.set('c', 'z' * 10)
+    stats = cache.stats()
+    assert stats['bytes'] <= 30
+    assert cache.get('a') is None
+    assert cache.get('c') == 'z' * 10
+
+def test_memory_cache_skips_values_larger_than_budget():
+    cache = MemoryCache(max_bytes=8)
+    cache.set('big', 'x' * 100)
+    assert cache.get('big') is None
+    assert cache.stats()['bytes'] == 0
+
+def test_memory_cache_expires_entries(monkeypatch):
+    clock = _fake_time(monkeypatch)
+    cache = MemoryCache(ttl=10)
+    cache.set('k', 'v')
+    clock.now += 9
+    assert cache.get('k') == 'v'
+    clock.now += 2
+    assert cache.get('k') is None
+    assert cache.stats()['entries'] == 0
+
+def test_memory_cache_counts_hits_and_misses():
+    cache = MemoryCache()
+    cache.set('k', 'v')
+    cache.get('k')
+    cache.get('missing')
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['hit_rate']) == (1, 1, 0.5)
+
+def test_sqlite_cache_persists_across_connections(tmp_path):
+    path = str(tmp_path / 'responses.db')
+    cache = SQLiteCache(path)
+    cache.set('k', {'result': {'summary': 'short'}})
+    cache.close()
+
+    reopened = SQLiteCache(path)
+    assert reopened.get('k') == {'result': {'summary': 'short'}}
+    reopened.close()
+
+def test_sqlite_cache_expires_entries(monkeypatch, tmp_path):
+    clock = _fake_time(monkeypatch)
+    cache = SQLiteCache(str(tmp_path / 'responses.db'), ttl=10)
+    cache.set('k', 'v')
+    clock.now += 11
+    assert cache.get('k') is None
+    assert cache.stats()['entries'] == 0
+    cache.close()
+
+def test_sqlite_cache_evicts_least_recently_used(monkeypatch, tmp_path):
+    clock = _fake_time(monkeypatch)
+    cache = SQLiteCache(str(tmp_path / 'responses.db'), max_entries=2)
+    cache.set('a', 1)
+    clock.now += 1
+    cache.set('b', 2)
+    clock.now += 1
+    assert cache.get('a') == 1
+    clock.now += 1
+    cache.set('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.stats()['entries'] == 2
+    cache.close()
+
+class _ThreadRecordingCache(SQLiteCache):
+    """Records the thread each disk read and write runs on"""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.threads = []
+
+    def _load(self, key):
+        self.threads.append(threading.get_ident())
+        return super()._load(key)
+
+    def _store(self, key, value):
+        self.threads.append(threading.get_ident())
+        super()._store(key, value)
+
+class _JsonResponse:
+    status = 200
+    ok = True
+    headers = {'Content-Type': 'application/json'}
+
+    async def read(self):
+        return b'{"result": {"summary": "short"}}'
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+def test_async_client_keeps_cache_io_off_the_event_loop(tmp_path):
+    cache = _ThreadRecordingCache(str(tmp_path / 'responses.db'))
+    client = AsyncNeuredgeClient('key', cache=cache)
+    client._session = types.SimpleNamespace(closed=False, request=lambda *args, **kwargs: _JsonResponse())
+
+    async def run():
+        loop_thread = threading.get_ident()
+        first = await client.post('/summarize', {'text': 'long'}, cacheable=True)
+        second = await client.post('/summarize', {'text': 'long'}, cacheable=True)
+        return loop_thread, first, second
+
+    loop_thread, first, second = asyncio.run(run())
+    assert first == second == {'result': {'summary': 'short'}}
+    # miss, store, hit
+    assert len(cache.threads) == 3
+    assert loop_thread not in cache.threads
+    cache.close()
@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+
+from neuredge_sdk.capabilities.text import TextCapabilities, AsyncTextCapabilities
+from neuredge_sdk.types import NeuredgeError
+
+class _EchoClient:
+    """Answers every POST with the request body's text"""
+
+    def post(self, endpoint, data, **kwargs):
+        return {'result': {'summary': data['text']}}
+
+class _AsyncEchoClient:
+    async def post(self, endpoint, data, **kwargs):
+        return {'result': {'summary': data['text']}}
+
+@pytest.mark.parametrize('concurrency', [0, -1])
+def test_sync_rejects_non_positive_concurrency(concurrency):
+    text = TextCapabilities(_EchoClient())
+    with pytest.raises(NeuredgeError) as info:
+        text.summarize_many(['a', 'b'], concurrency=concurrency)
+    assert info.value.code == 'INVALID_REQUEST'
+
+@pytest.mark.parametrize('concurrency', [0, -1])
+def test_async_rejects_non_positive_concurrency(concurrency):
+    text = AsyncTextCapabilities(_AsyncEchoClient())
+    with pytest.raises(NeuredgeError) as info:
+        asyncio.run(text.summarize_many(['a', 'b'], concurrency=concurrency))
+    assert info.value.code == 'INVALID_REQUEST'
+
+def test_async_preserves_order():
+    text = AsyncTextCapabilities(_AsyncEchoClient())
+    results = asyncio.run(text.summarize_many(['a', 'b', 'c'], concurrency=2))
+    assert [r['index'] for r in results] == [0, 1, 2]
+    assert all(r['error'] is None for r in results)
+
+@pytest.mark.parametrize('concurrency', [0, -1])
+def test_sync_stream_rejects_concurrency_at_the_call(concurrency):
+    text = TextCapabilities(_EchoClient())
+    # Raised before any result is requested, not on the first next()
+    with pytest.raises(NeuredgeError) as info:
+        text.analyze_sentiment_stream(['a', 'b'], concurrency=concurrency)
+    assert info.value.code == 'INVALID_REQUEST'
+
+@pytest.mark.parametrize('concurrency', [0, -1])
+def test_async_stream_rejects_concurrency_at_the_call(concurrency):
+    text = AsyncTextCapabilities(_AsyncEchoClient())
+    with pytest.raises(NeuredgeError) as info:
+        text.analyze_sentiment_stream(['a', 'b'], concurrency=concurrency)
+    assert info.value.code == 'INVALID_REQUEST'
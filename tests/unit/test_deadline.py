@@ -0,0 +1,138 @@
+import asyncio
+import time
+
+import pytest
+
+from neuredge_sdk.async_client import AsyncNeuredgeClient
+from neuredge_sdk.client import NeuredgeClient
+from neuredge_sdk.ratelimit import RateLimiter
+from neuredge_sdk.retry import RetryPolicy
+from neuredge_sdk.types import NeuredgeError
+
+# Enough attempts that only the deadline can end the retries
+POLICY = RetryPolicy(max_retries=50, initial_delay=0.1, max_delay=0.1, jitter=False)
+
+class _FakeResponse:
+    """A 503 with a JSON error body, for both the requests and aiohttp clients"""
+
+    status_code = status = 503
+    ok = False
+    headers = {'Content-Type': 'application/json'}
+    content = b'{"error": {"message": "unavailable"}}'
+
+    def json(self):
+        return {'error': {'message': 'unavailable'}}
+
+    async def read(self):
+        return self.content
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+class _FakeSession:
+    """Answers every request with a 503 after `latency` seconds"""
+
+    closed = False
+
+    def __init__(self, latency=0.05):
+        self.latency = latency
+        self.timeouts = []
+
+    def post(self, url, **kwargs):
+        self.timeouts.append(kwargs['timeout'])
+        time.sleep(self.latency)
+        return _FakeResponse()
+
+    def request(self, method, url, **kwargs):
+        self.timeouts.append(kwargs['timeout'])
+        session = self
+
+        class _Request:
+            async def __aenter__(self):
+                await asyncio.sleep(session.latency)
+                return _FakeResponse()
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return _Request()
+
+def _sync_client(**kwargs):
+    client = NeuredgeClient('key', retry_policy=POLICY, **kwargs)
+    client._session = _FakeSession()
+    return client
+
+def _async_client(**kwargs):
+    client = AsyncNeuredgeClient('key', retry_policy=POLICY, **kwargs)
+    client._session = _FakeSession()
+    return client
+
+def test_retries_stop_at_the_deadline():
+    client = _sync_client()
+    start = time.monotonic()
+    with pytest.raises(NeuredgeError) as info:
+        client.post('/x', {}, timeout=0.5)
+    elapsed = time.monotonic() - start
+    assert info.value.status_code == 503
+    assert 0.3 <= elapsed < 0.7
+    assert 2 <= len(client._session.timeouts) < 6
+
+def test_client_timeout_is_the_default_budget():
+    client = _sync_client(timeout=0.4)
+    start = time.monotonic()
+    with pytest.raises(NeuredgeError):
+        client.post('/x', {})
+    assert time.monotonic() - start < 0.6
+
+def test_socket_timeouts_are_clipped_to_the_remaining_budget():
+    client = _sync_client(connect_timeout=10.0, read_timeout=60.0)
+    with pytest.raises(NeuredgeError):
+        client.post('/x', {}, timeout=0.5)
+    connect, read = client._session.timeouts[-1]
+    assert connect == read and read < 0.5
+
+def test_rate_limiter_wait_counts_against_the_deadline():
+    limiter = RateLimiter(requests_per_second=2, burst=1, adaptive=False)
+    client = _sync_client(rate_limiter=limiter)
+    # Spend the only token, so the next request waits half a second for one
+    limiter.acquire()
+    limiter.release()
+    start = time.monotonic()
+    with pytest.raises(NeuredgeError) as info:
+        client.post('/x', {}, timeout=0.2)
+    assert info.value.code == 'TIMEOUT'
+    assert client._session.timeouts == []
+    assert time.monotonic() - start < 0.7
+
+def test_async_retries_stop_at_the_deadline():
+    client = _async_client()
+
+    async def run():
+        start = time.monotonic()
+        with pytest.raises(NeuredgeError) as info:
+            await client.post('/x', {}, timeout=0.5)
+        return info.value, time.monotonic() - start
+
+    error, elapsed = asyncio.run(run())
+    assert error.status_code == 503
+    assert 0.3 <= elapsed < 0.7
+    assert 2 <= len(client._session.timeouts) < 6
+    # Each attempt's total timeout is what was left of the budget
+    assert all(timeout.total < 0.5 for timeout in client._session.timeouts)
+
+def test_async_rate_limiter_wait_counts_against_the_deadline():
+    limiter = RateLimiter(requests_per_second=2, burst=1, adaptive=False)
+    client = _async_client(rate_limiter=limiter)
+
+    async def run():
+        await limiter.acquire_async()
+        limiter.release_async()
+        with pytest.raises(NeuredgeError) as info:
+            await client.post('/x', {}, timeout=0.2)
+        return info.value
+
+    assert asyncio.run(run()).code == 'TIMEOUT'
+    assert client._session.timeouts == []
@@ -0,0 +1,181 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from neuredge_sdk.cache import EmbeddingCache
+from neuredge_sdk.openai.embeddings import Embeddings, AsyncEmbeddings
+from neuredge_sdk.types import NeuredgeError
+
+class _FakeClient:
+    def __init__(self, embedding_cache=None):
+        self._embedding_cache = embedding_cache
+
+    def get_api_key(self):
+        return 'test-key'
+
+    def get_base_url(self):
+        return 'http://localhost'
+
+    def get_embedding_cache(self):
+        return self._embedding_cache
+
+class _FakeEmbeddingsApi:
+    """Embeds text 'item N' as [N, 0]; batches containing a poisoned text fail"""
+
+    def __init__(self, poisoned=(), failures=float('inf')):
+        self.poisoned = set(poisoned)
+        self.failures = failures
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def create(self, input, model, **kwargs):
+        with self._lock:
+            self.calls.append(list(input))
+            if self.poisoned.intersection(input) and self.failures > 0:
+                self.failures -= 1
+                raise RuntimeError('upstream unavailable')
+        return SimpleNamespace(
+            data=[
+                SimpleNamespace(index=i, embedding=[float(text.split()[1]), 0.0])
+                for i, text in enumerate(input)
+            ],
+            model=model,
+            usage=SimpleNamespace(dict=lambda: {'prompt_tokens': len(input), 'total_tokens': len(input)})
+        )
+
+def _embeddings(api, cache=None):
+    embeddings = Embeddings(_FakeClient(cache))
+    embeddings._openai = SimpleNamespace(embeddings=api)
+    return embeddings
+
+TEXTS = [f"item {i}" for i in range(10)]
+
+def test_failed_batches_are_retried():
+    api = _FakeEmbeddingsApi(poisoned={'item 4'}, failures=2)
+    result = _embeddings(api).embed_many(TEXTS, batch_size=3, max_batch_retries=2)
+    assert [item['embedding'][0] for item in result['data']] == list(range(10))
+    # Only the failing batch was sent again
+    assert api.calls.count(['item 3', 'item 4', 'item 5']) == 3
+    assert api.calls.count(['item 0', 'item 1', 'item 2']) == 1
+
+def test_persistent_failure_raises_one_aggregate_error():
+    api = _FakeEmbeddingsApi(poisoned={'item 1', 'item 7'})
+    with pytest.raises(NeuredgeError) as info:
+        _embeddings(api).embed_many(TEXTS, batch_size=3, max_batch_retries=1)
+    error = info.value
+    assert error.code == 'BATCH_FAILED'
+    assert error.details['failed_ranges'] == [(0, 3), (6, 9)]
+    assert '0-2' in error.message and '6-8' in error.message
+    assert len(error.details['errors']) == 2
+    embeddings = error.details['embeddings']
+    assert [e is None for e in embeddings] == [True] * 3 + [False] * 3 + [True] * 3 + [False]
+    assert embeddings[4] == [4.0, 0.0]
+
+def test_successful_batches_are_cached_before_raising():
+    cache = EmbeddingCache()
+    api = _FakeEmbeddingsApi(poisoned={'item 7'})
+    embeddings = _embeddings(api, cache)
+    with pytest.raises(NeuredgeError) as info:
+        embeddings.embed_many(TEXTS, batch_size=3, max_batch_retries=0)
+    assert info.value.details['failed_ranges'] == [(6, 9)]
+    assert cache.stats()['entries'] == 7
+
+    # A rerun only pays for the batch that failed
+    api.poisoned.clear()
+    api.calls.clear()
+    result = embeddings.embed_many(TEXTS, batch_size=3)
+    assert api.calls == [['item 6', 'item 7', 'item 8']]
+    assert [item['embedding'][0] for item in result['data']] == list(range(10))
+
+def test_failed_ranges_refer_to_caller_input_with_cache_hits():
+    cache = EmbeddingCache()
+    cache.set_many('@cf/baai/bge-base-en-v1.5', ['item 0', 'item 1'], [[0.0, 0.0], [1.0, 0.0]])
+    api = _FakeEmbeddingsApi(poisoned={'item 5'})
+    with pytest.raises(NeuredgeError) as info:
+        _embeddings(api, cache).embed_many(TEXTS, batch_size=4, max_batch_retries=0)
+    # Misses are items 2-9, batched as 2-5 and 6-9
+    assert info.value.details['failed_ranges'] == [(2, 6)]
+    assert info.value.details['embeddings'][0] == [0.0, 0.0]
+
+class _FakeTokenApi:
+    """Embeds each item as [its length, 0]; a flat token array is one item"""
+
+    def __init__(self):
+        self.calls = []
+
+    def _response(self, input, model):
+        items = [input] if input and isinstance(input[0], int) else input
+        return SimpleNamespace(
+            data=[SimpleNamespace(index=i, embedding=[float(len(item)), 0.0]) for i, item in enumerate(items)],
+            model=model,
+            usage=None
+        )
+
+    def create(self, input, model, **kwargs):
+        self.calls.append(input)
+        return self._response(input, model)
+
+class _AsyncFakeTokenApi(_FakeTokenApi):
+    async def create(self, input, model, **kwargs):
+        self.calls.append(input)
+        return self._response(input, model)
+
+@pytest.mark.parametrize('options', [{'batch_size': 2}, {'max_batch_tokens': 2}])
+def test_single_token_array_is_not_batched(options):
+    api = _FakeTokenApi()
+    result = _embeddings(api).create([1, 2, 3, 4, 5], **options)
+    assert api.calls == [[1, 2, 3, 4, 5]]
+    assert [item['embedding'] for item in result['data']] == [[5.0, 0.0]]
+
+@pytest.mark.parametrize('options', [{'batch_size': 2}, {'max_batch_tokens': 2}])
+def test_single_token_array_is_not_batched_async(options):
+    api = _AsyncFakeTokenApi()
+    embeddings = AsyncEmbeddings(_FakeClient())
+    embeddings._openai = SimpleNamespace(embeddings=api)
+    result = asyncio.run(embeddings.create([1, 2, 3, 4, 5], **options))
+    assert api.calls == [[1, 2, 3, 4, 5]]
+    assert len(result['data']) == 1
+
+def test_token_arrays_are_batched():
+    api = _FakeTokenApi()
+    result = _embeddings(api).create([[1, 2], [3], [4, 5, 6]], batch_size=2)
+    assert api.calls == [[[1, 2], [3]], [[4, 5, 6]]]
+    assert [item['embedding'][0] for item in result['data']] == [2.0, 1.0, 3.0]
+
+class _RejectingApi(_FakeEmbeddingsApi):
+    """Rejects batches of more than `limit` items with the given status and message"""
+
+    def __init__(self, status, message, limit=0):
+        super().__init__()
+        self.status = status
+        self.message = message
+        self.limit = limit
+
+    def create(self, input, model, **kwargs):
+        if len(input) > self.limit:
+            with self._lock:
+                self.calls.append(list(input))
+            raise NeuredgeError(self.message, 'INVALID_REQUEST', self.status)
+        return super().create(input, model, **kwargs)
+
+@pytest.mark.parametrize('status, message', [
+    (413, 'Payload too large'),
+    (400, 'Too many tokens in batch'),
+    (400, 'too many inputs: max 2'),
+])
+def test_oversized_batches_are_split(status, message):
+    api = _RejectingApi(status, message, limit=2)
+    result = _embeddings(api).embed_many(TEXTS[:4], batch_size=4)
+    assert [item['embedding'][0] for item in result['data']] == [0, 1, 2, 3]
+    assert api.calls[0] == TEXTS[:4]
+
+@pytest.mark.parametrize('status', [400, 401, 404, 422])
+def test_other_client_errors_are_raised_without_splitting_or_retrying(status):
+    api = _RejectingApi(status, 'Unknown model')
+    with pytest.raises(NeuredgeError) as info:
+        _embeddings(api).embed_many(TEXTS[:4], batch_size=4, max_batch_retries=3)
+    assert info.value.status_code == status
+    assert info.value.code != 'BATCH_FAILED'
+    assert api.calls == [TEXTS[:4]]
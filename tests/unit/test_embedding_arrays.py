@@ -0,0 +1,92 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from neuredge_sdk.arrays import encode_float32
+from neuredge_sdk.cache import EmbeddingCache
+from neuredge_sdk.openai.embeddings import Embeddings
+from neuredge_sdk.types import NeuredgeError
+
+class _FakeClient:
+    def __init__(self, embedding_cache=None):
+        self._embedding_cache = embedding_cache
+
+    def get_api_key(self):
+        return 'test-key'
+
+    def get_base_url(self):
+        return 'http://localhost'
+
+    def get_embedding_cache(self):
+        return self._embedding_cache
+
+class _FakeEmbeddingsApi:
+    """Embeds text 'item N' as [N, N + 0.5, -N], base64-encoded when asked"""
+
+    def __init__(self):
+        self.kwargs = []
+        self._lock = threading.Lock()
+
+    def create(self, input, model, **kwargs):
+        with self._lock:
+            self.kwargs.append(kwargs)
+        encode = encode_float32 if kwargs.get('encoding_format') == 'base64' else list
+        vectors = [[float(n), n + 0.5, -float(n)] for n in (int(text.split()[1]) for text in input)]
+        return SimpleNamespace(
+            data=[SimpleNamespace(index=i, embedding=encode(v)) for i, v in enumerate(vectors)],
+            model=model,
+            usage=None
+        )
+
+def _embeddings(api, cache=None):
+    embeddings = Embeddings(_FakeClient(cache))
+    embeddings._openai = SimpleNamespace(embeddings=api)
+    return embeddings
+
+TEXTS = [f"item {i}" for i in range(5)]
+EXPECTED = np.array([[i, i + 0.5, -i] for i in range(5)], dtype=np.float32)
+
+def test_numpy_result_is_one_float32_matrix():
+    api = _FakeEmbeddingsApi()
+    result = _embeddings(api).create(TEXTS, return_type='numpy')
+    embeddings = result['embeddings']
+    assert embeddings.shape == (5, 3)
+    assert embeddings.dtype == np.float32
+    assert embeddings.flags['C_CONTIGUOUS']
+    np.testing.assert_array_equal(embeddings, EXPECTED)
+    assert 'data' not in result
+
+def test_numpy_result_keeps_input_order_across_batches():
+    api = _FakeEmbeddingsApi()
+    result = _embeddings(api).embed_many(TEXTS, batch_size=2, concurrency=3, return_type='numpy')
+    np.testing.assert_array_equal(result['embeddings'], EXPECTED)
+
+def test_base64_is_requested_only_for_numpy_output():
+    api = _FakeEmbeddingsApi()
+    embeddings = _embeddings(api)
+    listed = embeddings.create(TEXTS[:2])
+    embeddings.create(TEXTS[:2], return_type='numpy')
+    assert api.kwargs == [{}, {'encoding_format': 'base64'}]
+    assert listed['data'][1]['embedding'] == [1.0, 1.5, -1.0]
+
+def test_explicit_encoding_format_is_kept():
+    api = _FakeEmbeddingsApi()
+    _embeddings(api).create(TEXTS[:1], return_type='numpy', encoding_format='float')
+    assert api.kwargs == [{'encoding_format': 'float'}]
+
+def test_numpy_result_mixes_cache_hits_and_misses():
+    cache = EmbeddingCache()
+    api = _FakeEmbeddingsApi()
+    embeddings = _embeddings(api, cache)
+    embeddings.create(TEXTS[:3])
+    result = embeddings.create(TEXTS, return_type='numpy')
+    np.testing.assert_array_equal(result['embeddings'], EXPECTED)
+    assert result['embeddings'].dtype == np.float32
+
+def test_unknown_return_type_is_rejected():
+    with pytest.raises(NeuredgeError) as info:
+        _embeddings(_FakeEmbeddingsApi()).create(TEXTS, return_type='tensor')
+    assert info.value.code == 'INVALID_REQUEST'
@@ -0,0 +1,141 @@
+import asyncio
+import random
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from neuredge_sdk.arrays import unpack_float32
+from neuredge_sdk.cache import EmbeddingCache, quantize_int8, dequantize_int8
+from neuredge_sdk.openai.embeddings import AsyncEmbeddings
+from neuredge_sdk.types import NeuredgeError
+
+MODEL = 'text-embedding-3-small'
+
+def _vectors(count, dims, seed=0):
+    rng = random.Random(seed)
+    return [[rng.uniform(-1, 1) for _ in range(dims)] for _ in range(count)]
+
+def test_round_trip_is_exact_at_float32_precision():
+    cache = EmbeddingCache()
+    vectors = [[0.5, -0.25, 1.0], [0.0, 2.0, -3.5]]
+    cache.set_many(MODEL, ['a', 'b'], vectors)
+    assert cache.get_many(MODEL, ['b', 'missing', 'a']) == [vectors[1], None, vectors[0]]
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['entries']) == (2, 1, 2)
+
+def test_namespaces_are_isolated():
+    cache = EmbeddingCache()
+    cache.set_many(MODEL, ['a'], [[1.0, 2.0]])
+    assert cache.get_many('other-model', ['a']) == [None]
+
+def test_persists_across_connections(tmp_path):
+    path = str(tmp_path / 'embeddings.db')
+    cache = EmbeddingCache(path)
+    cache.set_many(MODEL, ['a'], [[0.25, 0.5]])
+    cache.close()
+
+    reopened = EmbeddingCache(path)
+    assert reopened.get_many(MODEL, ['a']) == [[0.25, 0.5]]
+    reopened.close()
+
+def test_max_entries_bounds_the_store():
+    cache = EmbeddingCache(max_entries=3)
+    texts = [f"text {i}" for i in range(10)]
+    cache.set_many(MODEL, texts, _vectors(10, 4))
+    assert cache.stats()['entries'] == 3
+
+def test_lookups_larger_than_query_batch():
+    cache = EmbeddingCache()
+    texts = [f"text {i}" for i in range(EmbeddingCache._QUERY_BATCH * 2 + 7)]
+    vectors = [[float(i)] for i in range(len(texts))]
+    cache.set_many(MODEL, texts, vectors)
+    assert cache.get_many(MODEL, texts) == vectors
+
+def test_int8_round_trip_error_is_within_half_a_step():
+    vector = _vectors(1, 384, seed=1)[0]
+    blob = quantize_int8(vector)
+    assert len(blob) == 8 + len(vector)
+    step = (max(vector) - min(vector)) / 255
+    restored = unpack_float32(dequantize_int8(blob))
+    assert max(abs(a - b) for a, b in zip(vector, restored)) <= step / 2 + 1e-6
+
+def test_int8_handles_constant_vectors():
+    restored = unpack_float32(dequantize_int8(quantize_int8([0.75] * 8)))
+    assert restored == pytest.approx([0.75] * 8)
+
+def test_int8_cache_is_smaller_and_keyed_separately(tmp_path):
+    path = str(tmp_path / 'embeddings.db')
+    vectors = _vectors(20, 256, seed=2)
+    texts = [f"text {i}" for i in range(20)]
+
+    full = EmbeddingCache(path)
+    full.set_many(MODEL, texts, vectors)
+    full_bytes = full.stats()['stored_bytes']
+    full.close()
+
+    compact = EmbeddingCache(path, quantize='int8')
+    assert compact.get_many(MODEL, texts[:1]) == [None]
+    compact.set_many(MODEL, texts, vectors)
+    restored = compact.get_many(MODEL, texts)
+    # Both precisions share the file, so subtract the float32 entries
+    assert compact.stats()['stored_bytes'] - full_bytes < full_bytes // 3
+    for original, approx in zip(vectors, restored):
+        assert approx == pytest.approx(original, abs=2 / 255)
+    compact.close()
+
+def test_rejects_unknown_quantize_mode():
+    with pytest.raises(NeuredgeError):
+        EmbeddingCache(quantize='int4')
+
+class _ThreadRecordingCache(EmbeddingCache):
+    """Records the thread each lookup and write runs on"""
+
+    def __init__(self):
+        super().__init__()
+        self.threads = []
+
+    def get_many(self, namespace, texts):
+        self.threads.append(threading.get_ident())
+        return super().get_many(namespace, texts)
+
+    def set_many(self, namespace, texts, vectors):
+        self.threads.append(threading.get_ident())
+        super().set_many(namespace, texts, vectors)
+
+class _FakeClient:
+    def __init__(self, embedding_cache):
+        self._embedding_cache = embedding_cache
+
+    def get_api_key(self):
+        return 'test-key'
+
+    def get_base_url(self):
+        return 'http://localhost'
+
+    def get_embedding_cache(self):
+        return self._embedding_cache
+
+class _AsyncEmbeddingsApi:
+    async def create(self, input, model, **kwargs):
+        return SimpleNamespace(
+            data=[SimpleNamespace(index=i, embedding=[float(len(text)), 0.0]) for i, text in enumerate(input)],
+            model=model,
+            usage=None
+        )
+
+@pytest.mark.parametrize('batching', [{}, {'batch_size': 1}])
+def test_async_embeddings_keep_cache_io_off_the_event_loop(batching):
+    cache = _ThreadRecordingCache()
+    embeddings = AsyncEmbeddings(_FakeClient(cache))
+    embeddings._openai = SimpleNamespace(embeddings=_AsyncEmbeddingsApi())
+
+    async def run():
+        loop_thread = threading.get_ident()
+        await embeddings.create(['a', 'bb'], **batching)
+        result = await embeddings.create(['a', 'bb'], **batching)
+        return loop_thread, result
+
+    loop_thread, result = asyncio.run(run())
+    assert [item['embedding'][0] for item in result['data']] == [1.0, 2.0]
+    assert cache.threads and loop_thread not in cache.threads
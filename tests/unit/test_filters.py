@@ -0,0 +1,96 @@
+import pytest
+
+from neuredge_sdk.filters import compile_filter, filter_matches
+from neuredge_sdk.types import NeuredgeError
+
+DOC = {'lang': 'en', 'year': 2021, 'tags': ['ai', 'edge'], 'author': {'name': 'kim'}, 'draft': None}
+
+@pytest.mark.parametrize('expression, expected', [
+    ({'lang': 'en'}, True),
+    ({'lang': 'fr'}, False),
+    ({'lang': {'$eq': 'en'}}, True),
+    ({'lang': {'$ne': 'en'}}, False),
+    ({'lang': {'$ne': 'fr'}}, True),
+    ({'year': {'$gt': 2020}}, True),
+    ({'year': {'$gt': 2021}}, False),
+    ({'year': {'$gte': 2021}}, True),
+    ({'year': {'$lt': 2021}}, False),
+    ({'year': {'$lte': 2021}}, True),
+    ({'year': {'$gte': 2000, '$lt': 2022}}, True),
+    ({'lang': {'$in': ['en', 'de']}}, True),
+    ({'lang': {'$in': ['fr', 'de']}}, False),
+    ({'lang': {'$nin': ['fr', 'de']}}, True),
+    ({'lang': {'$nin': ['en']}}, False),
+    ({'author.name': 'kim'}, True),
+    ({'author.name': {'$in': ['lee']}}, False),
+    ({'draft': None}, True),
+])
+def test_field_operators(expression, expected):
+    assert compile_filter(expression)(DOC) is expected
+
+@pytest.mark.parametrize('expression, expected', [
+    ({'tags': 'ai'}, True),
+    ({'tags': {'$in': ['edge', 'web']}}, True),
+    ({'tags': {'$nin': ['edge']}}, False),
+    ({'tags': {'$ne': 'web'}}, True),
+])
+def test_list_fields_match_any_element(expression, expected):
+    assert compile_filter(expression)(DOC) is expected
+
+@pytest.mark.parametrize('expression, expected', [
+    ({'missing': 'x'}, False),
+    ({'missing': {'$gt': 0}}, False),
+    ({'missing': {'$in': ['x']}}, False),
+    # Negations match documents without the field, as in MongoDB
+    ({'missing': {'$ne': 'x'}}, True),
+    ({'missing': {'$nin': ['x']}}, True),
+    ({'missing': {'$exists': False}}, True),
+    ({'missing': {'$exists': True}}, False),
+    ({'lang': {'$exists': True}}, True),
+    ({'author.missing': 'x'}, False),
+    ({'lang.inner': 'x'}, False),
+])
+def test_missing_keys(expression, expected):
+    assert compile_filter(expression)(DOC) is expected
+
+def test_missing_metadata_behaves_like_missing_fields():
+    assert compile_filter({'lang': 'en'})(None) is False
+    assert compile_filter({'lang': {'$exists': False}})(None) is True
+
+def test_incomparable_types_never_match():
+    assert compile_filter({'lang': {'$gt': 5}})(DOC) is False
+
+@pytest.mark.parametrize('expression, expected', [
+    ({'$and': [{'lang': 'en'}, {'year': 2021}]}, True),
+    ({'$and': [{'lang': 'en'}, {'year': 2020}]}, False),
+    ({'$or': [{'lang': 'fr'}, {'year': 2021}]}, True),
+    ({'$or': [{'lang': 'fr'}, {'year': 2020}]}, False),
+    ({'$not': {'lang': 'en'}}, False),
+    ({'$or': [{'$and': [{'lang': 'en'}, {'year': {'$lt': 2000}}]}, {'tags': 'edge'}]}, True),
+    # Top-level keys are implicitly combined with $and
+    ({'lang': 'en', '$or': [{'year': 2020}, {'year': 2019}]}, False),
+])
+def test_logical_operators(expression, expected):
+    assert compile_filter(expression)(DOC) is expected
+
+@pytest.mark.parametrize('expression', [
+    'lang',
+    {'lang': {'$regex': 'e'}},
+    {'$xor': [{'lang': 'en'}]},
+    {'$and': []},
+    {'$or': {'lang': 'en'}},
+    {'lang': {'$in': 'en'}},
+])
+def test_malformed_expressions_are_rejected(expression):
+    with pytest.raises(NeuredgeError) as info:
+        compile_filter(expression)
+    assert info.value.code == 'INVALID_REQUEST'
+
+def test_filter_matches_keeps_order():
+    matches = [
+        {'id': '1', 'metadata': {'year': 2019}},
+        {'id': '2', 'metadata': {'year': 2022}},
+        {'id': '3'},
+        {'id': '4', 'metadata': {'year': 2023}},
+    ]
+    assert [m['id'] for m in filter_matches(matches, {'year': {'$gte': 2020}})] == ['2', '4']
@@ -0,0 +1,142 @@
+import asyncio
+import base64
+import io
+import json
+import os
+import threading
+
+import pytest
+
+from neuredge_sdk.capabilities.image import ImageCapabilities, AsyncImageCapabilities
+from neuredge_sdk.types import NeuredgeError
+
+def _image(prompt):
+    return b'\x89PNG' + prompt.encode('utf-8') * 100
+
+class _FakeImageClient:
+    """Returns a raw image per prompt; the prompt 'fail' is rejected"""
+
+    def _check(self, data):
+        if data['prompt'] == 'fail':
+            raise NeuredgeError('Prompt rejected', 'CONTENT_POLICY', 400)
+
+    def post(self, endpoint, data, **kwargs):
+        self._check(data)
+        return _image(data['prompt'])
+
+    def post_stream(self, endpoint, data, consume, **kwargs):
+        self._check(data)
+        # A JSON body, split into small chunks
+        body = json.dumps({'images': [base64.b64encode(_image(data['prompt'])).decode('ascii')]}).encode()
+        return consume('application/json', (body[i:i + 7] for i in range(0, len(body), 7)))
+
+class _AsyncFakeImageClient(_FakeImageClient):
+    async def post(self, endpoint, data, **kwargs):
+        return _FakeImageClient.post(self, endpoint, data, **kwargs)
+
+    async def post_stream(self, endpoint, data, consume, **kwargs):
+        self._check(data)
+
+        async def chunks():
+            yield _image(data['prompt'])
+
+        return await consume('image/png', chunks())
+
+class _AsyncJSONImageClient(_FakeImageClient):
+    """Streams a JSON body in small chunks, like the sync fake"""
+
+    async def post_stream(self, endpoint, data, consume, **kwargs):
+        body = json.dumps({'images': [base64.b64encode(_image(data['prompt'])).decode('ascii')]}).encode()
+
+        async def chunks():
+            for i in range(0, len(body), 7):
+                yield body[i:i + 7]
+
+        return await consume('application/json', chunks())
+
+class _ThreadRecordingFile(io.BytesIO):
+    """Records the thread each write runs on"""
+
+    def __init__(self):
+        super().__init__()
+        self.threads = []
+
+    def write(self, data):
+        self.threads.append(threading.get_ident())
+        return super().write(data)
+
+PROMPTS = ['cat', 'fail', 'dog']
+
+def test_images_are_returned_as_bytes_without_output_dir():
+    results = list(ImageCapabilities(_FakeImageClient()).generate_many(PROMPTS, ordered=True))
+    assert [r['index'] for r in results] == [0, 1, 2]
+    assert results[0]['result'] == _image('cat')
+    assert results[2]['result'] == _image('dog')
+
+def test_images_are_streamed_to_output_dir(tmp_path):
+    output_dir = str(tmp_path / 'out')
+    results = ImageCapabilities(_FakeImageClient()).generate_many(
+        ['cat', 'dog'], output_dir=output_dir, filename='img-{index}.png'
+    )
+    paths = {r['index']: r['result'] for r in results}
+    assert paths == {0: os.path.join(output_dir, 'img-0.png'), 1: os.path.join(output_dir, 'img-1.png')}
+    with open(paths[1], 'rb') as f:
+        assert f.read() == _image('dog')
+
+def test_failed_prompts_carry_an_error_and_leave_no_file(tmp_path):
+    results = sorted(
+        ImageCapabilities(_FakeImageClient()).generate_many(PROMPTS, output_dir=str(tmp_path)),
+        key=lambda r: r['index']
+    )
+    assert results[1]['result'] is None
+    assert results[1]['error'].code == 'CONTENT_POLICY'
+    assert results[0]['error'] is None and results[2]['error'] is None
+    assert sorted(os.listdir(tmp_path)) == ['0.png', '2.png']
+
+@pytest.mark.parametrize('concurrency', [0, -2])
+def test_invalid_concurrency_is_rejected_at_the_call(tmp_path, concurrency):
+    output_dir = str(tmp_path / 'out')
+    with pytest.raises(NeuredgeError) as info:
+        ImageCapabilities(_FakeImageClient()).generate_many(PROMPTS, concurrency=concurrency, output_dir=output_dir)
+    assert info.value.code == 'INVALID_REQUEST'
+    assert not os.path.exists(output_dir)
+
+def test_async_writes_files_and_reports_failures(tmp_path):
+    image = AsyncImageCapabilities(_AsyncFakeImageClient())
+
+    async def prompts():
+        for prompt in PROMPTS:
+            yield prompt
+
+    async def run():
+        return [r async for r in image.generate_many(prompts(), output_dir=str(tmp_path), ordered=True)]
+
+    results = asyncio.run(run())
+    assert results[1]['error'].code == 'CONTENT_POLICY'
+    with open(results[2]['result'], 'rb') as f:
+        assert f.read() == _image('dog')
+    assert sorted(os.listdir(tmp_path)) == ['0.png', '2.png']
+
+def test_async_invalid_concurrency_is_rejected_at_the_call():
+    with pytest.raises(NeuredgeError):
+        AsyncImageCapabilities(_AsyncFakeImageClient()).generate_many(PROMPTS, concurrency=0)
+
+def test_async_generate_to_writes_off_the_event_loop():
+    image = AsyncImageCapabilities(_AsyncJSONImageClient())
+    destination = _ThreadRecordingFile()
+
+    async def run():
+        return threading.get_ident(), await image.generate_to('cat', destination)
+
+    loop_thread, written = asyncio.run(run())
+    assert destination.getvalue() == _image('cat')
+    assert written == len(_image('cat'))
+    assert destination.threads and loop_thread not in destination.threads
+
+def test_async_generate_to_path_is_replaced_only_when_complete(tmp_path):
+    path = str(tmp_path / 'cat.png')
+    image = AsyncImageCapabilities(_AsyncJSONImageClient())
+    assert asyncio.run(image.generate_to('cat', path)) == len(_image('cat'))
+    with open(path, 'rb') as f:
+        assert f.read() == _image('cat')
+    assert os.listdir(tmp_path) == ['cat.png']
@@ -0,0 +1,67 @@
+import base64
+import json
+import os
+
+import pytest
+
+from neuredge_sdk.capabilities.image import _ImageStreamDecoder
+from neuredge_sdk.types import NeuredgeError
+
+IMAGE = b'\x89PNG\r\n\x1a\n' + os.urandom(6000)
+
+CHUNK_SIZES = [1, 3, 4096]
+
+def _decode(body, chunk_size, raw=False):
+    out = []
+    decoder = _ImageStreamDecoder(out.append, raw=raw)
+    for start in range(0, len(body), chunk_size):
+        decoder.feed(body[start:start + chunk_size])
+    return b''.join(out), decoder.complete
+
+def _json_body(image, prefix=''):
+    payload = {'model': 'x', 'images': [prefix + base64.b64encode(image).decode('ascii')], 'seed': 1}
+    return json.dumps(payload).encode('utf-8')
+
+@pytest.mark.parametrize('chunk_size', CHUNK_SIZES)
+@pytest.mark.parametrize('prefix', ['', 'data:image/png;base64,'])
+def test_json_body_decodes_at_any_chunk_size(chunk_size, prefix):
+    assert _decode(_json_body(IMAGE, prefix), chunk_size) == (IMAGE, True)
+
+@pytest.mark.parametrize('chunk_size', CHUNK_SIZES)
+def test_raw_body_passes_through(chunk_size):
+    assert _decode(IMAGE, chunk_size, raw=True) == (IMAGE, True)
+
+@pytest.mark.parametrize('chunk_size', CHUNK_SIZES)
+def test_json_escapes_and_line_breaks_are_removed(chunk_size):
+    encoded = base64.b64encode(IMAGE).decode('ascii')
+    wrapped = '\n'.join(encoded[i:i + 76] for i in range(0, len(encoded), 76))
+    # json.dumps escapes the newlines; escape slashes too, as some encoders do
+    body = json.dumps({'images': [wrapped]}).replace('/', '\\/').encode('utf-8')
+    assert _decode(body, chunk_size) == (IMAGE, True)
+
+@pytest.mark.parametrize('chunk_size', CHUNK_SIZES)
+def test_unpadded_base64_is_completed(chunk_size):
+    image = IMAGE[:100]
+    body = json.dumps({'images': [base64.b64encode(image).decode('ascii').rstrip('=')]}).encode('utf-8')
+    assert _decode(body, chunk_size) == (image, True)
+
+@pytest.mark.parametrize('chunk_size', CHUNK_SIZES)
+def test_images_key_that_is_not_a_list_is_skipped(chunk_size):
+    body = b'{"prompt": "draw \\"images\\"", "note": "images", ' + _json_body(IMAGE)[1:]
+    assert _decode(body, chunk_size) == (IMAGE, True)
+
+@pytest.mark.parametrize('chunk_size', CHUNK_SIZES)
+def test_only_the_first_image_is_decoded(chunk_size):
+    other = base64.b64encode(b'second').decode('ascii')
+    body = json.dumps({'images': [base64.b64encode(IMAGE).decode('ascii'), other]}).encode('utf-8')
+    assert _decode(body, chunk_size) == (IMAGE, True)
+
+def test_truncated_body_is_incomplete():
+    body = _json_body(IMAGE)
+    assert _decode(body[:len(body) // 2], 4096)[1] is False
+    assert _decode(b'{"images": []}', 3) == (b'', False)
+
+def test_invalid_base64_is_rejected():
+    with pytest.raises(NeuredgeError) as info:
+        _decode(b'{"images": ["not*base64"]}', 4096)
+    assert info.value.code == 'INVALID_RESPONSE'
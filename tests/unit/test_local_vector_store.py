@@ -0,0 +1,157 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from neuredge_sdk.vector import LocalVectorStore, LocalIndex, IVFEngine
+from neuredge_sdk.vector.local import INITIAL_CAPACITY
+from neuredge_sdk.types import NeuredgeError
+
+DIM = 16
+
+def _random(count, dim=DIM, seed=0):
+    return np.random.default_rng(seed).standard_normal((count, dim)).astype(np.float32)
+
+def _clustered(count, dim=32, clusters=50, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dim)) * 4
+    labels = rng.integers(0, clusters, count)
+    return (centers[labels] + rng.standard_normal((count, dim))).astype(np.float32)
+
+def _store(metric='cosine', **kwargs):
+    store = LocalVectorStore(**kwargs)
+    store.create_index({'name': 'docs', 'dimension': DIM, 'metric': metric})
+    return store
+
+def test_add_and_search_round_trip():
+    store = _store()
+    matrix = _random(100)
+    store.add_vectors('docs', [{'id': str(i), 'values': row} for i, row in enumerate(matrix)])
+    assert store.get_index('docs')['vector_count'] == 100
+
+    matches = store.search_vector('docs', matrix[42], {'top_k': 3, 'return_vectors': True})
+    assert matches[0]['id'] == '42'
+    assert matches[0]['score'] == pytest.approx(1.0, abs=1e-5)
+    np.testing.assert_array_equal(matches[0]['vector'], matrix[42])
+    assert len(matches) == 3
+
+def test_scores_match_numpy_for_each_metric():
+    matrix, query = _random(50), _random(1, seed=1)[0]
+    expected = {
+        'cosine': matrix @ query / (np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)),
+        'dot': matrix @ query,
+        'euclidean': np.linalg.norm(matrix - query, axis=1),
+    }
+    for metric, scores in expected.items():
+        index = LocalIndex('docs', DIM, metric)
+        index.add(list(range(50)), matrix)
+        found, ids = index.search(query, k=5)
+        order = np.argsort(scores) if metric == 'euclidean' else np.argsort(-scores)
+        assert ids[0] == list(order[:5])
+        np.testing.assert_allclose(found[0], scores[order[:5]], rtol=1e-4, atol=1e-4)
+
+def test_upsert_replaces_existing_id():
+    index = LocalIndex('docs', DIM)
+    matrix = _random(3)
+    index.add(['a', 'b', 'c'], matrix, [{'v': 1}, None, None])
+    index.add(['a'], matrix[2])
+    assert len(index) == 3
+    np.testing.assert_array_equal(index.get(['a'])[0], matrix[2])
+    # An overwrite without metadata clears it
+    assert 'metadata' not in next(v for v in index.iter_vectors() if v['id'] == 'a')
+
+def test_delete_hides_vectors():
+    store = _store()
+    matrix = _random(20)
+    store.add_vectors('docs', [{'id': str(i), 'values': row} for i, row in enumerate(matrix)])
+    store.delete_vectors('docs', ['3', '4', 'missing'])
+    assert store.get_index('docs')['vector_count'] == 18
+    ids = [m['id'] for m in store.search_vector('docs', matrix[3], {'top_k': 20})]
+    assert '3' not in ids and '4' not in ids
+    assert len(ids) == 18
+    with pytest.raises(NeuredgeError):
+        store.index('docs').get(['3'])
+
+def test_compaction_keeps_ids_vectors_and_metadata_aligned():
+    index = LocalIndex('docs', DIM)
+    count = 4 * INITIAL_CAPACITY
+    matrix = _random(count)
+    index.add(list(range(count)), matrix, [{'n': i} for i in range(count)])
+    removed = list(range(0, count, 2))
+    assert index.remove(removed) == len(removed)
+
+    # More than a quarter of the rows were dead, so they were compacted away
+    assert index._size == len(index) == count - len(removed)
+    kept = list(range(1, count, 2))
+    assert index.ids() == kept
+    np.testing.assert_array_equal(index.get(kept), matrix[kept])
+    assert [v['metadata']['n'] for v in index.iter_vectors()] == kept
+
+    _, ids = index.search(matrix[7], k=1)
+    assert ids[0] == [7]
+    # Writes after compaction land in fresh rows
+    index.add(['new'], matrix[0])
+    assert index.search(matrix[0], k=1)[1][0] == ['new']
+
+def test_memory_mapped_storage_grows_and_searches(tmp_path):
+    path = str(tmp_path / 'vectors.f32')
+    index = LocalIndex('docs', DIM, storage_path=path)
+    count = INITIAL_CAPACITY + 10
+    matrix = _random(count)
+    index.add(list(range(count)), matrix)
+    assert isinstance(index._vectors, np.memmap)
+    assert index._vectors.shape[0] >= count
+    np.testing.assert_array_equal(index.get([0, count - 1]), matrix[[0, count - 1]])
+    assert index.search(matrix[count - 1], k=1)[1][0] == [count - 1]
+
+def test_filtered_search_is_exact():
+    index = LocalIndex('docs', DIM)
+    matrix = _random(200)
+    index.add(list(range(200)), matrix, [{'even': i % 2 == 0} for i in range(200)])
+    _, ids = index.search(matrix[3], k=10, filter={'even': True})
+    assert len(ids[0]) == 10
+    assert all(i % 2 == 0 for i in ids[0])
+
+def test_rejects_wrong_dimension():
+    store = _store()
+    with pytest.raises(NeuredgeError):
+        store.add_vectors('docs', [{'id': '1', 'values': [0.1] * (DIM + 1)}])
+
+def test_ivf_recall_against_brute_force():
+    matrix = _clustered(6000)
+    queries = _clustered(100, seed=1)
+    exact = LocalIndex('exact', 32)
+    approx = LocalIndex('approx', 32, engine=IVFEngine(n_probe=8, min_train_size=1000, seed=0))
+    for index in (exact, approx):
+        index.add(list(range(len(matrix))), matrix)
+
+    _, truth = exact.search(queries, k=10)
+    scores, found = approx.search(queries, k=10)
+    recall = np.mean([len(set(t) & set(f)) / 10 for t, f in zip(truth, found)])
+    assert recall >= 0.9
+    # IVF scores are exact for the rows it does return
+    assert np.all(np.diff(scores, axis=1) <= 1e-6)
+
+def test_ivf_recall_grows_with_probes_and_is_exact_when_probing_all():
+    matrix, queries = _random(4000, 32), _random(50, 32, seed=1)
+    exact = LocalIndex('exact', 32)
+    exact.add(list(range(len(matrix))), matrix)
+    _, truth = exact.search(queries, k=10)
+
+    recalls = []
+    for n_probe in (1, 4, 16, 64):
+        approx = LocalIndex('approx', 32, engine=IVFEngine(n_lists=64, n_probe=n_probe, min_train_size=1000, seed=0))
+        approx.add(list(range(len(matrix))), matrix)
+        _, found = approx.search(queries, k=10)
+        recalls.append(np.mean([len(set(t) & set(f)) / 10 for t, f in zip(truth, found)]))
+    assert recalls == sorted(recalls)
+    assert recalls[-1] == 1.0
+
+def test_ivf_stays_consistent_after_writes_and_compaction():
+    matrix = _clustered(3000)
+    index = LocalIndex('docs', 32, engine=IVFEngine(n_probe=4, min_train_size=500, seed=0))
+    index.add(list(range(3000)), matrix)
+    index.search(matrix[0], k=1)  # trains the clusters
+    index.remove(range(0, 3000, 2))
+    index.add(['extra'], matrix[0])
+    assert index.search(matrix[0], k=1)[1][0] == ['extra']
+    assert index.search(matrix[11], k=1)[1][0] == [11]
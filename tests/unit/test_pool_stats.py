@@ -0,0 +1,107 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from neuredge_sdk.async_client import AsyncNeuredgeClient
+from neuredge_sdk.client import NeuredgeClient
+from neuredge_sdk.types import NeuredgeError
+
+class _FakeResponse:
+    status_code = status = 200
+    ok = True
+    headers = {'Content-Type': 'application/json'}
+    content = b'{"ok": true}'
+
+    def json(self):
+        return {'ok': True}
+
+    async def read(self):
+        return self.content
+
+class _BlockingSession:
+    """Holds every request until `release` is set; fails requests to /fail"""
+
+    closed = False
+
+    def __init__(self, expected):
+        self.expected = expected
+        self.arrived = 0
+        self.all_arrived = threading.Event()
+        self.release = threading.Event()
+        self._lock = threading.Lock()
+
+    def _arrive(self):
+        with self._lock:
+            self.arrived += 1
+            if self.arrived == self.expected:
+                self.all_arrived.set()
+
+    def get(self, url, **kwargs):
+        self._arrive()
+        self.release.wait(5)
+        if url.endswith('/fail'):
+            raise NeuredgeError('failed', 'INVALID_REQUEST', 400)
+        return _FakeResponse()
+
+    def request(self, method, url, **kwargs):
+        session = self
+
+        class _Request:
+            async def __aenter__(self):
+                session._arrive()
+                while not session.release.is_set():
+                    await asyncio.sleep(0.005)
+                return _FakeResponse()
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return _Request()
+
+def test_counters_rise_and_fall_across_concurrent_requests():
+    client = NeuredgeClient('key', max_connections=20, max_connections_per_host=3)
+    session = client._session = _BlockingSession(expected=5)
+    assert client.pool_stats()['in_flight'] == 0
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(client.get, '/x') for _ in range(5)]
+        assert session.all_arrived.wait(5)
+        during = client.pool_stats()
+        session.release.set()
+        assert all(future.result() == {'ok': True} for future in futures)
+
+    after = client.pool_stats()
+    assert (during['in_flight'], during['peak_in_flight'], during['total_requests']) == (5, 5, 5)
+    # The 4th and 5th requests started with the per-host pool of 3 already busy
+    assert during['saturated_requests'] == 2
+    assert (after['in_flight'], after['peak_in_flight'], after['total_requests']) == (0, 5, 5)
+    assert (after['max_connections'], after['max_connections_per_host']) == (20, 3)
+
+def test_failed_requests_release_their_slot():
+    client = NeuredgeClient('key', max_connections_per_host=2)
+    session = client._session = _BlockingSession(expected=1)
+    session.release.set()
+    with pytest.raises(NeuredgeError):
+        client.get('/fail')
+    stats = client.pool_stats()
+    assert (stats['in_flight'], stats['total_requests'], stats['saturated_requests']) == (0, 1, 0)
+
+def test_async_counters_rise_and_fall():
+    client = AsyncNeuredgeClient('key', max_connections_per_host=2)
+    session = client._session = _BlockingSession(expected=4)
+
+    async def run():
+        tasks = [asyncio.ensure_future(client.get('/x')) for _ in range(4)]
+        while not session.all_arrived.is_set():
+            await asyncio.sleep(0.005)
+        during = client.pool_stats()
+        session.release.set()
+        await asyncio.gather(*tasks)
+        return during
+
+    during = asyncio.run(run())
+    after = client.pool_stats()
+    assert (during['in_flight'], during['saturated_requests']) == (4, 2)
+    assert (after['in_flight'], after['peak_in_flight'], after['total_requests']) == (0, 4, 4)
@@ -0,0 +1,118 @@
+import random
+import sys
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from neuredge_sdk import cache as cache_module
+from neuredge_sdk.vector import LocalIndex, QuantizedEngine, ScalarQuantizer, ProductQuantizer
+from neuredge_sdk.types import NeuredgeError
+
+DIM = 64
+
+def _clustered(count, seed):
+    rng = np.random.default_rng(0)
+    centers = rng.standard_normal((40, DIM)) * 3
+    rng = np.random.default_rng(seed)
+    return (centers[rng.integers(0, 40, count)] + rng.standard_normal((count, DIM))).astype(np.float32)
+
+@pytest.fixture(scope='module')
+def data():
+    matrix, queries = _clustered(5000, seed=1), _clustered(50, seed=2)
+    exact = LocalIndex('exact', DIM)
+    exact.add(list(range(len(matrix))), matrix)
+    _, truth = exact.search(queries, k=10)
+    return matrix, queries, truth
+
+def _recall(data, engine):
+    matrix, queries, truth = data
+    index = LocalIndex('approx', DIM, engine=engine)
+    index.add(list(range(len(matrix))), matrix)
+    _, found = index.search(queries, k=10)
+    return np.mean([len(set(t) & set(f)) / 10 for t, f in zip(truth, found)])
+
+def test_int8_error_is_within_half_a_level(data):
+    matrix = data[0]
+    quantizer = ScalarQuantizer().fit(matrix)
+    codes = quantizer.encode(matrix)
+    assert codes.dtype == np.int8 and codes.shape == matrix.shape
+    assert quantizer.code_size == DIM
+    error = np.abs(quantizer.decode(codes) - matrix)
+    assert np.all(error <= quantizer._scale / 2 + 1e-5)
+
+def test_int8_dot_matches_decoded_vectors(data):
+    matrix, queries, _ = data
+    quantizer = ScalarQuantizer().fit(matrix)
+    codes = quantizer.encode(matrix[:100])
+    np.testing.assert_allclose(
+        quantizer.dot(queries, codes), queries @ quantizer.decode(codes).T, rtol=1e-4, atol=1e-3
+    )
+
+def test_pq_reconstruction_error_is_bounded(data):
+    matrix = data[0]
+    quantizer = ProductQuantizer(n_subvectors=16).fit(matrix)
+    codes = quantizer.encode(matrix)
+    assert codes.dtype == np.uint8 and codes.shape == (len(matrix), 16)
+    decoded = quantizer.decode(codes)
+    assert np.linalg.norm(decoded - matrix) / np.linalg.norm(matrix) < 0.25
+    # Every subvector decodes to its nearest centroid, so re-encoding is stable
+    np.testing.assert_array_equal(quantizer.encode(decoded), codes)
+
+def test_pq_table_and_decoded_scoring_agree(data):
+    matrix, queries, _ = data
+    quantizer = ProductQuantizer(n_subvectors=16).fit(matrix)
+    codes = quantizer.encode(matrix[:200])
+    expected = queries @ quantizer.decode(codes).T
+    # Small batches use lookup tables, large ones decode
+    np.testing.assert_allclose(quantizer.dot(queries[:4], codes), expected[:4], rtol=1e-4, atol=1e-3)
+    np.testing.assert_allclose(quantizer.dot(queries, codes), expected, rtol=1e-4, atol=1e-3)
+
+def test_pq_requires_subvectors_to_divide_dimension(data):
+    with pytest.raises(NeuredgeError):
+        ProductQuantizer(n_subvectors=7).fit(data[0])
+
+def test_int8_recall_against_float_engine(data):
+    assert _recall(data, QuantizedEngine('int8', rerank=4, min_train_size=1000)) == 1.0
+    assert _recall(data, QuantizedEngine('int8', rerank=0, min_train_size=1000)) >= 0.9
+
+def test_pq_recall_improves_with_rerank(data):
+    recalls = [
+        _recall(data, QuantizedEngine('pq', rerank=rerank, min_train_size=1000, n_subvectors=32, n_centroids=64))
+        for rerank in (0, 4, 16)
+    ]
+    assert recalls == sorted(recalls)
+    assert recalls[-1] >= 0.95
+
+def test_quantized_engine_is_smaller_than_float_storage(data):
+    matrix = data[0]
+    engine = QuantizedEngine('pq', min_train_size=1000, n_subvectors=16)
+    index = LocalIndex('docs', DIM, engine=engine)
+    index.add(list(range(len(matrix))), matrix)
+    index.search(matrix[0], k=1)
+    assert engine.memory_bytes() * 16 <= index._vectors.nbytes
+
+def test_cache_int8_numpy_and_pure_python_paths_agree(monkeypatch):
+    rng = random.Random(0)
+    vectors = [[], [0.5], [rng.uniform(-3, 3) for _ in range(384)]]
+    with_numpy = [cache_module.quantize_int8(v) for v in vectors]
+    decoded = [cache_module.dequantize_int8(b) for b in with_numpy]
+    monkeypatch.setattr(cache_module, '_numpy', lambda: None)
+    assert [cache_module.quantize_int8(v) for v in vectors] == with_numpy
+    assert [cache_module.dequantize_int8(b) for b in with_numpy] == decoded
+
+def test_quantized_engine_is_registered_on_first_use(monkeypatch):
+    from neuredge_sdk.vector import local
+    # As if quantization.py had never been imported
+    monkeypatch.delitem(local.ENGINES, 'quantized')
+    monkeypatch.delitem(sys.modules, 'neuredge_sdk.vector.quantization')
+    store = local.LocalVectorStore(engine='quantized')
+    store.create_index({'name': 'q', 'dimension': DIM, 'metric': 'cosine'})
+    assert type(store.index('q')._engine).__name__ == 'QuantizedEngine'
+    assert 'quantized' in local.ENGINES
+
+def test_unknown_engine_lists_lazy_engines(monkeypatch):
+    from neuredge_sdk.vector import local
+    monkeypatch.delitem(local.ENGINES, 'quantized')
+    with pytest.raises(NeuredgeError, match='quantized'):
+        local.LocalVectorStore(engine='annoy')
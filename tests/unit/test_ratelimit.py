@@ -0,0 +1,20 @@
+from neuredge_sdk.ratelimit import RateLimiter
+from neuredge_sdk.types import NeuredgeError
+
+def _throttled(retry_after):
+    return NeuredgeError('Too many requests', 'RATE_LIMITED', 429, retry_after=retry_after)
+
+def test_retry_after_pause_is_capped():
+    limiter = RateLimiter(requests_per_second=10, max_pause=5.0)
+    limiter.on_error(_throttled(86400))
+    assert 0 < limiter.stats()['paused_for'] <= 5.0
+
+def test_short_retry_after_is_honored():
+    limiter = RateLimiter(requests_per_second=10, max_pause=5.0)
+    limiter.on_error(_throttled(1.0))
+    assert 0 < limiter.stats()['paused_for'] <= 1.0
+
+def test_reset_header_pause_is_capped():
+    limiter = RateLimiter(requests_per_second=10, max_pause=5.0)
+    limiter.observe({'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '3600'}, {})
+    assert 0 < limiter.stats()['paused_for'] <= 5.0
@@ -0,0 +1,52 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from neuredge_sdk.capabilities.vector import VectorStoreCapabilities
+
+class _FakeVectorClient:
+    """Server that accepts any write and reports a fixed vector count"""
+
+    def __init__(self, count=2):
+        self.count = count
+        self.searches = 0
+
+    def get(self, endpoint, **kwargs):
+        return {'name': 'docs', 'dimension': 2, 'vector_count': self.count}
+
+    def post(self, endpoint, data, **kwargs):
+        if endpoint.endswith('/search'):
+            self.searches += 1
+            return {'results': [{'id': 'remote', 'score': 1.0}]}
+        return {'inserted': len(data['vectors'])}
+
+CONTENTS = [{'id': 'a', 'values': [1.0, 0.0]}, {'id': 'b', 'values': [0.0, 1.0]}]
+
+def _replicated(client):
+    vector = VectorStoreCapabilities(client)
+    vector.index_cache_ttl = 0  # Let the bad write reach the server
+    assert vector.enable_replica('docs', CONTENTS, check_interval=0)['stale'] is False
+    return vector
+
+def test_replica_answers_searches_locally():
+    client = _FakeVectorClient()
+    vector = _replicated(client)
+    assert vector.search_vector('docs', [1.0, 0.0])[0]['id'] == 'a'
+    assert client.searches == 0
+
+def test_failed_mirror_write_marks_replica_stale_instead_of_raising():
+    client = _FakeVectorClient()
+    vector = _replicated(client)
+    # Replaces an existing ID, so the server count still matches the replica
+    result = vector.add_vectors('docs', [{'id': 'a', 'values': [1.0, 0.0, 0.0]}])
+    assert result['inserted'] == 1
+    assert vector.replica_stats('docs')['stale'] is True
+
+    assert vector.search_vector('docs', [1.0, 0.0])[0]['id'] == 'remote'
+    assert vector.replica_stats('docs')['stale'] is True
+
+    # Only reloading the contents puts the replica back in use
+    vector.sync_replica('docs')
+    assert vector.replica_stats('docs')['stale'] is True
+    vector.sync_replica('docs', CONTENTS)
+    assert vector.replica_stats('docs')['stale'] is False
@@ -0,0 +1,88 @@
+import logging
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from neuredge_sdk.capabilities.vector import _refine_matches
+from neuredge_sdk.vector.rerank import mmr, rerank_matches
+from neuredge_sdk.types import NeuredgeError
+
+QUERY = np.array([1.0, 0.0, 0.0], dtype=np.float32)
+
+# Two near-duplicates closest to the query, then a distinct, slightly less relevant vector
+CANDIDATES = np.array([
+    [0.95, 0.30, 0.0],
+    [0.94, 0.32, 0.0],
+    [0.90, 0.0, 0.40],
+    [0.10, 1.0, 0.0],
+], dtype=np.float32)
+
+def test_mmr_without_diversity_ranks_by_relevance():
+    assert list(mmr(QUERY, CANDIDATES, 4, diversity=0.0)) == [0, 1, 2, 3]
+
+def test_mmr_skips_near_duplicates():
+    assert list(mmr(QUERY, CANDIDATES, 2, diversity=0.5)) == [0, 2]
+
+def test_mmr_picks_each_candidate_once():
+    picked = mmr(QUERY, CANDIDATES, 10, diversity=0.9)
+    assert sorted(picked) == [0, 1, 2, 3]
+
+def test_mmr_rerank_keeps_original_scores():
+    matches = [{'id': str(i), 'score': 1.0 - i / 10, 'vector': v} for i, v in enumerate(CANDIDATES)]
+    reranked = rerank_matches(matches, QUERY, 2, {'method': 'mmr', 'diversity': 0.5})
+    assert [(m['id'], m['score']) for m in reranked] == [('0', 1.0), ('2', 0.8)]
+
+def test_exact_rerank_replaces_scores_and_reorders():
+    # Server scores out of order, as from an approximate index
+    matches = [
+        {'id': 'far', 'score': 0.99, 'vector': [0.0, 1.0, 0.0]},
+        {'id': 'near', 'score': 0.10, 'vector': [1.0, 0.1, 0.0]},
+    ]
+    reranked = rerank_matches(matches, QUERY, 2, {'method': 'exact'})
+    assert [m['id'] for m in reranked] == ['near', 'far']
+    assert reranked[0]['score'] == pytest.approx(1 / np.sqrt(1.01), rel=1e-5)
+
+def test_exact_rerank_euclidean_prefers_small_distances():
+    # Cosine favours the long aligned vector, euclidean the short nearby one
+    matches = [
+        {'id': 'long', 'score': 0.0, 'vector': [3.0, 0.0, 0.0]},
+        {'id': 'near', 'score': 0.0, 'vector': [0.9, 0.3, 0.0]},
+    ]
+    assert rerank_matches(matches, QUERY, 1, {'method': 'exact'})[0]['id'] == 'long'
+    assert rerank_matches(matches, QUERY, 1, {'method': 'exact', 'metric': 'euclidean'})[0]['id'] == 'near'
+
+def test_rerank_requires_vectors_and_known_method():
+    with pytest.raises(NeuredgeError):
+        rerank_matches([{'id': '1', 'score': 1.0}], QUERY, 1, {'method': 'exact'})
+    with pytest.raises(NeuredgeError):
+        rerank_matches([], QUERY, 1, {'method': 'bm25'})
+
+def test_refine_filters_then_trims_and_drops_helper_fields():
+    matches = [
+        {'id': '1', 'score': 0.9, 'metadata': {'lang': 'fr'}},
+        {'id': '2', 'score': 0.8, 'metadata': {'lang': 'en'}},
+        {'id': '3', 'score': 0.7, 'metadata': {'lang': 'en'}},
+        {'id': '4', 'score': 0.6, 'metadata': {'lang': 'en'}},
+    ]
+    refined = _refine_matches(matches, QUERY, {'top_k': 2, 'filter': {'lang': 'en'}})
+    assert refined == [{'id': '2', 'score': 0.8}, {'id': '3', 'score': 0.7}]
+
+def test_refine_refuses_to_drop_the_filter_when_server_returns_no_metadata():
+    matches = [{'id': '1', 'score': 0.9}, {'id': '2', 'score': 0.8}]
+    with pytest.raises(NeuredgeError) as info:
+        _refine_matches(matches, QUERY, {'top_k': 5, 'filter': {'tenant': 'a'}})
+    assert info.value.code == 'INVALID_RESPONSE'
+
+def test_refine_trusts_the_server_filter_when_asked(caplog):
+    matches = [{'id': '1', 'score': 0.9}, {'id': '2', 'score': 0.8}]
+    options = {'top_k': 5, 'filter': {'lang': 'en'}, 'trust_server_filter': True}
+    with caplog.at_level(logging.WARNING, logger='neuredge_sdk.capabilities.vector'):
+        refined = _refine_matches(matches, QUERY, options)
+    assert [m['id'] for m in refined] == ['1', '2']
+    assert 'no metadata' in caplog.text
+
+def test_refine_filters_matches_without_metadata_when_others_have_it():
+    matches = [{'id': '1', 'score': 0.9}, {'id': '2', 'score': 0.8, 'metadata': {'lang': 'en'}}]
+    refined = _refine_matches(matches, QUERY, {'top_k': 5, 'filter': {'lang': 'en'}, 'return_metadata': True})
+    assert refined == [{'id': '2', 'score': 0.8, 'metadata': {'lang': 'en'}}]
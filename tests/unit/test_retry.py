@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from neuredge_sdk.client import NeuredgeClient, _error_from_response
+from neuredge_sdk.retry import RetryPolicy, parse_retry_after
+from neuredge_sdk.types import NeuredgeError
+
+def _error(status, code='REQUEST_FAILED', retry_after=None):
+    return NeuredgeError('failed', code, status, retry_after=retry_after)
+
+@pytest.mark.parametrize('attempt', range(6))
+def test_full_jitter_stays_within_the_backoff_cap(attempt):
+    policy = RetryPolicy(initial_delay=0.5, max_delay=4.0)
+    cap = min(4.0, 0.5 * 2 ** attempt)
+    delays = [policy.get_delay(attempt) for _ in range(200)]
+    assert all(0 <= delay <= cap for delay in delays)
+    # Jitter spreads the delays rather than sleeping the cap every time
+    assert len(set(delays)) > 1
+
+def test_without_jitter_the_cap_is_used():
+    policy = RetryPolicy(initial_delay=0.5, max_delay=4.0, jitter=False)
+    assert [policy.get_delay(attempt) for attempt in range(5)] == [0.5, 1.0, 2.0, 4.0, 4.0]
+
+def test_retry_after_seconds_take_precedence():
+    assert parse_retry_after('7') == 7.0
+    assert parse_retry_after('-3') == 0.0
+    policy = RetryPolicy(max_delay=30.0)
+    assert policy.get_delay(0, _error(503, retry_after=7.0)) == 7.0
+    assert policy.get_delay(0, _error(503, retry_after=120.0)) == 30.0
+
+def test_retry_after_http_date_is_converted_to_seconds():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=20)
+    delay = parse_retry_after(format_datetime(retry_at, usegmt=True))
+    assert 18 <= delay <= 20
+    past = datetime.now(timezone.utc) - timedelta(seconds=20)
+    assert parse_retry_after(format_datetime(past, usegmt=True)) == 0.0
+
+@pytest.mark.parametrize('value', [None, '', 'soon', 'Mon, 99 Foo 2020'])
+def test_malformed_retry_after_is_ignored(value):
+    assert parse_retry_after(value) is None
+
+def test_retry_after_header_reaches_the_error():
+    error = _error_from_response(429, {'error': {'message': 'slow down', 'type': 'rate_limited'}}, {'Retry-After': '3'})
+    assert error.retry_after == 3.0
+    assert RetryPolicy().get_delay(0, error) == 3.0
+
+def test_retry_after_can_be_ignored():
+    policy = RetryPolicy(initial_delay=1.0, jitter=False, respect_retry_after=False)
+    assert policy.get_delay(0, _error(503, retry_after=20.0)) == 1.0
+
+@pytest.mark.parametrize('status', [500, 502, 504, 408])
+def test_server_failures_are_retried_only_when_idempotent(status):
+    policy = RetryPolicy()
+    assert policy.should_retry(_error(status), idempotent=True)
+    assert not policy.should_retry(_error(status), idempotent=False)
+
+@pytest.mark.parametrize('code', ['NETWORK_ERROR', 'TIMEOUT'])
+def test_transport_errors_are_retried_only_when_idempotent(code):
+    policy = RetryPolicy()
+    assert policy.should_retry(_error(408, code), idempotent=True)
+    assert not policy.should_retry(_error(408, code), idempotent=False)
+
+@pytest.mark.parametrize('status', [429, 503])
+def test_refused_requests_are_retried_even_when_not_idempotent(status):
+    assert RetryPolicy().should_retry(_error(status), idempotent=False)
+
+@pytest.mark.parametrize('status', [400, 401, 403, 404, 409, 413, 422])
+@pytest.mark.parametrize('idempotent', [True, False])
+def test_client_errors_are_never_retried(status, idempotent):
+    assert not RetryPolicy().should_retry(_error(status), idempotent)
+
+@pytest.mark.parametrize('code', ['AUTHENTICATION_ERROR', 'QUOTA_EXCEEDED'])
+def test_non_retryable_codes_win_over_status(code):
+    assert not RetryPolicy().should_retry(_error(503, code))
+
+class _FakeResponse:
+    def __init__(self, status, body):
+        self.status_code = status
+        self.ok = status < 400
+        self.headers = {'Content-Type': 'application/json'}
+        self._body = body
+
+    def json(self):
+        return self._body
+
+class _FakeSession:
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.calls = 0
+
+    def post(self, url, **kwargs):
+        self.calls += 1
+        status = self.statuses.pop(0)
+        return _FakeResponse(status, {'ok': True} if status < 400 else {'error': {'message': 'failed'}})
+
+def _client(statuses):
+    client = NeuredgeClient('key', retry_policy=RetryPolicy(max_retries=3, initial_delay=0, jitter=False))
+    client._session = _FakeSession(statuses)
+    return client
+
+def test_client_retries_idempotent_posts():
+    client = _client([500, 502, 200])
+    assert client.post('/x', {}) == {'ok': True}
+    assert client._session.calls == 3
+
+def test_client_sends_non_idempotent_posts_once_on_server_error():
+    client = _client([500, 200])
+    with pytest.raises(NeuredgeError) as info:
+        client.post('/x', {}, idempotent=False)
+    assert info.value.status_code == 500
+    assert client._session.calls == 1
+
+def test_client_does_not_retry_client_errors():
+    client = _client([400, 200])
+    with pytest.raises(NeuredgeError):
+        client.post('/x', {})
+    assert client._session.calls == 1
@@ -0,0 +1,94 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from neuredge_sdk.capabilities.vector import VectorStoreCapabilities, AsyncVectorStoreCapabilities
+from neuredge_sdk.types import NeuredgeError
+
+class _FakeSearchClient:
+    """
+    Answers a search for [n, 0] with one match 'n'; higher n answers
+    sooner, so requests complete out of order. Queries for [-1, 0] fail.
+    """
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+        self.bodies = []
+        self._lock = threading.Lock()
+
+    def _start(self):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+
+    def _finish(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def _answer(self, data):
+        self.bodies.append(data)
+        n = int(data['vector'][0])
+        if n < 0:
+            raise NeuredgeError('Search failed', 'SERVICE_UNAVAILABLE', 503)
+        return {'results': [{'id': str(n), 'score': 1.0}]}
+
+    def post(self, endpoint, data, **kwargs):
+        self._start()
+        try:
+            time.sleep(0.05 / (1 + data['vector'][0] % 4))
+            return self._answer(data)
+        finally:
+            self._finish()
+
+class _AsyncFakeSearchClient(_FakeSearchClient):
+    async def post(self, endpoint, data, **kwargs):
+        self._start()
+        try:
+            await asyncio.sleep(0.05 / (1 + data['vector'][0] % 4))
+            return self._answer(data)
+        finally:
+            self._finish()
+
+QUERIES = [[float(n), 0.0] for n in range(12)]
+
+def _ids(results):
+    return [item['result'][0]['id'] for item in results]
+
+def test_results_keep_query_order():
+    results = VectorStoreCapabilities(_FakeSearchClient()).search_vectors('docs', QUERIES, concurrency=4)
+    assert [item['index'] for item in results] == list(range(12))
+    assert _ids(results) == [str(n) for n in range(12)]
+
+def test_concurrency_bounds_requests_in_flight():
+    client = _FakeSearchClient()
+    VectorStoreCapabilities(client).search_vectors('docs', QUERIES, concurrency=3)
+    assert 1 < client.peak <= 3
+
+def test_failed_queries_carry_their_error():
+    queries = [[0.0, 0.0], [-1.0, 0.0], [2.0, 0.0]]
+    results = VectorStoreCapabilities(_FakeSearchClient()).search_vectors('docs', queries)
+    assert results[0]['result'][0]['id'] == '0' and results[0]['error'] is None
+    assert results[1]['result'] is None
+    assert results[1]['error'].code == 'SERVICE_UNAVAILABLE'
+    assert results[2]['result'][0]['id'] == '2'
+
+def test_top_k_is_passed_to_every_query():
+    client = _FakeSearchClient()
+    VectorStoreCapabilities(client).search_vectors('docs', QUERIES[:3], top_k=7)
+    assert [body['limit'] for body in client.bodies] == [7, 7, 7]
+
+@pytest.mark.parametrize('concurrency', [0, -1])
+def test_invalid_concurrency_is_rejected(concurrency):
+    with pytest.raises(NeuredgeError):
+        VectorStoreCapabilities(_FakeSearchClient()).search_vectors('docs', QUERIES, concurrency=concurrency)
+
+def test_async_results_keep_order_within_the_concurrency_bound():
+    client = _AsyncFakeSearchClient()
+    queries = QUERIES + [[-1.0, 0.0]]
+    results = asyncio.run(AsyncVectorStoreCapabilities(client).search_vectors('docs', queries, concurrency=3))
+    assert _ids(results[:12]) == [str(n) for n in range(12)]
+    assert results[12]['error'].code == 'SERVICE_UNAVAILABLE'
+    assert 1 < client.peak <= 3
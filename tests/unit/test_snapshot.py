@@ -0,0 +1,172 @@
+import json
+import os
+import struct
+
+import pytest
+
+from neuredge_sdk.capabilities.vector import VectorStoreCapabilities
+from neuredge_sdk.snapshot import (
+    SnapshotWriter, SnapshotReader, ImportCheckpoint, VECTORS_FILE, RECORDS_FILE
+)
+from neuredge_sdk.types import NeuredgeError
+
+INDEX = {'name': 'docs', 'dimension': 2, 'metric': 'cosine'}
+
+def _vectors(count):
+    return [{'id': f'v{i}', 'values': [float(i), float(-i)], 'metadata': {'n': i}} for i in range(count)]
+
+def _read_all(path):
+    return [vector for _, batch in SnapshotReader(path).batches(100) for vector in batch]
+
+class _FakeVectorClient:
+    """Knows every index and fails uploads containing any ID in `fail_ids`"""
+
+    def __init__(self):
+        self.fail_ids = set()
+        self.uploaded = []
+
+    def get_base_url(self):
+        return 'https://api.neuredge.dev'
+
+    def get(self, endpoint, **kwargs):
+        return {'name': endpoint.rsplit('/', 1)[-1], 'dimension': 2, 'vector_count': 0}
+
+    def post(self, endpoint, data, **kwargs):
+        ids = [v['id'] for v in data['vectors']]
+        if self.fail_ids & set(ids):
+            raise NeuredgeError('Service unavailable', 'SERVICE_UNAVAILABLE', 503)
+        self.uploaded.extend(ids)
+        return {'inserted': len(ids)}
+
+def test_resumed_writer_drops_rows_after_last_checkpoint(tmp_path):
+    path = str(tmp_path)
+    writer = SnapshotWriter(path, INDEX)
+    writer.write(_vectors(3))
+    writer.checkpoint()
+    writer.write(_vectors(5)[3:])
+    writer.abort()
+
+    writer = SnapshotWriter(path, INDEX, resume=True)
+    assert writer.count == 3
+    assert os.path.getsize(os.path.join(path, VECTORS_FILE)) == 3 * 2 * 4
+    with open(os.path.join(path, RECORDS_FILE)) as f:
+        assert [json.loads(line)['id'] for line in f] == ['v0', 'v1', 'v2']
+
+    writer.write(_vectors(4)[3:])
+    manifest = writer.close()
+    assert (manifest['count'], manifest['complete']) == (4, True)
+    vectors = _read_all(path)
+    assert [v['id'] for v in vectors] == ['v0', 'v1', 'v2', 'v3']
+    assert bytes(vectors[3]['values']) == struct.pack('<2f', 3.0, -3.0)
+    assert vectors[3]['metadata'] == {'n': 3}
+
+def test_writer_without_resume_starts_over(tmp_path):
+    path = str(tmp_path)
+    writer = SnapshotWriter(path, INDEX)
+    writer.write(_vectors(3))
+    writer.close()
+    writer = SnapshotWriter(path, INDEX)
+    assert writer.count == 0
+    writer.close()
+    assert _read_all(path) == []
+
+def test_resume_rejects_a_different_dimension(tmp_path):
+    SnapshotWriter(str(tmp_path), INDEX).close()
+    with pytest.raises(NeuredgeError):
+        SnapshotWriter(str(tmp_path), {**INDEX, 'dimension': 3}, resume=True)
+
+def test_checkpoint_watermark_absorbs_out_of_order_batches(tmp_path):
+    SnapshotWriter(str(tmp_path), INDEX).close()
+    checkpoint = ImportCheckpoint(str(tmp_path), 'docs', batch_size=10)
+    for number in (2, 4, 1):
+        checkpoint.mark(number)
+    assert checkpoint.done() == {1, 2, 4}
+    checkpoint.mark(0)
+    assert checkpoint.done() == {0, 1, 2, 4}
+    checkpoint.save(force=True)
+
+    with open(os.path.join(str(tmp_path), 'import-docs.checkpoint.json')) as f:
+        state = json.load(f)
+    assert (state['batch_size'], state['watermark'], state['done']) == (10, 3, [4])
+    assert state['target'] == {'index': 'docs', 'base_url': None}
+
+    # A resumed checkpoint keeps its original batch size
+    resumed = ImportCheckpoint(str(tmp_path), 'docs', batch_size=50)
+    assert (resumed.batch_size, resumed.done()) == (10, {0, 1, 2, 4})
+    assert ImportCheckpoint(str(tmp_path), 'docs', batch_size=50, resume=False).done() == set()
+
+    resumed.clear()
+    assert not os.path.exists(os.path.join(str(tmp_path), 'import-docs.checkpoint.json'))
+
+def test_checkpoint_starts_over_for_a_changed_snapshot(tmp_path):
+    path = str(tmp_path)
+    writer = SnapshotWriter(path, INDEX)
+    writer.write(_vectors(4))
+    writer.close()
+    checkpoint = ImportCheckpoint(path, 'docs', batch_size=2)
+    checkpoint.mark(0)
+    checkpoint.save(force=True)
+    assert ImportCheckpoint(path, 'docs', batch_size=2).done() == {0}
+
+    # The snapshot is re-exported with different contents in place
+    writer = SnapshotWriter(path, INDEX)
+    writer.write(_vectors(6))
+    writer.close()
+    resumed = ImportCheckpoint(path, 'docs', batch_size=3)
+    assert (resumed.batch_size, resumed.done()) == (3, set())
+
+def test_checkpoint_starts_over_for_a_different_api(tmp_path):
+    path = str(tmp_path)
+    SnapshotWriter(path, INDEX).close()
+    checkpoint = ImportCheckpoint(path, 'docs', batch_size=2, base_url='https://a.example')
+    checkpoint.mark(0)
+    checkpoint.save(force=True)
+    assert ImportCheckpoint(path, 'docs', batch_size=2, base_url='https://a.example').done() == {0}
+    assert ImportCheckpoint(path, 'docs', batch_size=2, base_url='https://b.example').done() == set()
+
+def test_export_resumes_after_an_interrupted_source(tmp_path):
+    path = str(tmp_path)
+    vector = VectorStoreCapabilities(_FakeVectorClient())
+
+    def interrupted():
+        yield from _vectors(5)
+        raise RuntimeError('source went away')
+
+    with pytest.raises(RuntimeError):
+        vector.export_index('docs', path, interrupted(), checkpoint_every=2)
+    # Rows 0-3 were checkpointed; row 4 is dropped on resume
+    manifest = vector.export_index('docs', path, _vectors(7), resume=True, checkpoint_every=2)
+    assert (manifest['count'], manifest['complete']) == (7, True)
+    assert [v['id'] for v in _read_all(path)] == [f'v{i}' for i in range(7)]
+
+def test_import_resumes_with_unfinished_batches(tmp_path):
+    path = str(tmp_path)
+    client = _FakeVectorClient()
+    vector = VectorStoreCapabilities(client)
+    vector.export_index('src', path, _vectors(10))
+
+    # Batches: [v0-v2], [v3-v5], [v6-v8], [v9]; the second fails every attempt
+    client.fail_ids = {'v4'}
+    stats = vector.import_index('dst', path, batch_size=3, concurrency=1, max_batch_retries=0)
+    assert stats['inserted'] == 7
+    assert stats['failed_ids'] == ['v3', 'v4', 'v5']
+    assert stats['skipped'] == 0
+    assert os.path.exists(os.path.join(path, 'import-dst.checkpoint.json'))
+
+    # A different batch size is ignored in favour of the checkpoint's
+    client.fail_ids = set()
+    client.uploaded = []
+    stats = vector.import_index('dst', path, batch_size=4, concurrency=2, max_batch_retries=0)
+    assert sorted(client.uploaded) == ['v3', 'v4', 'v5']
+    assert (stats['inserted'], stats['failed'], stats['skipped']) == (3, 0, 7)
+    assert not os.path.exists(os.path.join(path, 'import-dst.checkpoint.json'))
+
+def test_import_rejects_incomplete_snapshot(tmp_path):
+    writer = SnapshotWriter(str(tmp_path), INDEX)
+    writer.write(_vectors(2))
+    writer.checkpoint()
+    writer.abort()
+    vector = VectorStoreCapabilities(_FakeVectorClient())
+    with pytest.raises(NeuredgeError) as info:
+        vector.import_index('dst', str(tmp_path))
+    assert info.value.code == 'INVALID_REQUEST'
@@ -0,0 +1,59 @@
+import logging
+import threading
+
+from neuredge_sdk.capabilities.text import TextCapabilities, _reduce_inputs
+
+class _NonShrinkingClient:
+    """Returns each input unchanged as its own summary, recording request sizes"""
+
+    def __init__(self):
+        self.sizes = []
+        self._lock = threading.Lock()
+
+    def post(self, endpoint, data, **kwargs):
+        text = data['text']
+        with self._lock:
+            self.sizes.append(len(text))
+        return {'result': {
+            'summary': text,
+            'metadata': {
+                'original_length': len(text),
+                'summary_length': len(text),
+                'compression_ratio': 1.0,
+            },
+        }}
+
+def _sentences(count, length):
+    return ' '.join(('word ' * (length // 5)).strip() + '.' for _ in range(count))
+
+def test_reduce_inputs_respects_chunk_size_when_not_shrinking():
+    summaries = ['x' * 450 for _ in range(10)]
+    chunks = _reduce_inputs(summaries, 500)
+    assert len(chunks) < len(summaries)
+    assert max(len(c) for c in chunks) <= 500
+
+def test_reduce_inputs_packs_short_summaries():
+    summaries = ['short summary.' for _ in range(10)]
+    chunks = _reduce_inputs(summaries, 500)
+    assert len(chunks) == 1
+    assert max(len(c) for c in chunks) <= 500
+
+def test_reduce_inputs_warns_when_truncating(caplog):
+    summaries = ['x' * 450 for _ in range(4)]
+    with caplog.at_level(logging.WARNING, logger='neuredge_sdk.capabilities.text'):
+        _reduce_inputs(summaries, 500)
+    # Each summary is cut to (500 - 2) // 2 = 249 characters
+    assert 'dropping 804 characters' in caplog.text
+
+def test_reduce_inputs_packing_does_not_warn(caplog):
+    with caplog.at_level(logging.WARNING, logger='neuredge_sdk.capabilities.text'):
+        _reduce_inputs(['short summary.' for _ in range(10)], 500)
+    assert not caplog.records
+
+def test_summarize_long_never_exceeds_chunk_size():
+    client = _NonShrinkingClient()
+    text = '\n\n'.join(_sentences(3, 150) for _ in range(20))
+    result = TextCapabilities(client).summarize_long(text, chunk_size=500, concurrency=4)
+    assert max(client.sizes) <= 500
+    assert len(result['summary']) <= 500
+    assert result['levels'][-1]['chunks'] == 1
@@ -0,0 +1,63 @@
+import logging
+import time
+
+from neuredge_sdk.capabilities.vector import VectorStoreCapabilities
+
+class _FakeVectorClient:
+    """Index whose count grows by `growth` per write, as when the rest replace existing IDs"""
+
+    def __init__(self, count=10, growth=0):
+        self.count = count
+        self.growth = growth
+        self.gets = 0
+
+    def get(self, endpoint, **kwargs):
+        self.gets += 1
+        return {'name': 'docs', 'dimension': 2, 'vector_count': self.count}
+
+    def post(self, endpoint, data, **kwargs):
+        self.count += self.growth
+        return {'inserted': len(data['vectors']), 'ids': [v['id'] for v in data['vectors']]}
+
+VECTORS = [{'id': '1', 'values': [0.1, 0.2]}, {'id': '2', 'values': [0.3, 0.4]}]
+
+def test_partial_upsert_stops_once_count_settles():
+    vector = VectorStoreCapabilities(_FakeVectorClient(growth=1))
+    start = time.monotonic()
+    vector.add_vectors('docs', VECTORS, {
+        'consistency': {'enabled': True, 'timeout': 10, 'settle': 0.2}
+    })
+    assert time.monotonic() - start < 2
+
+def test_flat_count_does_not_settle(caplog):
+    # Indexing slower than the settle window: the count stays at its pre-write value
+    vector = VectorStoreCapabilities(_FakeVectorClient())
+    start = time.monotonic()
+    with caplog.at_level(logging.WARNING, logger='neuredge_sdk.capabilities.vector'):
+        vector.add_vectors('docs', VECTORS, {
+            'consistency': {'enabled': True, 'timeout': 0.8, 'settle': 0.1}
+        })
+    assert time.monotonic() - start >= 0.7
+    assert 'did not reach 12 vectors' in caplog.text
+
+def test_settle_is_opt_in():
+    vector = VectorStoreCapabilities(_FakeVectorClient(growth=1))
+    start = time.monotonic()
+    vector.add_vectors('docs', VECTORS, {'consistency': {'enabled': True, 'timeout': 0.6}})
+    assert time.monotonic() - start >= 0.5
+
+def test_wait_returns_as_soon_as_target_is_reached():
+    client = _FakeVectorClient(count=12)
+    vector = VectorStoreCapabilities(client)
+    index = vector.wait_until_indexed('docs', 12, timeout=5)
+    assert index['vector_count'] == 12
+    assert client.gets == 1
+
+def test_consistency_timeout_is_logged(caplog):
+    vector = VectorStoreCapabilities(_FakeVectorClient())
+    with caplog.at_level(logging.WARNING, logger='neuredge_sdk.capabilities.vector'):
+        result = vector.add_vectors('docs', VECTORS, {
+            'consistency': {'enabled': True, 'timeout': 0.2}
+        })
+    assert result['inserted'] == 2
+    assert 'did not reach 12 vectors' in caplog.text
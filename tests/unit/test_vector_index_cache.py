@@ -0,0 +1,118 @@
+import time
+
+import pytest
+
+from neuredge_sdk.capabilities.vector import VectorStoreCapabilities
+from neuredge_sdk.types import NeuredgeError
+
+class _FakeVectorClient:
+    """One index whose count grows by the number of vectors posted"""
+
+    def __init__(self):
+        self.count = 0
+        self.calls = []
+        self.missing = False
+
+    def get(self, endpoint, **kwargs):
+        self.calls.append('get')
+        return {'name': 'docs', 'dimension': 2, 'vector_count': self.count}
+
+    def post(self, endpoint, data, **kwargs):
+        self.calls.append('post')
+        if self.missing:
+            raise NeuredgeError('Index not found', 'INDEX_NOT_FOUND', 404)
+        self.count += len(data['vectors'])
+        return {'inserted': len(data['vectors'])}
+
+    def delete(self, endpoint, data=None, **kwargs):
+        self.calls.append('delete')
+        self.count -= len(data['ids'])
+
+def _vectors(*ids, dimension=2):
+    return [{'id': i, 'values': [0.1] * dimension} for i in ids]
+
+def test_get_index_reuses_a_fresh_count():
+    client = _FakeVectorClient()
+    vector = VectorStoreCapabilities(client)
+    vector.get_index('docs')
+    assert vector.get_index('docs')['vector_count'] == 0
+    assert client.calls == ['get']
+
+def test_cached_count_expires_after_the_ttl():
+    client = _FakeVectorClient()
+    vector = VectorStoreCapabilities(client)
+    vector.index_cache_ttl = 0.05
+    vector.get_index('docs')
+    client.count = 3
+    time.sleep(0.06)
+    assert vector.get_index('docs')['vector_count'] == 3
+    assert client.calls == ['get', 'get']
+
+@pytest.mark.parametrize('write', [
+    lambda vector: vector.add_vectors('docs', _vectors('1')),
+    lambda vector: vector.delete_vectors('docs', ['1']),
+])
+def test_writes_drop_the_cached_count(write):
+    client = _FakeVectorClient()
+    vector = VectorStoreCapabilities(client)
+    vector.get_index('docs')
+    write(vector)
+    assert vector.get_index('docs')['vector_count'] == client.count
+    assert client.calls[-1] == 'get'
+
+def test_first_write_fills_the_cache_for_dimension_checks():
+    client = _FakeVectorClient()
+    vector = VectorStoreCapabilities(client)
+    vector.index_cache_ttl = 0.01
+    vector.add_vectors('docs', _vectors('1'))
+    # Well past the TTL: the dimension does not expire with the count
+    time.sleep(0.02)
+    with pytest.raises(NeuredgeError) as info:
+        vector.add_vectors('docs', _vectors('2', dimension=3))
+    assert info.value.code == 'INVALID_REQUEST'
+    assert client.calls == ['post']
+
+def test_dimension_mismatch_rejected_after_get_index():
+    client = _FakeVectorClient()
+    vector = VectorStoreCapabilities(client)
+    vector.get_index('docs')
+    with pytest.raises(NeuredgeError):
+        vector.add_vectors('docs', _vectors('1', dimension=3))
+    assert client.calls == ['get']
+
+def test_consecutive_consistent_writes_skip_the_count_lookup():
+    client = _FakeVectorClient()
+    vector = VectorStoreCapabilities(client)
+    options = {'consistency': {'enabled': True, 'timeout': 5}}
+    vector.add_vectors('docs', _vectors('1', '2'), options)
+    assert client.calls == ['get', 'post', 'get']
+    # The final poll read the count, so the next write needs no lookup
+    vector.add_vectors('docs', _vectors('3'), options)
+    assert client.calls[3:] == ['post', 'get']
+    assert vector.get_index('docs')['vector_count'] == 3
+
+def test_missing_index_is_forgotten():
+    client = _FakeVectorClient()
+    vector = VectorStoreCapabilities(client)
+    vector.get_index('docs')
+    client.missing = True
+    with pytest.raises(NeuredgeError):
+        vector.add_vectors('docs', _vectors('1'))
+    assert vector._cached_index('docs') is None
+
+def test_zero_ttl_disables_the_cache():
+    client = _FakeVectorClient()
+    vector = VectorStoreCapabilities(client)
+    vector.index_cache_ttl = 0
+    vector.add_vectors('docs', _vectors('1'))
+    vector.get_index('docs')
+    vector.get_index('docs')
+    assert client.calls == ['post', 'get', 'get']
+    assert vector._cached_index('docs') is None
+
+def test_consistency_timeout_drops_the_polled_count():
+    client = _FakeVectorClient()
+    client.post = lambda endpoint, data, **kwargs: {'inserted': len(data['vectors'])}
+    vector = VectorStoreCapabilities(client)
+    vector.add_vectors('docs', _vectors('1'), {'consistency': {'enabled': True, 'timeout': 0.1}})
+    assert vector._cached_count('docs') is None